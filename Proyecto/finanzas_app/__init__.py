@@ -1,3 +1,4 @@
+from .cache import ReportCache, report_cache
 from .config import DBConfig
 from .db.connection import DatabaseConnection
 from .models import (
@@ -11,11 +12,31 @@ from .repositories import (
     TransaccionRepository,
     PresupuestoEspecificoRepository,
     ImpuestoAnualRepository,
+    ResumenMensualRepository,
     FinancialReportRepository,
 )
-from .gui import TransactionApp
+
+
+def __getattr__(name: str):
+    # La GUI se importa bajo demanda: los comandos `python -m finanzas_app.*`
+    # no deben cargar Tkinter ni las librerías de gráficos. El paquete `gui/`
+    # sustituye al antiguo `gui.py`, por lo que `TransactionApp` apunta a la app actual.
+    if name == "TransactionApp":
+        from .gui.app import FinanceApp
+
+        return FinanceApp
+    # La variante asyncio también se carga al pedirla: importar asyncio cuesta más
+    # que el resto del paquete y la GUI no lo necesita para mostrar la ventana.
+    if name == "AsyncFinancialReportRepository":
+        from .async_repositories import AsyncFinancialReportRepository
+
+        return AsyncFinancialReportRepository
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
+    "ReportCache",
+    "report_cache",
     "DBConfig",
     "DatabaseConnection",
     "Categoria",
@@ -26,6 +47,8 @@ __all__ = [
     "TransaccionRepository",
     "PresupuestoEspecificoRepository",
     "ImpuestoAnualRepository",
+    "ResumenMensualRepository",
     "FinancialReportRepository",
+    "AsyncFinancialReportRepository",
     "TransactionApp",
 ]
@@ -0,0 +1,119 @@
+"""Variante asyncio de `FinancialReportRepository` para lanzar consultas en paralelo.
+
+Cada método de reporte se ejecuta en un hilo de un executor compartido por
+conexión, con tantos hilos como conexiones tiene el pool; así cada consulta
+usa su propia conexión y un reporte compuesto tarda lo que su consulta más
+lenta en lugar de la suma de todas. Los resultados siguen pasando por
+`report_cache`.
+
+    repo = AsyncFinancialReportRepository(connection)
+    gastos = await repo.expenses_by_category(2024, 5)
+    datos = await repo.gather_report(2024, 5)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from .db.connection import DatabaseConnection
+from .repositories import FinancialReportRepository
+
+_executors: Dict[Hashable, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _executor_for(connection: DatabaseConnection) -> ThreadPoolExecutor:
+    """Executor compartido por todas las instancias de una misma base, acotado al tamaño del pool."""
+    key = connection.cache_key
+    with _executors_lock:
+        if key not in _executors:
+            pool_size = key[5]
+            _executors[key] = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="finanzas-async")
+        return _executors[key]
+
+
+class AsyncFinancialReportRepository:
+    """Expone como corrutinas los métodos públicos de `FinancialReportRepository`."""
+
+    def __init__(
+        self,
+        connection: Optional[DatabaseConnection] = None,
+        repo: Optional[FinancialReportRepository] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> None:
+        self._repo = repo or FinancialReportRepository(connection or DatabaseConnection())
+        self._executor = executor or _executor_for(self._repo.connection)
+
+    async def _run(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        method = getattr(self._repo, name)
+        if name.startswith("_") or not callable(method):
+            raise AttributeError(f"{type(self).__name__!r} no expone {name!r}")
+
+        @functools.wraps(method)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self._run(method, *args, **kwargs)
+
+        return call
+
+    async def gather_calls(self, calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """Lanza a la vez las llamadas sin argumentos de `calls` y devuelve sus resultados por nombre."""
+        results = await asyncio.gather(*(self._run(call) for call in calls.values()))
+        return dict(zip(calls, results))
+
+    async def gather_report(self, year: int, month: Optional[int] = None) -> Dict[str, Any]:
+        """Consultas de un reporte mensual (o del anual sin `month`) ejecutadas en paralelo.
+
+        Con mes, las claves coinciden con los campos de `reports.MonthlyReportData`;
+        sin mes, el resultado es el mismo diccionario que `annual_report`.
+        """
+        if month is None:
+            return await self.annual_report(year)
+        repo = self._repo
+        return await self.gather_calls({
+            "total_expenses": lambda: repo.total_expenses(year, month),
+            "total_incomes": lambda: repo.total_incomes(year, month),
+            "expenses_by_category": lambda: repo.expenses_by_category(year, month),
+            "incomes_by_category": lambda: repo.incomes_by_category_for_month(year, month),
+            "budgets": lambda: repo.budget_by_category_for_month(year, month),
+            "daily_expenses": lambda: repo.daily_totals_by_type(year, month, "gasto"),
+            "daily_incomes": lambda: repo.daily_totals_by_type(year, month, "ingreso"),
+            "weekly_heatmap": lambda: repo.weekly_expense_heatmap(year, month),
+        })
+
+    async def annual_report(self, anio: int) -> Dict[str, Any]:
+        """Igual que `FinancialReportRepository.annual_report`, con las consultas en paralelo."""
+        repo = self._repo
+        results = await self.gather_calls({
+            "savings": lambda: repo.monthly_savings(year=anio),
+            "budgets": lambda: repo.get_budget_by_category(year=anio),
+            "fijos": lambda: repo.monthly_fixed_expenses(year=anio),
+            "variables": lambda: repo.variable_expenses(year=anio),
+            "anuales": lambda: repo.annual_expenses(year=anio),
+            "monthly": lambda: repo.monthly_incomes(year=anio),
+            "category": lambda: repo.incomes_by_category(year=anio),
+            "annual": repo.annual_incomes,
+        })
+        return {
+            "savings": results["savings"],
+            "budgets": {
+                "category": results["budgets"],
+            },
+            "expenses": {
+                "fijos": results["fijos"],
+                "variables": results["variables"],
+                "anuales": results["anuales"],
+            },
+            "incomes": {
+                "monthly": results["monthly"],
+                "category": results["category"],
+                "annual": results["annual"],
+            },
+        }
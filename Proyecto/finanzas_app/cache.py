@@ -0,0 +1,143 @@
+"""Caché LRU con expiración para los reportes de `FinancialReportRepository`."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from .events import DataChanged, Period, data_events
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    period: Period
+    expires_at: float
+
+
+class ReportCache:
+    """Guarda resultados por (conexión, método, argumentos) con desalojo LRU y TTL.
+
+    Cada entrada recuerda el periodo (año, mes) que consultó para que las
+    escrituras invaliden sólo los reportes afectados.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry.value
+
+    def set(self, key: Hashable, value: Any, period: Period = (None, None)) -> None:
+        with self._lock:
+            self._entries[key] = _CacheEntry(value, period, time.monotonic() + self._ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_period(self, year: Optional[int], month: Optional[int] = None) -> int:
+        """Descarta las entradas que pueden incluir el periodo modificado.
+
+        Sin año se vacía todo. Los reportes sin año (históricos) siempre se descartan,
+        y los anuales se descartan ante cualquier cambio dentro de su año.
+        """
+        with self._lock:
+            if year is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                stale = [
+                    key
+                    for key, entry in self._entries.items()
+                    if _overlaps(entry.period, year, month)
+                ]
+                for key in stale:
+                    del self._entries[key]
+                removed = len(stale)
+            self.invalidations += removed
+            return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores para comprobar cuántas lecturas se resolvieron sin ir a la base."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
+
+
+def _overlaps(period: Period, year: int, month: Optional[int]) -> bool:
+    entry_year, entry_month = period
+    if entry_year is None:
+        return True
+    if entry_year != year:
+        return False
+    return entry_month is None or month is None or entry_month == month
+
+
+report_cache = ReportCache()
+
+
+def _invalidate_changed_periods(event: DataChanged) -> None:
+    for year, month in event.periods:
+        report_cache.invalidate_period(year, month)
+
+
+# Ningún reporte en caché lee `impuesto_anual`.
+data_events.subscribe(_invalidate_changed_periods, ("transaccion", "presupuesto", "categoria", "resumen_mensual"))
+
+
+def cached_report(method: F) -> F:
+    """Decora un método de reporte para servirlo desde `report_cache`.
+
+    El periodo de la entrada se toma de los argumentos `year`/`anio` y `month`.
+    Cada llamada recibe una copia superficial de la lista; las filas se comparten
+    entre llamadas y no deben mutarse.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = {name: value for name, value in bound.arguments.items() if name != "self"}
+        key = (self._connection.cache_key, method.__name__, tuple(sorted(arguments.items())))
+        hit, value = report_cache.get(key)
+        if not hit:
+            value = method(self, *args, **kwargs)
+            year = arguments.get("year", arguments.get("anio"))
+            report_cache.set(key, value, (year, arguments.get("month")))
+        return list(value) if isinstance(value, list) else value
+
+    return wrapper  # type: ignore[return-value]
@@ -8,7 +8,7 @@ def main() -> None:
     db = DatabaseConnection()
     version = db.test_connection()
     categorias = CategoriaRepository(db).list_all()
-    print(f"MySQL version: {version}")
+    print(f"Versión del motor: {version}")
     print(f"Categorias registradas: {len(categorias)}")
 
 
@@ -6,6 +6,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+MYSQL = "mysql"
+SQLITE = "sqlite"
+
 
 @dataclass(frozen=True)
 class DBConfig:
@@ -16,10 +19,25 @@ class DBConfig:
     database: str
     pool_name: str = "finanzas_pool"
     pool_size: int = 5
+    # El pool crece bajo carga hasta `pool_max_size` y espera `pool_timeout` segundos si se agota;
+    # cada conexión se renueva tras `pool_recycle` segundos.
+    pool_max_size: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: float = 3600.0
+    # "mysql" o "sqlite"; con SQLite `database` es la ruta del archivo y no se usan host ni usuario.
+    backend: str = MYSQL
 
     @staticmethod
     def from_json(path: Path) -> "DBConfig":
         data = json.loads(path.read_text(encoding="utf-8"))
+        pool = {
+            "pool_size": int(data.get("pool_size", 5)),
+            "pool_max_size": int(data.get("pool_max_size", 10)),
+            "pool_timeout": float(data.get("pool_timeout", 30.0)),
+            "pool_recycle": float(data.get("pool_recycle", 3600.0)),
+        }
+        if data.get("backend") == SQLITE:
+            return DBConfig.sqlite(data["database"], **pool)
         return DBConfig(
             host=data["host"],
             port=int(data.get("port", 3306)),
@@ -27,7 +45,21 @@ class DBConfig:
             password=data["password"],
             database=data["database"],
             pool_name=data.get("pool_name", "finanzas_pool"),
-            pool_size=int(data.get("pool_size", 5)),
+            **pool,
+        )
+
+    @staticmethod
+    def sqlite(path: str | Path, **pool: Any) -> "DBConfig":
+        """Configuración de una base SQLite embebida en `path` (`pool` admite los campos `pool_*`)."""
+        return DBConfig(
+            host="",
+            port=0,
+            user="",
+            password="",
+            database=str(path),
+            pool_name="finanzas_sqlite",
+            backend=SQLITE,
+            **pool,
         )
 
     @staticmethod
@@ -36,6 +68,17 @@ class DBConfig:
         if config_path:
             return DBConfig.from_json(Path(config_path))
 
+        pool = {
+            "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+            "pool_max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+            "pool_recycle": float(os.getenv("DB_POOL_RECYCLE", "3600")),
+        }
+        if os.getenv("DB_BACKEND") == SQLITE:
+            if "DB_DATABASE" not in os.environ:
+                raise RuntimeError("Faltan variables de entorno: DB_DATABASE")
+            return DBConfig.sqlite(os.environ["DB_DATABASE"], **pool)
+
         missing = [key for key in ("DB_USER", "DB_PASSWORD", "DB_DATABASE") if key not in os.environ]
         if missing:
             raise RuntimeError(f"Faltan variables de entorno: {', '.join(missing)}")
@@ -47,9 +90,16 @@ class DBConfig:
             password=os.environ["DB_PASSWORD"],
             database=os.environ["DB_DATABASE"],
             pool_name=os.getenv("DB_POOL_NAME", "finanzas_pool"),
-            pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+            **pool,
         )
 
+    @property
+    def name(self) -> str:
+        """Nombre corto de la base, apto para carpetas y archivos."""
+        if self.backend == SQLITE:
+            return Path(self.database).stem
+        return self.database
+
     def as_dict(self) -> Dict[str, Any]:
         return {
             "host": self.host,
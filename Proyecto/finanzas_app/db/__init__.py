@@ -1,3 +1,4 @@
 from .connection import DatabaseConnection
+from .periodos import period_bounds, period_filter
 
-__all__ = ["DatabaseConnection"]
+__all__ = ["DatabaseConnection", "period_bounds", "period_filter"]
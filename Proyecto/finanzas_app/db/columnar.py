@@ -0,0 +1,199 @@
+"""Carga columnar de transacciones directamente a columnas NumPy/pandas tipadas.
+
+En lugar de pedir diccionarios por fila y convertirlos después con
+`pd.DataFrame(filas)` + `astype(float)`, cada lote del cursor se vuelca a
+arreglos por columna: `Decimal` → `float64`, fechas → `datetime64[ns]` y los
+textos repetidos (categoría, tipo, periodicidad) → `category`. Sólo se piden
+las columnas indicadas y el período se filtra en SQL.
+
+No se reexporta desde `finanzas_app.db` para que importar el paquete no cargue pandas.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .connection import DatabaseConnection
+from .periodos import period_filter
+
+FLOAT = "float"
+INT = "int"
+DATETIME = "datetime"
+CATEGORY = "category"
+TEXT = "text"
+
+# Columna lógica -> (expresión SQL, tipo de destino)
+TRANSACTION_COLUMNS: Dict[str, Tuple[str, str]] = {
+    "id_transaccion": ("t.Id_Transaccion", INT),
+    "monto": ("t.monto", FLOAT),
+    "cantidad": ("t.cantidad", FLOAT),
+    "fecha": ("t.fecha", DATETIME),
+    "description": ("t.description", TEXT),
+    "categoria_id": ("c.Id_Categoria", INT),
+    "categoria": ("c.nombre", CATEGORY),
+    "tipo": ("c.tipo", CATEGORY),
+    "periodicidad": ("c.periodicidad", CATEGORY),
+}
+
+
+def _convert(values: Sequence[Any], kind: str) -> Any:
+    if kind == FLOAT:
+        return np.array(values, dtype=np.float64)
+    if kind == INT:
+        # Los enteros nulos pasan a float64 con NaN, como haría pandas.
+        if any(value is None for value in values):
+            return np.array(values, dtype=np.float64)
+        return np.array(values, dtype=np.int64)
+    if kind == DATETIME:
+        return np.array(values, dtype="datetime64[ns]")
+    if kind == CATEGORY:
+        return pd.Categorical(values)
+    return np.array(values, dtype=object)
+
+
+def frame_from_rows(
+    rows: Iterable[Mapping[str, Any]],
+    floats: Sequence[str] = (),
+    dates: Sequence[str] = (),
+    categories: Sequence[str] = (),
+) -> pd.DataFrame:
+    """DataFrame tipado a partir de filas-diccionario ya consultadas (p. ej. de `report_cache`).
+
+    Convierte cada columna una sola vez; las no mencionadas conservan la inferencia de pandas.
+    """
+    rows = list(rows)
+    kinds = {**{name: FLOAT for name in floats}, **{name: DATETIME for name in dates}}
+    kinds.update({name: CATEGORY for name in categories})
+    if not rows:
+        # Sin filas se conservan las columnas conocidas con su tipo, para poder concatenar.
+        return pd.DataFrame({name: _convert([], kind) for name, kind in kinds.items()})
+    data: Dict[str, Any] = {}
+    for name in rows[0].keys():
+        values = [row.get(name) for row in rows]
+        data[name] = _convert(values, kinds[name]) if name in kinds else values
+    return pd.DataFrame(data)
+
+
+class _ColumnBuffer:
+    """Acumula lotes ya convertidos de una columna y los une al final."""
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self._chunks: List[Any] = []
+        self._vocabulary: Dict[Any, int] = {}
+
+    def extend(self, values: Sequence[Any]) -> None:
+        if self.kind == CATEGORY:
+            # Sólo se guardan códigos enteros; el vocabulario crece a medida que aparecen valores.
+            codes = np.fromiter(
+                (-1 if value is None else self._vocabulary.setdefault(value, len(self._vocabulary)) for value in values),
+                dtype=np.int32,
+                count=len(values),
+            )
+            self._chunks.append(codes)
+        else:
+            self._chunks.append(_convert(values, self.kind))
+
+    def finish(self) -> Any:
+        if self.kind == CATEGORY:
+            codes = np.concatenate(self._chunks) if self._chunks else np.array([], dtype=np.int32)
+            return pd.Categorical.from_codes(codes, categories=list(self._vocabulary))
+        if not self._chunks:
+            return _convert([], self.kind)
+        return np.concatenate(self._chunks)
+
+
+def _transaction_query(
+    columns: Sequence[str],
+    year: Optional[int],
+    month: Optional[int],
+    tipo: Optional[str],
+    dated_only: bool,
+) -> Tuple[str, List[Any]]:
+    unknown = [name for name in columns if name not in TRANSACTION_COLUMNS]
+    if unknown:
+        raise ValueError(f"Columnas desconocidas: {', '.join(unknown)}")
+    filters, params = period_filter(year, month)
+    if tipo is not None:
+        filters.append("c.tipo = %s")
+        params.append(tipo)
+    if dated_only and year is None:
+        filters.append("t.fecha IS NOT NULL")
+    select = ", ".join(f"{TRANSACTION_COLUMNS[name][0]} AS {name}" for name in columns)
+    where = f"WHERE {' AND '.join(filters)}" if filters else ""
+    query = f"""
+    SELECT {select}
+    FROM transaccion t
+    JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+    {where}
+    """
+    return query, params
+
+
+def _iter_batches(
+    connection: DatabaseConnection,
+    query: str,
+    params: Sequence[Any],
+    batch_size: int,
+) -> Iterator[List[Tuple[Any, ...]]]:
+    """Lotes de tuplas con un cursor sin búfer, igual que `BaseRepository._execute_stream`."""
+    with connection.get_connection() as conn:
+        with conn.cursor(buffered=False) as cursor:
+            cursor.execute(query, tuple(params))
+            exhausted = False
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        exhausted = True
+                        return
+                    yield rows
+            finally:
+                if not exhausted:
+                    while cursor.fetchmany(batch_size):
+                        pass
+
+
+def iter_transaction_frames(
+    connection: Optional[DatabaseConnection] = None,
+    columns: Optional[Sequence[str]] = None,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    tipo: Optional[str] = None,
+    dated_only: bool = False,
+    batch_size: int = 5000,
+) -> Iterator[pd.DataFrame]:
+    """Recorre las transacciones como DataFrames tipados de hasta `batch_size` filas."""
+    columns = list(columns or TRANSACTION_COLUMNS)
+    query, params = _transaction_query(columns, year, month, tipo, dated_only)
+    for rows in _iter_batches(connection or DatabaseConnection(), query, params, batch_size):
+        values = list(zip(*rows))
+        yield pd.DataFrame({
+            name: _convert(column, TRANSACTION_COLUMNS[name][1]) for name, column in zip(columns, values)
+        })
+
+
+def load_transactions(
+    connection: Optional[DatabaseConnection] = None,
+    columns: Optional[Sequence[str]] = None,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    tipo: Optional[str] = None,
+    dated_only: bool = False,
+    batch_size: int = 5000,
+) -> pd.DataFrame:
+    """Todas las transacciones que cumplen el filtro en un único DataFrame tipado.
+
+    Cada lote se convierte al llegar, así que en memoria sólo conviven las
+    columnas ya tipadas y un lote de tuplas.
+    """
+    columns = list(columns or TRANSACTION_COLUMNS)
+    query, params = _transaction_query(columns, year, month, tipo, dated_only)
+    buffers = [_ColumnBuffer(TRANSACTION_COLUMNS[name][1]) for name in columns]
+    for rows in _iter_batches(connection or DatabaseConnection(), query, params, batch_size):
+        for buffer, column in zip(buffers, zip(*rows)):
+            buffer.extend(column)
+    return pd.DataFrame({name: buffer.finish() for name, buffer in zip(columns, buffers)})
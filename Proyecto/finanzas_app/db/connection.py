@@ -1,40 +1,97 @@
 from __future__ import annotations
 
-from typing import Any
+import functools
+from pathlib import Path
+from typing import Any, Callable, Dict
 
-from mysql.connector import pooling
-from mysql.connector.connection import MySQLConnection
+from ..config import SQLITE, DBConfig
+from .pool import InstrumentedPool
 
-from ..config import DBConfig
+
+def _connector(config: DBConfig) -> Callable[[], Any]:
+    """Función que abre una conexión del motor configurado; cada motor se importa sólo si se usa."""
+    if config.backend == SQLITE:
+        from . import sqlite_backend
+
+        sqlite_backend.create_schema(config.database)
+        return functools.partial(sqlite_backend.connect, config.database, config.pool_timeout)
+    import mysql.connector
+
+    return functools.partial(
+        mysql.connector.connect,
+        host=config.host,
+        port=config.port,
+        user=config.user,
+        password=config.password,
+        database=config.database,
+    )
+
+
+def _create_pool(config: DBConfig) -> InstrumentedPool:
+    return InstrumentedPool(
+        _connector(config),
+        name=config.pool_name,
+        min_size=config.pool_size,
+        max_size=config.pool_max_size,
+        timeout=config.pool_timeout,
+        max_lifetime=config.pool_recycle,
+    )
 
 
 class DatabaseConnection:
-    _pools: dict[tuple[str, int, str, str, str, int], pooling.MySQLConnectionPool] = {}
+    _pools: dict[tuple[str, int, str, str, str, int], InstrumentedPool] = {}
 
     def __init__(self, config: DBConfig | None = None):
         self._config = config or DBConfig.from_env()
-        cfg = self._config.as_dict().copy()
-        key = (
-            self._config.host,
-            self._config.port,
-            self._config.user,
-            self._config.database,
-            self._config.pool_name,
-            self._config.pool_size,
-        )
-        if key not in DatabaseConnection._pools:
-            pool_name = cfg.pop("pool_name")
-            pool_size = cfg.pop("pool_size")
-            DatabaseConnection._pools[key] = pooling.MySQLConnectionPool(
-                pool_name=pool_name,
-                pool_size=pool_size,
-                **cfg,
+        if self._config.backend == SQLITE:
+            # Dos rutas al mismo archivo comparten pool.
+            key = (SQLITE, 0, "", str(Path(self._config.database).resolve()), self._config.pool_name, self._config.pool_size)
+        else:
+            key = (
+                self._config.host,
+                self._config.port,
+                self._config.user,
+                self._config.database,
+                self._config.pool_name,
+                self._config.pool_size,
             )
+        if key not in DatabaseConnection._pools:
+            DatabaseConnection._pools[key] = _create_pool(self._config)
         self._pool = DatabaseConnection._pools[key]
+        self._key = key
 
-    def get_connection(self) -> MySQLConnection:
+    @property
+    def cache_key(self) -> tuple[str, int, str, str, str, int]:
+        """Identifica la base destino para separar entradas de caché entre conexiones."""
+        return self._key
+
+    @property
+    def config(self) -> DBConfig:
+        return self._config
+
+    @property
+    def backend(self) -> str:
+        return self._config.backend
+
+    @property
+    def label(self) -> str:
+        """Identificador de la base apto para nombres de archivo (modelos, instantáneas)."""
+        if self._config.backend == SQLITE:
+            return f"{self._config.name}_{SQLITE}"
+        return f"{self._config.database}_{self._config.host}_{self._config.port}"
+
+    def get_connection(self) -> Any:
+        """Conexión del pool; con `with` se devuelve al pool al salir.
+
+        Si el pool está en su máximo espera hasta `pool_timeout` segundos y luego
+        lanza `PoolTimeoutError`.
+        """
         return self._pool.get_connection()
 
+    def pool_stats(self) -> Dict[str, Any]:
+        """Métricas del pool de esta base: esperas, retención, conexiones en uso y pico."""
+        return self._pool.stats()
+
     def fetch_scalar(self, query: str) -> Any:
         with self.get_connection() as conn:
             with conn.cursor() as cursor:
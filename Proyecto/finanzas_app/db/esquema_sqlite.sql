@@ -0,0 +1,67 @@
+-- Esquema de `mydb` para el motor SQLite, ya con todas las migraciones de `migraciones/` aplicadas.
+-- Se ejecuta al abrir el archivo por primera vez; todas las sentencias son idempotentes.
+CREATE TABLE IF NOT EXISTS categoria (
+    Id_Categoria INTEGER PRIMARY KEY AUTOINCREMENT,
+    nombre VARCHAR(45) NOT NULL,
+    periodicidad VARCHAR(10) NOT NULL CHECK (periodicidad IN ('anual', 'mensual', 'variable')),
+    tipo VARCHAR(10) NOT NULL CHECK (tipo IN ('gasto', 'ingreso')),
+    descripcion VARCHAR(255)
+);
+
+CREATE TABLE IF NOT EXISTS transaccion (
+    Id_Transaccion INTEGER PRIMARY KEY AUTOINCREMENT,
+    monto DOUBLE NOT NULL,
+    cantidad INT,
+    fecha DATE,
+    description VARCHAR(255),
+    Categoria_Id_Categoria INT NOT NULL REFERENCES categoria (Id_Categoria)
+);
+
+CREATE TABLE IF NOT EXISTS presupuesto_especifico (
+    Id_Presupuesto INTEGER PRIMARY KEY AUTOINCREMENT,
+    anio INT NOT NULL,
+    mes INT NOT NULL,
+    monto DOUBLE NOT NULL,
+    Categoria_Id_Categoria INT NOT NULL REFERENCES categoria (Id_Categoria),
+    Comentario VARCHAR(255)
+);
+
+CREATE TABLE IF NOT EXISTS impuesto_anual (
+    anio INT NOT NULL PRIMARY KEY,
+    impuesto_pagado DOUBLE NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS resumen_mensual (
+    anio INT NOT NULL,
+    mes INT NOT NULL,
+    Categoria_Id_Categoria INT NOT NULL,
+    -- Afinidad NUMERIC; se lee como `Decimal` igual que el DECIMAL de MySQL (migración 004).
+    total DECIMAL(15, 2) NOT NULL DEFAULT 0,
+    conteo INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (anio, mes, Categoria_Id_Categoria)
+);
+
+CREATE INDEX IF NOT EXISTS idx_resumen_categoria ON resumen_mensual (Categoria_Id_Categoria, anio, mes);
+CREATE INDEX IF NOT EXISTS idx_transaccion_fecha_categoria ON transaccion (fecha, Categoria_Id_Categoria, monto);
+CREATE INDEX IF NOT EXISTS idx_transaccion_categoria_fecha ON transaccion (Categoria_Id_Categoria, fecha);
+CREATE INDEX IF NOT EXISTS idx_presupuesto_periodo ON presupuesto_especifico (anio, mes, Categoria_Id_Categoria);
+-- Id_Transaccion es el rowid, que SQLite agrega al final de cada índice: equivale a (fecha, Id_Transaccion).
+CREATE INDEX IF NOT EXISTS idx_transaccion_fecha ON transaccion (fecha);
+
+CREATE TABLE IF NOT EXISTS version_datos (
+    tabla VARCHAR(45) NOT NULL PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO version_datos (tabla, version) VALUES ('transaccion', 0);
+
+-- Las migraciones de MySQL quedan registradas como aplicadas para que `apply_migrations` no las repita.
+CREATE TABLE IF NOT EXISTS schema_migracion (
+    nombre VARCHAR(120) NOT NULL PRIMARY KEY,
+    aplicada_en DATETIME NOT NULL
+);
+INSERT OR IGNORE INTO schema_migracion (nombre, aplicada_en) VALUES
+    ('001_indices_fecha.sql', CURRENT_TIMESTAMP),
+    ('002_resumen_mensual.sql', CURRENT_TIMESTAMP),
+    ('003_indice_paginacion.sql', CURRENT_TIMESTAMP),
+    ('004_resumen_total_decimal.sql', CURRENT_TIMESTAMP),
+    ('005_version_datos.sql', CURRENT_TIMESTAMP);
@@ -0,0 +1,12 @@
+-- Índices compuestos para que los filtros por rango de `fecha` no recorran toda la tabla.
+-- (fecha, categoría, monto) cubre las sumas por periodo sin leer la fila completa.
+CREATE INDEX idx_transaccion_fecha_categoria
+    ON transaccion (fecha, Categoria_Id_Categoria, monto);
+
+-- Historial y totales de una categoría concreta dentro de un periodo.
+CREATE INDEX idx_transaccion_categoria_fecha
+    ON transaccion (Categoria_Id_Categoria, fecha);
+
+-- Presupuestos consultados siempre por año y mes.
+CREATE INDEX idx_presupuesto_periodo
+    ON presupuesto_especifico (anio, mes, Categoria_Id_Categoria);
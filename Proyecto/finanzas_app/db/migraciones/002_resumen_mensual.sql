@@ -0,0 +1,20 @@
+-- Totales mensuales por categoría mantenidos junto con cada escritura en `transaccion`.
+-- Los reportes mensuales y anuales leen de aquí en lugar de agregar transacciones.
+-- `total` es DECIMAL como `transaccion.monto` (misma escala, más dígitos para las sumas):
+-- con DOUBLE, los deltas de cada alta, edición y baja acumularían error de redondeo.
+CREATE TABLE resumen_mensual (
+    anio INT NOT NULL,
+    mes TINYINT NOT NULL,
+    Categoria_Id_Categoria INT NOT NULL,
+    total DECIMAL(15, 2) NOT NULL DEFAULT 0,
+    conteo INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (anio, mes, Categoria_Id_Categoria),
+    KEY idx_resumen_categoria (Categoria_Id_Categoria, anio, mes)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb3;
+
+-- Carga inicial con las transacciones existentes.
+INSERT INTO resumen_mensual (anio, mes, Categoria_Id_Categoria, total, conteo)
+SELECT YEAR(fecha), MONTH(fecha), Categoria_Id_Categoria, SUM(monto), COUNT(*)
+FROM transaccion
+WHERE fecha IS NOT NULL
+GROUP BY YEAR(fecha), MONTH(fecha), Categoria_Id_Categoria;
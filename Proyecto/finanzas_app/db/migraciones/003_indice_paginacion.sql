@@ -0,0 +1,4 @@
+-- Recorrido paginado de `transaccion` por (fecha, Id_Transaccion) descendente.
+-- InnoDB agrega la clave primaria al final del índice, así que equivale a (fecha, Id_Transaccion).
+CREATE INDEX idx_transaccion_fecha
+    ON transaccion (fecha);
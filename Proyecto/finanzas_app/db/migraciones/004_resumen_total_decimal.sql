@@ -0,0 +1,11 @@
+-- Bases que aplicaron 002 cuando `total` era DOUBLE: se pasa a DECIMAL y se recalcula
+-- desde `transaccion` para descartar el error de redondeo ya acumulado por los deltas.
+ALTER TABLE resumen_mensual MODIFY total DECIMAL(15, 2) NOT NULL DEFAULT 0;
+
+DELETE FROM resumen_mensual;
+
+INSERT INTO resumen_mensual (anio, mes, Categoria_Id_Categoria, total, conteo)
+SELECT YEAR(fecha), MONTH(fecha), Categoria_Id_Categoria, SUM(monto), COUNT(*)
+FROM transaccion
+WHERE fecha IS NOT NULL
+GROUP BY YEAR(fecha), MONTH(fecha), Categoria_Id_Categoria;
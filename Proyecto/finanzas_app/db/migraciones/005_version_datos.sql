@@ -0,0 +1,9 @@
+-- Contador de escrituras por tabla, incrementado en la misma transacción que cada alta,
+-- edición o baja del repositorio. La huella del modelo de predicción lo incluye para
+-- detectar ediciones que no cambian el número de filas ni la suma de montos.
+CREATE TABLE version_datos (
+    tabla VARCHAR(45) NOT NULL PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO version_datos (tabla, version) VALUES ('transaccion', 0);
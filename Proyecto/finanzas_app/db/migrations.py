@@ -0,0 +1,60 @@
+"""Aplica en orden los scripts SQL de `db/migraciones` que aún no se ejecutaron."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+from .connection import DatabaseConnection
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migraciones"
+
+
+def _split_statements(script: str) -> List[str]:
+    """Separa un script en sentencias, descartando los comentarios de línea."""
+    lines = [line for line in script.splitlines() if not line.strip().startswith("--")]
+    return [statement.strip() for statement in "\n".join(lines).split(";") if statement.strip()]
+
+
+def apply_migrations(connection: DatabaseConnection | None = None) -> List[str]:
+    """Ejecuta las migraciones pendientes y retorna los nombres aplicados."""
+    db = connection or DatabaseConnection()
+    applied_now: List[str] = []
+    with db.get_connection() as conn:
+        with conn.cursor() as cursor:
+            # La tabla de control registra qué archivos ya se aplicaron.
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS schema_migracion (
+                    nombre VARCHAR(120) NOT NULL PRIMARY KEY,
+                    aplicada_en DATETIME NOT NULL
+                )
+                """
+            )
+            cursor.execute("SELECT nombre FROM schema_migracion")
+            applied = {row[0] for row in cursor.fetchall()}
+            for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+                if path.name in applied:
+                    continue
+                for statement in _split_statements(path.read_text(encoding="utf-8")):
+                    cursor.execute(statement)
+                cursor.execute(
+                    "INSERT INTO schema_migracion (nombre, aplicada_en) VALUES (%s, NOW())",
+                    (path.name,),
+                )
+                conn.commit()
+                applied_now.append(path.name)
+    return applied_now
+
+
+def main() -> None:
+    applied = apply_migrations()
+    if not applied:
+        print("No hay migraciones pendientes.")
+        return
+    for name in applied:
+        print(f"Migración aplicada: {name}")
+
+
+if __name__ == "__main__":
+    main()
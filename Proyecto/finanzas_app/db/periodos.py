@@ -0,0 +1,70 @@
+"""Filtros de periodo que aprovechan los índices sobre `transaccion.fecha`.
+
+También define la numeración de semanas y días de MySQL (`WEEK(fecha, 1)`,
+`DAYOFWEEK`) que reproducen el motor SQLite, el dataset de reportes y las
+instantáneas Parquet, para que los tres agrupen igual que una consulta a MySQL.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, List, Optional, Tuple
+
+
+def period_bounds(year: int, month: Optional[int] = None) -> Tuple[date, date]:
+    """Devuelve el rango semiabierto [inicio, fin) del año o del mes indicado."""
+    if month is None:
+        return date(year, 1, 1), date(year + 1, 1, 1)
+    if not 1 <= month <= 12:
+        raise ValueError(f"Mes fuera de rango: {month}")
+    if month == 12:
+        return date(year, 12, 1), date(year + 1, 1, 1)
+    return date(year, month, 1), date(year, month + 1, 1)
+
+
+def period_filter(
+    year: Optional[int],
+    month: Optional[int] = None,
+    column: str = "t.fecha",
+) -> Tuple[List[str], List[Any]]:
+    """Traduce (año, mes) a condiciones `col >= inicio AND col < fin` con sus parámetros.
+
+    A diferencia de `YEAR(col) = %s`, el rango permite que MySQL use un índice
+    sobre la columna en lugar de recorrer toda la tabla.
+    """
+    if year is None:
+        if month is None:
+            return [], []
+        # Sin año no existe un rango continuo: se conserva el filtro por mes.
+        return [f"MONTH({column}) = %s"], [month]
+    start, end = period_bounds(year, month)
+    return [f"{column} >= %s", f"{column} < %s"], [start, end]
+
+
+def rollup_period_filter(
+    year: Optional[int],
+    month: Optional[int] = None,
+    alias: str = "r",
+) -> Tuple[List[str], List[Any]]:
+    """Condiciones equivalentes a `period_filter` sobre las columnas (anio, mes) de `resumen_mensual`."""
+    clauses: List[str] = []
+    params: List[Any] = []
+    if year is not None:
+        clauses.append(f"{alias}.anio = %s")
+        params.append(year)
+    if month is not None:
+        clauses.append(f"{alias}.mes = %s")
+        params.append(month)
+    return clauses, params
+
+
+def mysql_week_mode1(day: date) -> int:
+    """Equivalente a `WEEK(fecha, 1)`: semanas de lunes, la 1 es la primera con 4+ días del año."""
+    first_weekday = date(day.year, 1, 1).weekday()
+    week = (day.timetuple().tm_yday - 1 + first_weekday) // 7
+    return week + 1 if first_weekday <= 3 else week
+
+
+def mysql_dayofweek(day: date) -> int:
+    """Equivalente a `DAYOFWEEK(fecha)`: 1 = domingo … 7 = sábado."""
+    return day.isoweekday() % 7 + 1
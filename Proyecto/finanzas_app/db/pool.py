@@ -0,0 +1,255 @@
+"""Pool de conexiones con espera acotada, métricas, chequeo de salud y crecimiento entre límites.
+
+El pool de `mysql.connector` falla con `PoolError` en cuanto se agota y no dice
+cuánto se espera ni quién retiene las conexiones. `InstrumentedPool` sirve
+para cualquier motor (recibe la función que abre una conexión):
+
+- `get_connection()` espera hasta `timeout` segundos por una conexión libre.
+- Abre conexiones bajo demanda hasta `max_size`; las que sobran por encima de
+  `min_size` se cierran tras `max_idle` segundos sin uso.
+- Una conexión que superó `max_lifetime` o que falla el chequeo de salud
+  (`is_connected()`, sólo si estuvo inactiva más de `check_after` segundos)
+  se descarta y se reemplaza.
+- `stats()` devuelve esperas, tiempos de retención y conexiones en uso y pico.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+class PoolTimeoutError(RuntimeError):
+    """No se liberó ninguna conexión dentro del tiempo de espera."""
+
+
+@dataclass
+class PoolStats:
+    size: int = 0
+    in_use: int = 0
+    peak_in_use: int = 0
+    checkouts: int = 0
+    waits: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    hold_seconds_total: float = 0.0
+    hold_seconds_max: float = 0.0
+    opened: int = 0
+    recycled: int = 0
+    failed_checks: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["wait_seconds_avg"] = self.wait_seconds_total / self.checkouts if self.checkouts else 0.0
+        data["hold_seconds_avg"] = self.hold_seconds_total / self.checkouts if self.checkouts else 0.0
+        return data
+
+
+class _Entry:
+    __slots__ = ("conn", "created_at", "released_at")
+
+    def __init__(self, conn: Any) -> None:
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.released_at = self.created_at
+
+
+class PooledConnection:
+    """Conexión prestada: delega todo en la conexión real y al cerrarse vuelve al pool."""
+
+    def __init__(self, pool: "InstrumentedPool", entry: _Entry) -> None:
+        self._pool = pool
+        self._entry: Optional[_Entry] = entry
+        self._checked_out_at = time.monotonic()
+
+    def __getattr__(self, name: str) -> Any:
+        if self._entry is None:
+            raise RuntimeError("La conexión ya se devolvió al pool")
+        return getattr(self._entry.conn, name)
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._entry is None:
+            return
+        entry, self._entry = self._entry, None
+        self._pool._release(entry, time.monotonic() - self._checked_out_at)
+
+
+class InstrumentedPool:
+    """Pool genérico: `connect()` abre una conexión real con `cursor`, `commit`, `rollback` y `close`."""
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        name: str = "finanzas_pool",
+        min_size: int = 5,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_idle: float = 300.0,
+        max_lifetime: float = 3600.0,
+        check_after: float = 30.0,
+    ) -> None:
+        if min_size < 1:
+            raise ValueError("min_size debe ser mayor que cero")
+        self.name = name
+        self._connect = connect
+        self._min_size = min_size
+        self._max_size = max(min_size, max_size)
+        self._timeout = timeout
+        self._max_idle = max_idle
+        self._max_lifetime = max_lifetime
+        self._check_after = check_after
+        self._idle: List[_Entry] = []
+        self._available = threading.Condition()
+        self._stats = PoolStats()
+
+    # ----------------------------- préstamo -----------------------------
+
+    def get_connection(self, timeout: Optional[float] = None) -> PooledConnection:
+        limit = self._timeout if timeout is None else timeout
+        started = time.monotonic()
+        waited = False
+        with self._available:
+            while True:
+                entry = self._take_idle()
+                if entry is not None:
+                    break
+                if self._stats.size < self._max_size:
+                    # Se reserva el lugar y la conexión se abre fuera del candado.
+                    self._stats.size += 1
+                    break
+                remaining = limit - (time.monotonic() - started)
+                if remaining <= 0:
+                    self._stats.timeouts += 1
+                    raise PoolTimeoutError(
+                        f"Pool {self.name!r} agotado: {self._stats.in_use} conexiones en uso tras {limit:.1f}s"
+                    )
+                waited = True
+                self._available.wait(remaining)
+            self._mark_checkout(time.monotonic() - started, waited)
+        if entry is not None and not self._healthy(entry):
+            with self._available:
+                self._stats.failed_checks += 1
+                self._stats.recycled += 1
+            self._discard(entry)
+            # El lugar sigue reservado: se reemplaza por una conexión nueva.
+            entry = None
+        if entry is None:
+            entry = self._open_reserved()
+        return PooledConnection(self, entry)
+
+    def _open_reserved(self) -> _Entry:
+        """Abre una conexión para un lugar ya reservado; si falla, lo libera."""
+        try:
+            entry = _Entry(self._connect())
+        except Exception:
+            with self._available:
+                self._stats.size -= 1
+                self._stats.in_use -= 1
+                self._available.notify()
+            raise
+        with self._available:
+            self._stats.opened += 1
+        return entry
+
+    def _take_idle(self) -> Optional[_Entry]:
+        """Conexión libre más reciente, descartando las vencidas (se llama con el candado tomado)."""
+        now = time.monotonic()
+        while self._idle:
+            entry = self._idle.pop()
+            expired = now - entry.created_at > self._max_lifetime
+            if not expired:
+                return entry
+            self._stats.size -= 1
+            self._stats.recycled += 1
+            self._discard(entry)
+        return None
+
+    def _healthy(self, entry: _Entry) -> bool:
+        if time.monotonic() - entry.released_at < self._check_after:
+            return True
+        try:
+            return bool(entry.conn.is_connected())
+        except Exception:
+            return False
+
+    def _mark_checkout(self, waited_seconds: float, waited: bool) -> None:
+        stats = self._stats
+        stats.checkouts += 1
+        stats.in_use += 1
+        stats.peak_in_use = max(stats.peak_in_use, stats.in_use)
+        if waited:
+            stats.waits += 1
+        stats.wait_seconds_total += waited_seconds
+        stats.wait_seconds_max = max(stats.wait_seconds_max, waited_seconds)
+
+    # ----------------------------- devolución -----------------------------
+
+    def _release(self, entry: _Entry, held_seconds: float) -> None:
+        healthy = True
+        try:
+            # Lo no confirmado se descarta, igual que al devolver una conexión al pool de MySQL.
+            if getattr(entry.conn, "in_transaction", False):
+                entry.conn.rollback()
+        except Exception:
+            healthy = False
+        entry.released_at = time.monotonic()
+        surplus: List[_Entry] = []
+        with self._available:
+            stats = self._stats
+            stats.in_use -= 1
+            stats.hold_seconds_total += held_seconds
+            stats.hold_seconds_max = max(stats.hold_seconds_max, held_seconds)
+            if healthy:
+                self._idle.append(entry)
+            else:
+                stats.size -= 1
+                stats.recycled += 1
+                surplus.append(entry)
+            surplus.extend(self._shrink())
+            self._available.notify()
+        for stale in surplus:
+            self._discard(stale)
+
+    def _shrink(self) -> List[_Entry]:
+        """Saca las conexiones inactivas por encima de `min_size` (con el candado tomado)."""
+        now = time.monotonic()
+        removed: List[_Entry] = []
+        # Las más antiguas están al principio de la lista.
+        while self._stats.size > self._min_size and self._idle and now - self._idle[0].released_at > self._max_idle:
+            removed.append(self._idle.pop(0))
+            self._stats.size -= 1
+        return removed
+
+    @staticmethod
+    def _discard(entry: _Entry) -> None:
+        try:
+            entry.conn.close()
+        except Exception:
+            pass
+
+    # ----------------------------- métricas -----------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Copia de las métricas acumuladas más el tamaño configurado."""
+        with self._available:
+            data = self._stats.as_dict()
+            data.update(idle=len(self._idle), min_size=self._min_size, max_size=self._max_size)
+            return data
+
+    def close_idle(self) -> int:
+        """Cierra las conexiones libres (p. ej. al salir de la aplicación) y retorna cuántas."""
+        with self._available:
+            idle, self._idle = self._idle, []
+            self._stats.size -= len(idle)
+        for entry in idle:
+            self._discard(entry)
+        return len(idle)
@@ -0,0 +1,231 @@
+"""Perfilado de consultas SQL: tiempo, filas y punto de llamada por sentencia, con registro de lentas.
+
+Se activa con `FINANZAS_PERFIL_SQL=1` (o `query_profiler.enable()`); desactivado,
+`measure` no hace nada más que ceder el control. Cada sentencia se agrupa por su
+texto normalizado (espacios colapsados, sin parámetros). Las que superan
+`FINANZAS_CONSULTA_LENTA_MS` (200 ms por defecto) se guardan con sus parámetros
+y, si son `SELECT`, con el plan de `EXPLAIN` capturado una vez por sentencia.
+
+`export(ruta)` escribe el resumen en JSON (sentencias y consultas lentas) o CSV
+(sólo sentencias); la GUI lo hace al cerrarse en `FINANZAS_PERFIL_DIR`.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from ..config import SQLITE
+
+if TYPE_CHECKING:
+    from .connection import DatabaseConnection
+
+_WHITESPACE = re.compile(r"\s+")
+# Frames que no cuentan como punto de llamada: la plomería de acceso a datos.
+_PLUMBING_FILES = {"profiler.py", "cache.py", "contextlib.py", "async_repositories.py", "thread.py", "functools.py"}
+_PLUMBING_FUNCTIONS = {
+    "_execute_read", "_execute_write", "_execute_stream", "_transaction", "_scalar_query", "_value_for_type",
+    # `_ProfiledCursor` de `repositories.py`, el cursor que entrega `_transaction`.
+    "execute", "executemany",
+}
+MAX_SLOW_ENTRIES = 200
+
+
+def normalize(query: str) -> str:
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+def _call_site() -> str:
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        if Path(code.co_filename).name not in _PLUMBING_FILES and code.co_name not in _PLUMBING_FUNCTIONS:
+            return f"{Path(code.co_filename).name}:{frame.f_lineno} ({code.co_name})"
+        frame = frame.f_back
+    return "?"
+
+
+@dataclass
+class StatementStats:
+    statement: str
+    calls: int = 0
+    rows: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    slow_calls: int = 0
+    call_sites: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def as_row(self) -> Dict[str, Any]:
+        return {
+            "statement": self.statement,
+            "calls": self.calls,
+            "rows": self.rows,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.mean_seconds * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "slow_calls": self.slow_calls,
+            "call_sites": "; ".join(f"{site} x{count}" for site, count in sorted(self.call_sites.items())),
+        }
+
+
+class Measurement:
+    """Lo que la llamada medida completa: `rows` devueltas o afectadas."""
+
+    __slots__ = ("rows",)
+
+    def __init__(self) -> None:
+        self.rows = 0
+
+
+class QueryProfiler:
+    """Acumula métricas por sentencia normalizada; seguro entre hilos."""
+
+    def __init__(self) -> None:
+        self.enabled = os.getenv("FINANZAS_PERFIL_SQL", "") not in ("", "0")
+        self.slow_threshold = float(os.getenv("FINANZAS_CONSULTA_LENTA_MS", "200")) / 1000
+        self._lock = threading.Lock()
+        self._statements: Dict[str, StatementStats] = {}
+        self._slow: List[Dict[str, Any]] = []
+        self._explained: Dict[str, Any] = {}
+        self.started_at = datetime.now()
+
+    def enable(self, slow_threshold_ms: Optional[float] = None) -> None:
+        if slow_threshold_ms is not None:
+            self.slow_threshold = slow_threshold_ms / 1000
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statements.clear()
+            self._slow.clear()
+            self._explained.clear()
+            self.started_at = datetime.now()
+
+    @contextmanager
+    def measure(
+        self,
+        connection: Optional["DatabaseConnection"],
+        query: str,
+        params: Any = None,
+    ) -> Iterator[Measurement]:
+        """Mide el bloque que ejecuta `query`; el bloque asigna `rows` al objeto cedido."""
+        measurement = Measurement()
+        if not self.enabled:
+            yield measurement
+            return
+        started = time.perf_counter()
+        try:
+            yield measurement
+        finally:
+            elapsed = time.perf_counter() - started
+            self._record(connection, query, params, elapsed, measurement.rows, _call_site())
+
+    def _record(
+        self,
+        connection: Optional["DatabaseConnection"],
+        query: str,
+        params: Any,
+        elapsed: float,
+        rows: int,
+        site: str,
+    ) -> None:
+        statement = normalize(query)
+        slow = elapsed >= self.slow_threshold
+        with self._lock:
+            stats = self._statements.get(statement)
+            if stats is None:
+                stats = self._statements[statement] = StatementStats(statement)
+            stats.calls += 1
+            stats.rows += rows
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            stats.call_sites[site] = stats.call_sites.get(site, 0) + 1
+            if not slow:
+                return
+            stats.slow_calls += 1
+            needs_plan = statement not in self._explained and statement.upper().startswith("SELECT")
+            if needs_plan:
+                # Se reserva para no capturar el mismo plan desde dos hilos.
+                self._explained[statement] = None
+        plan = self._explain(connection, query, params) if needs_plan and connection is not None else None
+        with self._lock:
+            if needs_plan:
+                self._explained[statement] = plan
+            self._slow.append({
+                "at": datetime.now().isoformat(timespec="seconds"),
+                "statement": statement,
+                "params": repr(params),
+                "ms": round(elapsed * 1000, 3),
+                "rows": rows,
+                "call_site": site,
+                "plan": self._explained.get(statement),
+            })
+            del self._slow[:-MAX_SLOW_ENTRIES]
+
+    @staticmethod
+    def _explain(connection: "DatabaseConnection", query: str, params: Any) -> Any:
+        """Plan de ejecución con una conexión propia del pool; los errores quedan en el registro."""
+        prefix = "EXPLAIN QUERY PLAN " if connection.backend == SQLITE else "EXPLAIN "
+        try:
+            with connection.get_connection() as conn:
+                with conn.cursor(dictionary=True) as cursor:
+                    cursor.execute(prefix + query, params or ())
+                    return [{key: str(value) for key, value in row.items()} for row in cursor.fetchall()]
+        except Exception as exc:
+            return f"EXPLAIN falló: {exc}"
+
+    def statements(self) -> List[StatementStats]:
+        """Sentencias ordenadas por tiempo total, de la más costosa a la menos."""
+        with self._lock:
+            return sorted(self._statements.values(), key=lambda stats: stats.total_seconds, reverse=True)
+
+    def slow_queries(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._slow)
+
+    def export(self, path: Path) -> Path:
+        """Escribe el resumen en `path` (`.csv` o `.json`) y retorna la ruta."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        rows = [stats.as_row() for stats in self.statements()]
+        if path.suffix.lower() == ".csv":
+            with open(path, "w", newline="", encoding="utf-8") as handle:
+                writer = csv.DictWriter(handle, fieldnames=list(StatementStats("").as_row()))
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            payload = {
+                "session_start": self.started_at.isoformat(timespec="seconds"),
+                "exported_at": datetime.now().isoformat(timespec="seconds"),
+                "slow_threshold_ms": self.slow_threshold * 1000,
+                "statements": rows,
+                "slow_queries": self.slow_queries(),
+            }
+            path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        return path
+
+    def export_session(self, directory: Optional[Path] = None) -> Optional[Path]:
+        """Exporta la sesión a `<dir>/perfil_sql_<inicio>.json` si hubo consultas medidas."""
+        if not self._statements:
+            return None
+        target = directory or Path(os.getenv("FINANZAS_PERFIL_DIR", Path.home() / ".finanzas_app" / "perfiles"))
+        return self.export(Path(target) / f"perfil_sql_{self.started_at:%Y%m%d_%H%M%S}.json")
+
+
+query_profiler = QueryProfiler()
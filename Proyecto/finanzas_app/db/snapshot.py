@@ -0,0 +1,245 @@
+"""Instantáneas Parquet de los años cerrados para responder reportes sin ir a MySQL.
+
+`export_snapshot` escribe `transaccion` ⋈ `categoria` de cada año cerrado en
+`<directorio>/<base>/transacciones/anio=AAAA/mes=M/*.parquet` y registra el año
+en `manifest.json`. `SnapshotReports` responde con pandas vectorizado los
+reportes de `FinancialReportRepository` que se leen por período, con las mismas
+columnas y el mismo orden. El directorio se toma de `FINANZAS_SNAPSHOT_DIR`; sin
+esa variable no se usan instantáneas.
+
+Uso: `python -m finanzas_app.db.snapshot [--anio 2022 ...] [--forzar]`
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .columnar import load_transactions
+from .connection import DatabaseConnection
+from .periodos import mysql_dayofweek, mysql_week_mode1
+
+SNAPSHOT_COLUMNS = ["id_transaccion", "monto", "cantidad", "fecha", "categoria_id", "categoria", "tipo", "periodicidad"]
+MANIFEST = "manifest.json"
+
+_instances: Dict[Path, "SnapshotReports"] = {}
+_instances_lock = threading.Lock()
+
+
+def snapshot_directory(connection: DatabaseConnection) -> Optional[Path]:
+    configured = os.getenv("FINANZAS_SNAPSHOT_DIR")
+    if not configured:
+        return None
+    return Path(configured) / connection.label
+
+
+def snapshot_for_connection(connection: DatabaseConnection) -> Optional["SnapshotReports"]:
+    """Motor de consultas compartido para la base de `connection`, o None si no hay instantáneas."""
+    directory = snapshot_directory(connection)
+    if directory is None or not (directory / MANIFEST).exists():
+        return None
+    with _instances_lock:
+        if directory not in _instances:
+            _instances[directory] = SnapshotReports(directory)
+        return _instances[directory]
+
+
+def is_closed_year(year: int) -> bool:
+    return year < date.today().year
+
+
+def _read_manifest(directory: Path) -> Dict[str, Any]:
+    path = directory / MANIFEST
+    if not path.exists():
+        return {"years": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_manifest(directory: Path, manifest: Dict[str, Any]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    temporary = directory / f"{MANIFEST}.tmp"
+    temporary.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(temporary, directory / MANIFEST)
+
+
+def export_snapshot(
+    connection: DatabaseConnection,
+    years: Optional[Iterable[int]] = None,
+    force: bool = False,
+) -> List[int]:
+    """Exporta los años cerrados indicados (por defecto todos los que falten) y retorna los escritos."""
+    from ..repositories import FinancialReportRepository
+
+    directory = snapshot_directory(connection)
+    if directory is None:
+        raise RuntimeError("Define FINANZAS_SNAPSHOT_DIR para exportar instantáneas.")
+    manifest = _read_manifest(directory)
+    candidates = years if years is not None else FinancialReportRepository(connection).get_available_years()
+    written: List[int] = []
+    for year in sorted(set(candidates)):
+        if not is_closed_year(year) or (str(year) in manifest["years"] and not force):
+            continue
+        frame = load_transactions(connection, columns=SNAPSHOT_COLUMNS, year=year)
+        target = directory / "transacciones" / f"anio={year}"
+        shutil.rmtree(target, ignore_errors=True)
+        frame["mes"] = frame["fecha"].dt.month
+        frame.to_parquet(target, partition_cols=["mes"], index=False)
+        manifest["years"][str(year)] = {
+            "filas": int(len(frame)),
+            "suma_monto": float(frame["monto"].sum()),
+            "exportado": datetime.now().isoformat(timespec="seconds"),
+        }
+        _write_manifest(directory, manifest)
+        written.append(year)
+    with _instances_lock:
+        _instances.pop(directory, None)
+    return written
+
+
+def discard_years(connection: DatabaseConnection, years: Iterable[Optional[int]]) -> None:
+    """Quita del manifiesto los años modificados para que vuelvan a leerse en vivo."""
+    snapshot = snapshot_for_connection(connection)
+    if snapshot is not None:
+        snapshot.discard(year for year in years if year is not None)
+
+
+class SnapshotReports:
+    """Responde reportes por período a partir de las instantáneas Parquet de un directorio."""
+
+    def __init__(self, directory: Path, max_years: int = 4) -> None:
+        self._directory = directory
+        self._max_years = max_years
+        self._lock = threading.Lock()
+        self._years: "OrderedDict[int, pd.DataFrame]" = OrderedDict()
+        self._available = {int(year) for year in _read_manifest(directory)["years"]}
+
+    def has_year(self, year: Optional[int]) -> bool:
+        return year is not None and year in self._available
+
+    def discard(self, years: Iterable[int]) -> None:
+        years = {year for year in years if year in self._available}
+        if not years:
+            return
+        with self._lock:
+            manifest = _read_manifest(self._directory)
+            for year in years:
+                manifest["years"].pop(str(year), None)
+                self._years.pop(year, None)
+            self._available -= years
+            _write_manifest(self._directory, manifest)
+
+    def _frame(self, year: int, month: Optional[int] = None) -> pd.DataFrame:
+        with self._lock:
+            frame = self._years.get(year)
+            if frame is None:
+                frame = pd.read_parquet(self._directory / "transacciones" / f"anio={year}", columns=SNAPSHOT_COLUMNS)
+                frame["fecha"] = pd.to_datetime(frame["fecha"])
+                frame["mes"] = frame["fecha"].dt.month
+                self._years[year] = frame
+                while len(self._years) > self._max_years:
+                    self._years.popitem(last=False)
+            else:
+                self._years.move_to_end(year)
+        if month is not None:
+            frame = frame[frame["mes"] == month]
+        return frame
+
+    # ----------------------------- reportes -----------------------------
+
+    def total_by_type(self, year: int, tipo: str, month: Optional[int] = None) -> float:
+        frame = self._frame(year, month)
+        return float(frame.loc[frame["tipo"] == tipo, "monto"].sum())
+
+    def by_category(self, year: int, tipo: str, month: Optional[int] = None) -> List[Dict[str, Any]]:
+        frame = self._frame(year, month)
+        totals = (
+            frame[frame["tipo"] == tipo]
+            .groupby(["categoria_id", "categoria"], observed=True)["monto"].sum()
+            .sort_values(ascending=False)
+            .reset_index()
+            .rename(columns={"monto": "total"})
+        )
+        return totals[["categoria", "total"]].to_dict("records")
+
+    def monthly_savings(self, year: int) -> List[Dict[str, Any]]:
+        frame = self._frame(year)
+        signed = np.where(frame["tipo"] == "ingreso", frame["monto"], -frame["monto"])
+        savings = pd.Series(signed, index=frame.index).groupby(frame["mes"]).sum()
+        return [
+            {"periodo": f"{year:04d}-{int(month):02d}", "ahorro": float(value)}
+            for month, value in savings.sort_index().items()
+        ]
+
+    def monthly_totals(self, year: int, tipo: str) -> List[Dict[str, Any]]:
+        frame = self._frame(year)
+        totals = frame[frame["tipo"] == tipo].groupby("mes")["monto"].sum().sort_index()
+        return [{"mes": int(month), "total": float(total)} for month, total in totals.items()]
+
+    def by_category_by_month(self, year: int, tipo: str) -> List[Dict[str, Any]]:
+        frame = self._frame(year)
+        totals = (
+            frame[frame["tipo"] == tipo]
+            .groupby(["mes", "categoria_id", "categoria"], observed=True)["monto"].sum()
+            .reset_index()
+            .rename(columns={"monto": "total"})
+            .sort_values(["mes", "total"], ascending=[True, False])
+        )
+        return totals[["mes", "categoria", "total"]].to_dict("records")
+
+    def category_totals_by_month(self, year: int) -> List[Dict[str, Any]]:
+        frame = self._frame(year)
+        totals = (
+            frame.groupby(["mes", "categoria_id", "categoria", "tipo"], observed=True)["monto"].sum()
+            .reset_index()
+            .rename(columns={"monto": "total"})
+            .sort_values(["mes", "categoria"])
+        )
+        return totals.to_dict("records")
+
+    def daily_totals(self, year: int, month: Optional[int] = None, tipo: Optional[str] = None) -> List[Dict[str, Any]]:
+        frame = self._frame(year, month)
+        if tipo is not None:
+            frame = frame[frame["tipo"] == tipo]
+        keys = [frame["fecha"].dt.normalize().rename("fecha")]
+        if tipo is None:
+            keys.append(frame["tipo"])
+        totals = frame.groupby(keys, observed=True)["monto"].sum().rename("total").reset_index()
+        totals = totals.sort_values("fecha")
+        totals["fecha"] = totals["fecha"].dt.date
+        return totals.to_dict("records")
+
+    def weekly_heatmap(self, year: int, month: int) -> List[Dict[str, Any]]:
+        frame = self._frame(year, month)
+        frame = frame[frame["tipo"] == "gasto"]
+        # Un mes tiene a lo sumo 31 días distintos: se numeran una vez por día y se reparten.
+        dias = frame["fecha"].dt.date
+        semana = dias.map({dia: mysql_week_mode1(dia) for dia in dias.unique()}).rename("semana")
+        dia_semana = dias.map({dia: mysql_dayofweek(dia) for dia in dias.unique()}).rename("dia_semana")
+        totals = frame.groupby([semana, dia_semana])["monto"].sum().rename("total").reset_index()
+        return totals.sort_values(["semana", "dia_semana"]).to_dict("records")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--anio", type=int, action="append", default=None, help="Año cerrado a exportar (se puede repetir).")
+    parser.add_argument("--forzar", action="store_true", help="Vuelve a exportar años ya presentes.")
+    args = parser.parse_args()
+    written = export_snapshot(DatabaseConnection(), args.anio, force=args.forzar)
+    if not written:
+        print("No hay años cerrados pendientes de exportar.")
+    for year in written:
+        print(f"Instantánea exportada: {year}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""Motor SQLite embebido (modo WAL) con la misma interfaz que las conexiones de `mysql.connector`.
+
+`connect()` abre conexiones que se usan igual que las de MySQL
+(`with conn.cursor(dictionary=True) as cursor`, `commit`, `rollback`,
+`lastrowid`) y se prestan con el mismo `InstrumentedPool` de `db/pool.py`,
+así que los repositorios no cambian. Cada sentencia pasa por
+`translate`, que adapta la sintaxis propia de MySQL:
+
+- `%s` / `%(nombre)s` → `?` / `:nombre`.
+- `ON DUPLICATE KEY UPDATE ... VALUES(col)` → `ON CONFLICT DO UPDATE SET ... excluded.col`.
+- `SELECT ... FOR UPDATE` → se quita y la transacción se abre con `BEGIN IMMEDIATE`.
+- `DATE(expr) AS alias` → `AS "alias [date]"` para recibir objetos `date`.
+
+Las funciones de MySQL usadas por los reportes (`YEAR`, `MONTH`, `WEEK`,
+`DAYOFWEEK`, `DATE_FORMAT`, `NOW`, `VERSION`) se registran como funciones SQL.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .periodos import mysql_dayofweek, mysql_week_mode1
+
+SCHEMA_PATH = Path(__file__).resolve().parent / "esquema_sqlite.sql"
+
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_adapter(Decimal, float)
+# SQLite guarda DECIMAL como REAL; al leerlo con 15 dígitos significativos y como `Decimal`
+# se descarta el error de redondeo de las sumas, como en MySQL.
+sqlite3.register_converter("DECIMAL", lambda raw: Decimal(raw.decode()))
+sqlite3.register_converter("DATE", lambda raw: date.fromisoformat(raw.decode()[:10]))
+sqlite3.register_converter("DATETIME", lambda raw: datetime.fromisoformat(raw.decode()))
+sqlite3.register_converter("TIMESTAMP", lambda raw: datetime.fromisoformat(raw.decode()))
+
+_PLACEHOLDER = re.compile(r"%\((\w+)\)s|%s")
+_UPSERT = re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b", re.IGNORECASE)
+_UPSERT_VALUE = re.compile(r"\bVALUES\(\s*(\w+)\s*\)", re.IGNORECASE)
+_FOR_UPDATE = re.compile(r"\bFOR\s+UPDATE\b", re.IGNORECASE)
+_DATE_ALIAS = re.compile(r"\b(DATE\([^()]*\))\s+AS\s+(\w+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def translate(query: str) -> Tuple[str, bool]:
+    """Sentencia equivalente en SQLite e indicación de si pedía bloquear filas (`FOR UPDATE`)."""
+    locking = bool(_FOR_UPDATE.search(query))
+    query = _FOR_UPDATE.sub("", query)
+    if _UPSERT.search(query):
+        query = _UPSERT.sub("ON CONFLICT DO UPDATE SET", query)
+        query = _UPSERT_VALUE.sub(r"excluded.\1", query)
+    query = _DATE_ALIAS.sub(r'\1 AS "\2 [date]"', query)
+    query = _PLACEHOLDER.sub(lambda match: f":{match.group(1)}" if match.group(1) else "?", query)
+    return query, locking
+
+
+# ----------------------------- funciones de MySQL -----------------------------
+
+def _as_date(value: Any) -> Optional[date]:
+    if value is None:
+        return None
+    return date.fromisoformat(str(value)[:10])
+
+
+def _year(value: Any) -> Optional[int]:
+    day = _as_date(value)
+    return day.year if day else None
+
+
+def _month(value: Any) -> Optional[int]:
+    day = _as_date(value)
+    return day.month if day else None
+
+
+def _week(value: Any, mode: int = 0) -> Optional[int]:
+    """`WEEK(fecha, 1)`: semanas de lunes; la 1 es la primera con 4+ días del año."""
+    day = _as_date(value)
+    if day is None:
+        return None
+    if mode != 1:
+        raise ValueError(f"WEEK sólo admite el modo 1 en SQLite (recibido {mode})")
+    return mysql_week_mode1(day)
+
+
+def _dayofweek(value: Any) -> Optional[int]:
+    """`DAYOFWEEK(fecha)`: 1 = domingo … 7 = sábado."""
+    day = _as_date(value)
+    return mysql_dayofweek(day) if day else None
+
+
+_DATE_FORMAT_CODES = {
+    "Y": "%Y", "y": "%y", "m": "%m", "d": "%d", "H": "%H", "i": "%M", "s": "%S", "S": "%S",
+    "M": "%B", "b": "%b", "W": "%A", "a": "%a", "j": "%j", "%": "%%",
+}
+
+
+def _date_format(value: Any, fmt: str) -> Optional[str]:
+    if value is None:
+        return None
+    moment = datetime.fromisoformat(str(value))
+
+    def code(match: "re.Match[str]") -> str:
+        letter = match.group(1)
+        # %c y %e (mes y día sin ceros) no tienen equivalente portable en strftime.
+        if letter == "c":
+            return str(moment.month)
+        if letter == "e":
+            return str(moment.day)
+        return _DATE_FORMAT_CODES.get(letter, letter)
+
+    return moment.strftime(re.sub(r"%(.)", code, fmt))
+
+
+def _now() -> str:
+    return datetime.now().isoformat(" ", timespec="seconds")
+
+
+def _register_functions(conn: sqlite3.Connection) -> None:
+    conn.create_function("YEAR", 1, _year, deterministic=True)
+    conn.create_function("MONTH", 1, _month, deterministic=True)
+    conn.create_function("WEEK", 1, _week, deterministic=True)
+    conn.create_function("WEEK", 2, _week, deterministic=True)
+    conn.create_function("DAYOFWEEK", 1, _dayofweek, deterministic=True)
+    conn.create_function("DATE_FORMAT", 2, _date_format, deterministic=True)
+    conn.create_function("NOW", 0, _now)
+    conn.create_function("VERSION", 0, lambda: f"SQLite {sqlite3.sqlite_version}")
+
+
+# ----------------------------- conexiones y cursores -----------------------------
+
+class SQLiteCursor:
+    """Cursor con la interfaz usada de `mysql.connector` (`dictionary=True`, `lastrowid` del primer id)."""
+
+    def __init__(self, connection: "SQLiteConnection", dictionary: bool) -> None:
+        self._connection = connection
+        self._cursor = connection.raw.cursor()
+        self._dictionary = dictionary
+        self._lastrowid: Optional[int] = None
+
+    def __enter__(self) -> "SQLiteCursor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._cursor.close()
+
+    def execute(self, query: str, params: Sequence[Any] | Dict[str, Any] = ()) -> None:
+        statement, locking = translate(query)
+        if locking and not self._connection.raw.in_transaction:
+            # SQLite bloquea la base completa: se toma el bloqueo de escritura antes de leer.
+            self._cursor.execute("BEGIN IMMEDIATE")
+        self._cursor.execute(statement, params or ())
+        self._lastrowid = self._cursor.lastrowid
+        if self._cursor.rowcount > 1 and statement.lstrip().upper().startswith("INSERT"):
+            # MySQL informa el id de la primera fila de un INSERT de varias filas; SQLite, el de la última.
+            self._lastrowid = self._cursor.lastrowid - self._cursor.rowcount + 1
+
+    def executemany(self, query: str, seq_params: Sequence[Sequence[Any]]) -> None:
+        statement, _ = translate(query)
+        self._cursor.executemany(statement, seq_params)
+        self._lastrowid = self._cursor.lastrowid
+
+    @property
+    def lastrowid(self) -> Optional[int]:
+        return self._lastrowid
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def description(self) -> Any:
+        return self._cursor.description
+
+    def _shape(self, row: Optional[Tuple[Any, ...]]) -> Any:
+        if row is None or not self._dictionary:
+            return row
+        return dict(zip((column[0] for column in self._cursor.description), row))
+
+    def fetchone(self) -> Any:
+        return self._shape(self._cursor.fetchone())
+
+    def fetchmany(self, size: int = 1) -> List[Any]:
+        return [self._shape(row) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self) -> List[Any]:
+        return [self._shape(row) for row in self._cursor.fetchall()]
+
+    def __iter__(self) -> Any:
+        return (self._shape(row) for row in self._cursor)
+
+
+class SQLiteConnection:
+    """Conexión SQLite con la interfaz de `mysql.connector`; el pool la presta con `InstrumentedPool`."""
+
+    def __init__(self, raw: sqlite3.Connection) -> None:
+        self.raw = raw
+
+    def __enter__(self) -> "SQLiteConnection":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def cursor(self, dictionary: bool = False, buffered: bool = True) -> SQLiteCursor:
+        # Los cursores de SQLite ya leen bajo demanda: `buffered` no cambia nada.
+        return SQLiteCursor(self, dictionary)
+
+    @property
+    def in_transaction(self) -> bool:
+        return self.raw.in_transaction
+
+    def is_connected(self) -> bool:
+        try:
+            self.raw.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def start_transaction(self) -> None:
+        if not self.raw.in_transaction:
+            self.raw.execute("BEGIN")
+
+    def commit(self) -> None:
+        self.raw.commit()
+
+    def rollback(self) -> None:
+        self.raw.rollback()
+
+    def close(self) -> None:
+        self.raw.close()
+
+
+def connect(path: str, timeout: float = 30.0) -> SQLiteConnection:
+    raw = sqlite3.connect(
+        path,
+        timeout=timeout,
+        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+        check_same_thread=False,
+    )
+    # WAL permite leer mientras otra conexión escribe; NORMAL basta para una instalación local.
+    raw.execute("PRAGMA journal_mode=WAL")
+    raw.execute("PRAGMA synchronous=NORMAL")
+    raw.execute("PRAGMA foreign_keys=ON")
+    _register_functions(raw)
+    return SQLiteConnection(raw)
+
+
+def create_schema(path: str) -> None:
+    """Crea el archivo y las tablas que falten; se llama una vez al crear el pool."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = connect(path)
+    try:
+        conn.raw.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    finally:
+        conn.close()
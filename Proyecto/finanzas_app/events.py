@@ -0,0 +1,79 @@
+"""Bus de eventos de datos: cada escritura confirmada de un repositorio publica un `DataChanged`.
+
+Los suscriptores (la caché de reportes, las vistas de la GUI) reciben la tabla
+tocada, la acción, los ids y los periodos (año, mes) afectados, y sólo
+recalculan lo que cae en esos periodos. Se llaman en el hilo que escribió y en
+orden de suscripción; un suscriptor que falla se registra en el log sin
+interrumpir a los demás ni a la escritura, que ya está confirmada.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, Iterable, List, Optional, Tuple
+
+Period = Tuple[Optional[int], Optional[int]]
+ALL_PERIODS: FrozenSet[Period] = frozenset({(None, None)})
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DataChanged:
+    """Una escritura confirmada.
+
+    `entity` es la tabla ("transaccion", "presupuesto", "categoria", "impuesto"
+    o "resumen_mensual"); `action` es "create", "update", "delete" o "rebuild".
+    Un periodo `(año, None)` abarca el año completo y `(None, None)`, todos.
+    `ids` va vacío cuando no se conocen con certeza (cargas por bloques, `rebuild`).
+    """
+
+    entity: str
+    action: str
+    ids: Tuple[int, ...] = ()
+    periods: FrozenSet[Period] = ALL_PERIODS
+
+    def affects(self, year: Optional[int] = None, month: Optional[int] = None) -> bool:
+        """Indica si el evento toca el periodo pedido; sin año, basta con que haya cambiado algo."""
+        for changed_year, changed_month in self.periods:
+            if changed_year is None or year is None:
+                return True
+            if changed_year == year and (changed_month is None or month is None or changed_month == month):
+                return True
+        return False
+
+
+Subscriber = Callable[[DataChanged], None]
+
+
+class EventBus:
+    """Publicación/suscripción síncrona y segura entre hilos."""
+
+    def __init__(self) -> None:
+        self._subscribers: List[Tuple[Subscriber, Optional[FrozenSet[str]]]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, subscriber: Subscriber, entities: Optional[Iterable[str]] = None) -> None:
+        """Registra `subscriber`; con `entities` sólo recibe los eventos de esas tablas."""
+        with self._lock:
+            self._subscribers.append((subscriber, frozenset(entities) if entities is not None else None))
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            self._subscribers = [entry for entry in self._subscribers if entry[0] != subscriber]
+
+    def publish(self, event: DataChanged) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber, entities in subscribers:
+            if entities is not None and event.entity not in entities:
+                continue
+            try:
+                subscriber(event)
+            except Exception:
+                logger.exception("El suscriptor %r falló con %s", subscriber, event)
+
+
+data_events = EventBus()
@@ -0,0 +1,357 @@
+"""Genera transacciones y presupuestos sintéticos reproducibles para poblar bases de prueba.
+
+Con la misma semilla, las mismas categorías y los mismos parámetros se obtiene
+exactamente la misma secuencia, así que una base de millones de filas puede
+recrearse en otra máquina para comparar tiempos. Los montos siguen las
+distribuciones de `scriptdb.py`: gastos e ingresos mensuales casi constantes
+alrededor de un monto base por categoría, gastos variables entre 5 y 300 e
+ingresos variables esporádicos (se descartan tres de cada cuatro) entre 50 y 600.
+
+La carga usa `TransaccionRepository.create_many` (INSERT de varias filas que
+mantiene `resumen_mensual`); en MySQL, `--csv` escribe antes un CSV y lo carga
+con `LOAD DATA LOCAL INFILE`, reconstruyendo el resumen al final.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import random
+import time
+from datetime import date, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .cache import report_cache
+from .config import SQLITE
+from .db.connection import DatabaseConnection
+from .models import Categoria, PresupuestoEspecifico, Transaccion
+from .repositories import (
+    CategoriaRepository,
+    PresupuestoEspecificoRepository,
+    ResumenMensualRepository,
+    TransaccionRepository,
+)
+
+GASTOS_FIJOS_BASE = {
+    "Alquiler": 450,
+    "Servicios básicos": 80,
+    "Internet y telefonía": 40,
+    "Transporte fijo": 30,
+    "Seguro de salud": 60,
+    "Educación": 150,
+    "Suscripciones": 20,
+    "Gastos bancarios": 5,
+}
+INGRESOS_FIJOS_BASE = {
+    "Sueldo mensual": 1200,
+    "Rentas": 300,
+}
+
+# Catálogo que se crea si la base no tiene categorías (p. ej. un archivo SQLite nuevo).
+CATEGORIAS_POR_DEFECTO = [
+    *(Categoria(nombre=nombre, periodicidad="mensual", tipo="gasto") for nombre in GASTOS_FIJOS_BASE),
+    *(
+        Categoria(nombre=nombre, periodicidad="variable", tipo="gasto")
+        for nombre in ("Supermercado", "Restaurantes", "Ocio", "Ropa", "Salud", "Regalos", "Mantenimiento hogar")
+    ),
+    Categoria(nombre="Viajes", periodicidad="anual", tipo="gasto"),
+    Categoria(nombre="Seguro del auto", periodicidad="anual", tipo="gasto"),
+    *(Categoria(nombre=nombre, periodicidad="mensual", tipo="ingreso") for nombre in INGRESOS_FIJOS_BASE),
+    *(Categoria(nombre=nombre, periodicidad="variable", tipo="ingreso") for nombre in ("Freelance", "Ventas", "Reembolsos")),
+]
+
+CSV_COLUMNS = ("fecha", "monto", "categoria", "cantidad", "descripcion")
+
+
+def monto_gasto_fijo(rng: random.Random, base: float) -> float:
+    """Gastos fijos casi constantes, variación mínima."""
+    return round(rng.uniform(base * 0.95, base * 1.05), 2)
+
+
+def monto_gasto_variable(rng: random.Random) -> float:
+    """Gastos variables pueden variar mucho."""
+    return round(rng.uniform(5, 300), 2)
+
+
+def monto_ingreso_fijo(rng: random.Random, base: float) -> float:
+    """Ingresos fijos casi constantes."""
+    return round(rng.uniform(base * 0.97, base * 1.03), 2)
+
+
+def monto_ingreso_variable(rng: random.Random) -> float:
+    """Ingresos variables esporádicos pero altos."""
+    return round(rng.uniform(50, 600), 2)
+
+
+def _es_fija(categoria: Categoria) -> bool:
+    return categoria.periodicidad == "mensual"
+
+
+def _montos_base(rng: random.Random, categorias: Sequence[Categoria]) -> Dict[int, float]:
+    """Monto base de cada categoría fija; las que no están en las tablas lo sortean una sola vez.
+
+    En `scriptdb.py` el sorteo se repetía en cada transacción, con lo que una
+    categoría fija desconocida no tenía un monto estable.
+    """
+    bases: Dict[int, float] = {}
+    for categoria in categorias:
+        if not _es_fija(categoria):
+            continue
+        if categoria.tipo == "gasto":
+            base = GASTOS_FIJOS_BASE.get(categoria.nombre or "") or rng.randint(30, 150)
+        else:
+            base = INGRESOS_FIJOS_BASE.get(categoria.nombre or "") or rng.randint(800, 1500)
+        bases[categoria.id_categoria] = base
+    return bases
+
+
+def generate_transactions(
+    categorias: Sequence[Categoria],
+    total: int,
+    desde: date,
+    hasta: date,
+    semilla: int = 42,
+) -> Iterator[Transaccion]:
+    """Genera `total` transacciones con fecha uniforme en [desde, hasta] y categoría uniforme.
+
+    Es un generador: las filas se producen a medida que `create_many` las consume,
+    así que la memoria no depende de `total`.
+    """
+    if not categorias:
+        raise ValueError("No hay categorías para generar transacciones")
+    if hasta < desde:
+        raise ValueError("La fecha final es anterior a la inicial")
+    # Orden estable: el resultado no depende del orden en que la base devuelve las categorías.
+    categorias = sorted(categorias, key=lambda categoria: categoria.id_categoria or 0)
+    rng = random.Random(semilla)
+    bases = _montos_base(rng, categorias)
+    dias = (hasta - desde).days + 1
+    generadas = 0
+    while generadas < total:
+        fecha = desde + timedelta(days=rng.randrange(dias))
+        categoria = rng.choice(categorias)
+        if categoria.tipo == "gasto":
+            if _es_fija(categoria):
+                monto = monto_gasto_fijo(rng, bases[categoria.id_categoria])
+            else:
+                monto = monto_gasto_variable(rng)
+        else:
+            if _es_fija(categoria):
+                monto = monto_ingreso_fijo(rng, bases[categoria.id_categoria])
+            else:
+                # ingresos variables son raros → se descartan tres de cada cuatro
+                if rng.random() < 0.75:
+                    continue
+                monto = monto_ingreso_variable(rng)
+        yield Transaccion(
+            monto=monto,
+            cantidad=1,
+            fecha=fecha,
+            categoria_id=categoria.id_categoria,
+            description=categoria.nombre,
+        )
+        generadas += 1
+
+
+def generate_budgets(
+    categorias: Sequence[Categoria],
+    desde: int,
+    hasta: int,
+    por_mes: int = 4,
+    semilla: int = 42,
+) -> Iterator[PresupuestoEspecifico]:
+    """`por_mes` presupuestos por mes entre 50 y 400 para categorías al azar.
+
+    Usan su propio generador aleatorio, así que no cambian con el número de transacciones.
+    """
+    ids = sorted(categoria.id_categoria for categoria in categorias if categoria.id_categoria is not None)
+    rng = random.Random(f"{semilla}-presupuestos")
+    for anio in range(desde, hasta + 1):
+        for mes in range(1, 13):
+            for categoria_id in rng.sample(ids, min(por_mes, len(ids))):
+                yield PresupuestoEspecifico(anio=anio, mes=mes, monto=round(rng.uniform(50, 400), 2), categoria_id=categoria_id)
+
+
+def ensure_categories(connection: DatabaseConnection) -> List[Categoria]:
+    """Categorías de la base; si no hay ninguna, crea `CATEGORIAS_POR_DEFECTO`."""
+    repo = CategoriaRepository(connection)
+    categorias = repo.list_all()
+    if categorias:
+        return categorias
+    for categoria in CATEGORIAS_POR_DEFECTO:
+        repo.create(Categoria(nombre=categoria.nombre, periodicidad=categoria.periodicidad, tipo=categoria.tipo))
+    return repo.list_all()
+
+
+def load_transactions(
+    connection: DatabaseConnection,
+    transacciones: Iterable[Transaccion],
+    chunk_size: int = 1000,
+    progress_every: int = 100_000,
+) -> int:
+    """Carga con `create_many` por tandas, informando el avance, y retorna el total."""
+    repo = TransaccionRepository(connection)
+    iterator = iter(transacciones)
+    cargadas = 0
+    tanda = max(chunk_size, progress_every - progress_every % chunk_size)
+    started = time.perf_counter()
+    while True:
+        insertadas = repo.create_many(islice(iterator, tanda), chunk_size=chunk_size)
+        if not insertadas:
+            break
+        cargadas += insertadas
+        elapsed = time.perf_counter() - started
+        print(f"  {cargadas:,} transacciones ({cargadas / elapsed:,.0f} filas/s)")
+    return cargadas
+
+
+def insert_budgets(
+    connection: DatabaseConnection,
+    categorias: Sequence[Categoria],
+    desde: int,
+    hasta: int,
+    por_mes: int = 4,
+    semilla: int = 42,
+) -> int:
+    repo = PresupuestoEspecificoRepository(connection)
+    insertados = 0
+    for presupuesto in generate_budgets(categorias, desde, hasta, por_mes, semilla):
+        repo.create(presupuesto)
+        insertados += 1
+    return insertados
+
+
+def populate(
+    connection: DatabaseConnection,
+    total: int,
+    desde: int,
+    hasta: int,
+    semilla: int = 42,
+    chunk_size: int = 1000,
+    presupuestos_por_mes: int = 4,
+) -> Tuple[int, int]:
+    """Crea las categorías si faltan y carga transacciones y presupuestos; retorna ambos totales."""
+    categorias = ensure_categories(connection)
+    print(f"Categorías: {len(categorias)}; generando {total:,} transacciones {desde}–{hasta}...")
+    transacciones = generate_transactions(categorias, total, date(desde, 1, 1), date(hasta, 12, 31), semilla=semilla)
+    cargadas = load_transactions(connection, transacciones, chunk_size=chunk_size)
+    print(f"Transacciones generadas: {cargadas:,}")
+    return cargadas, insert_budgets(connection, categorias, desde, hasta, presupuestos_por_mes, semilla)
+
+
+def write_csv(path: str | Path, transacciones: Iterable[Transaccion]) -> int:
+    """Escribe las transacciones con el formato que lee `importacion.py` y retorna las filas escritas."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    escritas = 0
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(CSV_COLUMNS)
+        for transaccion in transacciones:
+            writer.writerow(
+                (
+                    transaccion.fecha.isoformat(),
+                    f"{transaccion.monto:.2f}",
+                    transaccion.categoria_id,
+                    transaccion.cantidad,
+                    transaccion.description or "",
+                )
+            )
+            escritas += 1
+    return escritas
+
+
+def load_csv_infile(connection: DatabaseConnection, path: str | Path, years: Iterable[int] = ()) -> int:
+    """Carga un CSV de `write_csv` con `LOAD DATA LOCAL INFILE` y reconstruye `resumen_mensual`.
+
+    Sólo MySQL; usa una conexión aparte con `allow_local_infile`, que el pool no
+    habilita, y el servidor debe tener `local_infile=ON`. `years` son los años que
+    cubre el CSV: sus instantáneas Parquet se descartan, como tras cualquier escritura.
+    """
+    if connection.backend == SQLITE:
+        raise ValueError("LOAD DATA LOCAL INFILE sólo está disponible con MySQL")
+    import mysql.connector
+
+    config = connection.config
+    conn = mysql.connector.connect(
+        host=config.host,
+        port=config.port,
+        user=config.user,
+        password=config.password,
+        database=config.database,
+        allow_local_infile=True,
+    )
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                LOAD DATA LOCAL INFILE %s INTO TABLE transaccion
+                CHARACTER SET utf8mb4
+                FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"'
+                LINES TERMINATED BY '\\n'
+                IGNORE 1 LINES
+                (fecha, monto, Categoria_Id_Categoria, cantidad, description)
+                """,
+                (str(Path(path).resolve()),),
+            )
+            cargadas = cursor.rowcount
+        conn.commit()
+    finally:
+        conn.close()
+    # La carga no pasa por el repositorio: el resumen, la caché y las instantáneas se rehacen aparte.
+    ResumenMensualRepository(connection).rebuild()
+    report_cache.clear()
+    if os.getenv("FINANZAS_SNAPSHOT_DIR"):
+        from .db.snapshot import discard_years
+
+        discard_years(connection, years)
+    return cargadas
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    hoy = date.today()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transacciones", type=int, default=1_000_000, help="Transacciones a generar.")
+    parser.add_argument("--desde", type=int, default=hoy.year - 9, help="Primer año (por defecto, hace nueve años).")
+    parser.add_argument("--hasta", type=int, default=hoy.year, help="Último año (por defecto, el actual).")
+    parser.add_argument("--semilla", type=int, default=42, help="Semilla; la misma semilla reproduce los mismos datos.")
+    parser.add_argument("--bloque", type=int, default=1000, help="Filas por INSERT/commit.")
+    parser.add_argument("--presupuestos-por-mes", type=int, default=4, help="Presupuestos por mes (0 para omitirlos).")
+    parser.add_argument("--csv", default=None, help="Escribe el CSV en esta ruta y lo carga con LOAD DATA LOCAL INFILE.")
+    args = parser.parse_args(argv)
+
+    connection = DatabaseConnection()
+    if args.csv and connection.backend == SQLITE:
+        # Se rechaza antes de escribir un CSV de millones de filas que no se podría cargar.
+        parser.error("--csv usa LOAD DATA LOCAL INFILE, que sólo está disponible con MySQL")
+    if args.csv:
+        categorias = ensure_categories(connection)
+        transacciones = generate_transactions(
+            categorias,
+            args.transacciones,
+            date(args.desde, 1, 1),
+            date(args.hasta, 12, 31),
+            semilla=args.semilla,
+        )
+        write_csv(args.csv, transacciones)
+        total = load_csv_infile(connection, args.csv, range(args.desde, args.hasta + 1))
+        print(f"Transacciones generadas: {total:,}")
+        presupuestos = insert_budgets(connection, categorias, args.desde, args.hasta, args.presupuestos_por_mes, args.semilla)
+    else:
+        total, presupuestos = populate(
+            connection,
+            args.transacciones,
+            args.desde,
+            args.hasta,
+            semilla=args.semilla,
+            chunk_size=args.bloque,
+            presupuestos_por_mes=args.presupuestos_por_mes,
+        )
+    print(f"Presupuestos específicos generados: {presupuestos:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,19 @@
 from __future__ import annotations
 
-from .main import main
 
-__all__ = ["main"]
+def run() -> None:
+    """Abre la aplicación; `gui.app` se importa recién al llamarla."""
+    # Importar la GUI bajo demanda permite que `python -m finanzas_app.gui` mida
+    # el arranque desde el principio. La ventana vive en `gui/app.py` y no en
+    # `gui/main.py`: al importarse un submódulo `gui.main`, Python fijaría ese
+    # atributo del paquete al módulo y taparía la función `main`.
+    from .app import main as app_main
+
+    app_main()
+
+
+# Nombre histórico del punto de entrada (`from finanzas_app.gui import main`).
+main = run
+
+
+__all__ = ["main", "run"]
@@ -0,0 +1,154 @@
+"""Arranca la GUI o mide su arranque en frío.
+
+    python -m finanzas_app.gui
+    python -m finanzas_app.gui --perfil-arranque [--repeticiones 5] [--salida arranque.json]
+
+Con `--perfil-arranque` se lanzan procesos nuevos de la aplicación (con
+`-X importtime`) y se mide, desde el lanzamiento, cuánto tarda cada uno en
+importar `gui.app`, construir la ventana, pintarla por primera vez y mostrar
+los indicadores del tablero. También se registra qué librerías pesadas ya
+estaban cargadas al primer pintado (deberían ser ninguna) y los módulos con
+mayor tiempo de importación acumulado. El resultado se escribe en JSON en
+`FINANZAS_PERFIL_DIR` (por defecto `~/.finanzas_app/perfiles`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib", "plotnine", "sklearn", "joblib", "pyarrow", "mysql.connector")
+# Si el tablero no termina de cargar (p. ej. sin base de datos), el proceso medido se cierra igual.
+MEASURE_TIMEOUT_MS = 60_000
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _measure_startup() -> None:
+    """Proceso medido: abre la app, anota los hitos y los imprime como JSON al estar el tablero listo."""
+    marks: Dict[str, Any] = {"main_started": time.time()}
+    from .dashboard import DashboardFrame
+    from .app import FinanceApp
+
+    marks["imports_done"] = time.time()
+    app = FinanceApp()
+    marks["window_built"] = time.time()
+
+    def on_map(event: Any) -> None:
+        if event.widget is app and "first_paint" not in marks:
+            app.update_idletasks()
+            marks["first_paint"] = time.time()
+            marks["heavy_modules_at_first_paint"] = [name for name in HEAVY_MODULES if name in sys.modules]
+
+    def finish(timed_out: bool = False) -> None:
+        if "done" in marks:
+            return
+        marks["done"] = True
+        if timed_out:
+            marks["timed_out"] = True
+        else:
+            marks["dashboard_ready"] = time.time()
+        print(json.dumps(marks), flush=True)
+        app.after(0, app.destroy)
+
+    app.bind("<Map>", on_map, add="+")
+    app.bind(DashboardFrame.READY_EVENT, lambda _event: finish(), add="+")
+    app.after(MEASURE_TIMEOUT_MS, lambda: finish(timed_out=True))
+    app.mainloop()
+
+
+def _slowest_imports(stderr: str, limit: int = 15) -> List[Dict[str, Any]]:
+    """Módulos con mayor tiempo de importación acumulado según la salida de `-X importtime`."""
+    imports = []
+    for match in _IMPORTTIME.finditer(stderr):
+        self_us, cumulative_us, indent, module = match.groups()
+        imports.append({
+            "module": module,
+            "cumulative_ms": int(cumulative_us) / 1000,
+            "self_ms": int(self_us) / 1000,
+            "depth": len(indent) // 2,
+        })
+    return sorted(imports, key=lambda row: row["cumulative_ms"], reverse=True)[:limit]
+
+
+def _profile_once() -> Dict[str, Any]:
+    launched = time.time()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "finanzas_app.gui", "--medir"],
+        capture_output=True,
+        text=True,
+        check=False,
+        # Desde la carpeta del proyecto, para que el proceso hijo encuentre el paquete.
+        cwd=Path(__file__).resolve().parents[2],
+    )
+    lines = [line for line in completed.stdout.splitlines() if line.startswith("{")]
+    if completed.returncode != 0 or not lines:
+        raise RuntimeError(f"La aplicación medida terminó con código {completed.returncode}:\n{completed.stderr[-2000:]}")
+    marks = json.loads(lines[-1])
+    run = {
+        f"{name}_ms": round((marks[name] - launched) * 1000, 1)
+        for name in ("main_started", "imports_done", "window_built", "first_paint", "dashboard_ready")
+        if name in marks
+    }
+    run["timed_out"] = marks.get("timed_out", False)
+    run["heavy_modules_at_first_paint"] = marks.get("heavy_modules_at_first_paint", [])
+    run["slowest_imports"] = _slowest_imports(completed.stderr)
+    return run
+
+
+def _profile(repetitions: int, output: Optional[str]) -> Path:
+    runs = [_profile_once() for _ in range(max(1, repetitions))]
+    summary = {
+        key: round(statistics.median(run[key] for run in runs), 1)
+        for key in runs[0]
+        if key.endswith("_ms") and all(key in run for run in runs)
+    }
+    payload = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "median": summary,
+        "runs": runs,
+    }
+    if output:
+        path = Path(output)
+    else:
+        directory = Path(os.getenv("FINANZAS_PERFIL_DIR", Path.home() / ".finanzas_app" / "perfiles"))
+        path = directory / f"arranque_{datetime.now():%Y%m%d_%H%M%S}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    for key, value in summary.items():
+        print(f"{key[:-3]:<16} {value:>8.1f} ms")
+    heavy = runs[-1]["heavy_modules_at_first_paint"]
+    print(f"Librerías pesadas al primer pintado: {', '.join(heavy) if heavy else 'ninguna'}")
+    print(f"Perfil de arranque en {path}")
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--perfil-arranque", action="store_true", help="Mide el arranque en frío en procesos nuevos.")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Arranques medidos con --perfil-arranque.")
+    parser.add_argument("--salida", default=None, help="JSON del perfil (por defecto, en FINANZAS_PERFIL_DIR).")
+    parser.add_argument("--medir", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.medir:
+        _measure_startup()
+    elif args.perfil_arranque:
+        _profile(args.repeticiones, args.salida)
+    else:
+        from . import run
+
+        run()
+
+
+if __name__ == "__main__":
+    main()
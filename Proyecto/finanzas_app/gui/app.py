@@ -2,16 +2,24 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import PhotoImage
+from typing import Dict, Tuple
 
-from .dashboard import DashboardFrame
-from .gastos import GastosFrame
-from .impuestos import ImpuestosFrame
-from .ingresos import IngresosFrame
-from .prediccion import PrediccionFrame
-from .presupuestos import PresupuestosFrame
-from .reportes import ReportesFrame
-from .transacciones import TransactionForm
+from ..db.profiler import query_profiler
 from .theme import Theme
+from .view_manager import ViewManager
+
+# Cada vista se importa la primera vez que se abre: así la ventana aparece sin cargar
+# pandas, plotnine, matplotlib, scikit-learn ni el conector de MySQL.
+VIEWS: Dict[str, Tuple[str, str]] = {
+    "Dashboard": (".dashboard", "DashboardFrame"),
+    "Registrar transacción": (".transacciones", "TransactionForm"),
+    "Objetivos": (".presupuestos", "PresupuestosFrame"),
+    "Gastos": (".gastos", "GastosFrame"),
+    "Ingresos": (".ingresos", "IngresosFrame"),
+    "Impuestos": (".impuestos", "ImpuestosFrame"),
+    "Predicción": (".prediccion", "PrediccionFrame"),
+    "Reportes": (".reportes", "ReportesFrame"),
+}
 
 
 class FinanceApp(tk.Tk):
@@ -25,20 +33,19 @@ class FinanceApp(tk.Tk):
         self.configure(bg=Theme.BACKGROUND)
         self._set_window_icon()
 
-        self._view_factories = {
-            "Dashboard": lambda parent: DashboardFrame(parent),
-            "Registrar transacción": lambda parent: TransactionForm(parent),
-            "Objetivos": lambda parent: PresupuestosFrame(parent),
-            "Gastos": lambda parent: GastosFrame(parent),
-            "Ingresos": lambda parent: IngresosFrame(parent),
-            "Impuestos": lambda parent: ImpuestosFrame(parent),
-            "Predicción": lambda parent: PrediccionFrame(parent),
-            "Reportes": lambda parent: ReportesFrame(parent),
-        }
-        self._current_view: tk.Widget | None = None
+        self._views: ViewManager | None = None
         self._logo_image: PhotoImage | None = None
 
         self._build_ui()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self) -> None:
+        if query_profiler.enabled:
+            # El resumen de consultas de la sesión queda en FINANZAS_PERFIL_DIR.
+            query_profiler.export_session()
+        if self._views is not None:
+            self._views.close()
+        self.destroy()
 
     def _build_ui(self) -> None:
         container = tk.Frame(self, bg=Theme.BACKGROUND)
@@ -49,6 +56,8 @@ class FinanceApp(tk.Tk):
 
         self._content_area = tk.Frame(container, bg=Theme.BACKGROUND)
         self._content_area.pack(side="right", fill="both", expand=True)
+        # Las vistas abiertas se conservan ocultas; cambiar de pestaña no vuelve a consultar la base.
+        self._views = ViewManager(self._content_area, VIEWS, __package__)
 
         logo_label = tk.Label(sidebar, bg=Theme.SIDEBAR_BG)
         try:
@@ -67,7 +76,7 @@ class FinanceApp(tk.Tk):
             fg="white",
         ).pack(pady=(0, 8))
 
-        for label in self._view_factories:
+        for label in VIEWS:
             btn = tk.Button(
                 sidebar,
                 text=label,
@@ -85,13 +94,8 @@ class FinanceApp(tk.Tk):
         self._show_view("Dashboard")
 
     def _show_view(self, name: str) -> None:
-        if self._current_view is not None:
-            self._current_view.destroy()
-        factory = self._view_factories.get(name)
-        if factory is None:
-            return
-        self._current_view = factory(self._content_area)
-        self._current_view.pack(fill="both", expand=True)
+        if self._views is not None:
+            self._views.show(name)
 
     def _set_window_icon(self) -> None:
         # Usa el chancho como icono de ventana para que Windows y la barra de título lo muestren.
@@ -0,0 +1,111 @@
+"""Contenedor de gráficos que construye las figuras fuera del hilo de Tkinter."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+import tkinter as tk
+
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+from .theme import Theme
+
+FigureBuilder = Callable[[], Figure]
+
+# Un único hilo compartido por todos los paneles: las consultas y `plot.draw()` no
+# bloquean el bucle de eventos, y las figuras se construyen de a una porque los temas
+# de plotnine modifican `rcParams` globales y el estado de pyplot no es seguro entre hilos.
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart")
+
+
+class ChartPanel(tk.Frame):
+    """Muestra la figura devuelta por `show(builder)` y la adapta al tamaño del panel.
+
+    - `builder` (consulta + figura) corre en un hilo del pool y el resultado vuelve
+      al hilo de Tk con `after()`; si llega una petición más nueva, la anterior se descarta.
+    - Los `<Configure>` se agrupan: tras `RESIZE_DELAY_MS` sin cambios sólo se
+      reescala el lienzo existente, sin volver a consultar ni reconstruir la figura.
+    """
+
+    RESIZE_DELAY_MS = 150
+    POLL_MS = 40
+
+    def __init__(self, parent: tk.Misc, bg: str = Theme.CARD_BG, **kwargs) -> None:
+        super().__init__(parent, bg=bg, **kwargs)
+        self._canvas: Optional[FigureCanvasTkAgg] = None
+        self._message: Optional[tk.Label] = None
+        self._generation = 0
+        self._poll_job: Optional[str] = None
+        self._resize_job: Optional[str] = None
+        self._pending_resize: Optional[tk.Event] = None
+        self._destroyed = False
+
+    def show(self, builder: FigureBuilder) -> None:
+        """Pide una figura nueva; sólo la petición más reciente llega a dibujarse."""
+        self._generation += 1
+        future = _EXECUTOR.submit(builder)
+        self._schedule_poll(self._generation, future)
+
+    def destroy(self) -> None:
+        self._destroyed = True
+        for job in (self._poll_job, self._resize_job):
+            if job is not None:
+                self.after_cancel(job)
+        super().destroy()
+
+    def _schedule_poll(self, generation: int, future: "Future[Figure]") -> None:
+        if self._poll_job is not None:
+            self.after_cancel(self._poll_job)
+        self._poll_job = self.after(self.POLL_MS, lambda: self._poll(generation, future))
+
+    def _poll(self, generation: int, future: "Future[Figure]") -> None:
+        self._poll_job = None
+        if self._destroyed or generation != self._generation:
+            return
+        if not future.done():
+            self._schedule_poll(generation, future)
+            return
+        try:
+            figure = future.result()
+        except Exception as exc:  # pragma: no cover - interactivo
+            self._show_message(f"No se pudo generar el gráfico: {exc}")
+            return
+        self._install(figure)
+
+    def _install(self, figure: Figure) -> None:
+        self._clear()
+        canvas = FigureCanvasTkAgg(figure, master=self)
+        widget = canvas.get_tk_widget()
+        # Se reemplaza el redibujado inmediato de matplotlib por uno agrupado.
+        widget.unbind("<Configure>")
+        widget.bind("<Configure>", self._on_configure)
+        canvas.draw()
+        widget.pack(fill="both", expand=True)
+        self._canvas = canvas
+
+    def _on_configure(self, event: tk.Event) -> None:
+        self._pending_resize = event
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(self.RESIZE_DELAY_MS, self._apply_resize)
+
+    def _apply_resize(self) -> None:
+        self._resize_job = None
+        event, self._pending_resize = self._pending_resize, None
+        if self._canvas is not None and event is not None and not self._destroyed:
+            self._canvas.resize(event)
+
+    def _show_message(self, text: str) -> None:
+        self._clear()
+        self._message = tk.Label(self, text=text, bg=self.cget("bg"), fg=Theme.SECONDARY_TEXT)
+        self._message.pack(fill="both", expand=True)
+
+    def _clear(self) -> None:
+        if self._canvas is not None:
+            self._canvas.get_tk_widget().destroy()
+            self._canvas = None
+        if self._message is not None:
+            self._message.destroy()
+            self._message = None
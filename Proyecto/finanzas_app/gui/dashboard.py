@@ -1,21 +1,25 @@
-"""Tablero principal que resume indicadores clave."""
+"""Tablero principal que resume indicadores clave.
+
+Es la primera vista de la aplicación, así que no importa nada pesado al cargarse:
+se dibuja un esqueleto con los textos de carga y en un hilo aparte se calculan
+los indicadores y se importan `logic.graficos` y `chart_panel` (pandas, plotnine,
+matplotlib). Los resultados vuelven al hilo de Tk por una cola leída con `after()`.
+"""
 
 from __future__ import annotations
 
+import queue
+import threading
+from calendar import month_name
 from datetime import datetime
+from typing import Any, Sequence, Tuple
 import tkinter as tk
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-
-from ..logic.calculos import obtener_dashboard_stats
-from ..logic.graficos import (
-    budget_pie_figure,
-    monthly_comparison_data,
-    objective_comparison_figure,
-)
+from ..events import DataChanged
 from .theme import Theme
 
+LOADING_TEXT = "…"
+
 
 def _format_currency(value: float | None) -> str:
     if value is None:
@@ -26,10 +30,20 @@ def _format_currency(value: float | None) -> str:
 class DashboardFrame(tk.Frame):
     """Vista de estados financieros para mostrar la información inicial."""
 
+    POLL_MS = 40
+    # Tablas que alimentan los indicadores y los dos gráficos (ver `ViewManager`).
+    DEPENDS_ON = frozenset({"transaccion", "presupuesto", "resumen_mensual"})
+    # Se emite cuando los indicadores ya están en pantalla (lo usa el perfil de arranque).
+    READY_EVENT = "<<DashboardListo>>"
+
     def __init__(self, parent: tk.Misc) -> None:
         super().__init__(parent, padx=24, pady=24, bg=Theme.BACKGROUND)
-        stats = obtener_dashboard_stats()
-        period_label, _ = monthly_comparison_data()
+        self._events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        self._value_labels: dict[str, tk.Label] = {}
+        self._bar_container: Any = None
+        self._pie_container: Any = None
+        # Cargas en curso: cada hilo termina con "charts" o "charts_error".
+        self._pending_loads = 0
 
         # Encabezado con saludo y periodo actual para el usuario.
         tk.Label(
@@ -40,24 +54,25 @@ class DashboardFrame(tk.Frame):
             bg=Theme.BACKGROUND,
             fg=Theme.PRIMARY_TEXT,
         ).grid(row=0, column=0, columnspan=2, sticky="w")
-        tk.Label(
+        self._period_label = tk.Label(
             self,
-            text=f"Estadísticas del {period_label}",
+            text="Cargando estadísticas…",
             font=(None, 10),
             fg=Theme.SECONDARY_TEXT,
             bg=Theme.BACKGROUND,
-        ).grid(row=1, column=0, columnspan=2, sticky="w", pady=(0, 12))
+        )
+        self._period_label.grid(row=1, column=0, columnspan=2, sticky="w", pady=(0, 12))
 
         rows = [
-            ("Ahorro mensual", _format_currency(stats.get("monthly_savings"))),
-            ("Gastos del mes", _format_currency(stats.get("monthly_expenses"))),
-            ("Ingresos del mes", _format_currency(stats.get("monthly_incomes"))),
-            ("Presupuesto mes", _format_currency(stats.get("monthly_budget"))),
+            ("monthly_savings", "Ahorro mensual"),
+            ("monthly_expenses", "Gastos del mes"),
+            ("monthly_incomes", "Ingresos del mes"),
+            ("monthly_budget", "Presupuesto mes"),
         ]
         self.columnconfigure(0, weight=1)
         self.columnconfigure(1, weight=1)
 
-        for idx, (label_text, value) in enumerate(rows, start=2):
+        for idx, (field, label_text) in enumerate(rows, start=2):
             row_frame = tk.Frame(self, bg=Theme.CARD_BG)
             row_frame.grid(row=idx, column=0, columnspan=2, sticky="ew", pady=4)
             tk.Label(
@@ -68,15 +83,17 @@ class DashboardFrame(tk.Frame):
                 bg=Theme.CARD_BG,
                 fg=Theme.PRIMARY_TEXT,
             ).pack(side="left")
-            tk.Label(
+            value_label = tk.Label(
                 row_frame,
-                text=value,
+                text=LOADING_TEXT,
                 width=12,
                 anchor="e",
                 font=(None, 12, "bold"),
                 bg=Theme.CARD_BG,
                 fg=Theme.ACTION_COLOR,
-            ).pack(side="right")
+            )
+            value_label.pack(side="right")
+            self._value_labels[field] = value_label
 
         # Espacio para los gráficos lado a lado.
         # Cada sección gráfica usa el fondo general para mantener la jerarquía visual.
@@ -85,7 +102,7 @@ class DashboardFrame(tk.Frame):
         charts_container.columnconfigure(0, weight=1)
         charts_container.columnconfigure(1, weight=1)
 
-        bar_frame = tk.LabelFrame(
+        self._bar_frame = tk.LabelFrame(
             charts_container,
             text="Gastos vs Ingresos",
             padx=12,
@@ -93,8 +110,8 @@ class DashboardFrame(tk.Frame):
             bg=Theme.CARD_BG,
             fg=Theme.PRIMARY_TEXT,
         )
-        bar_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 8))
-        pie_frame = tk.LabelFrame(
+        self._bar_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 8))
+        self._pie_frame = tk.LabelFrame(
             charts_container,
             text="Presupuesto específico",
             padx=12,
@@ -102,46 +119,112 @@ class DashboardFrame(tk.Frame):
             bg=Theme.CARD_BG,
             fg=Theme.PRIMARY_TEXT,
         )
-        pie_frame.grid(row=0, column=1, sticky="nsew", padx=(8, 0))
-
-        self._bar_canvas: FigureCanvasTkAgg | None = None
-        self._pie_canvas: FigureCanvasTkAgg | None = None
+        self._pie_frame.grid(row=0, column=1, sticky="nsew", padx=(8, 0))
+        for frame in (self._bar_frame, self._pie_frame):
+            tk.Label(frame, text="Cargando gráfico…", bg=Theme.CARD_BG, fg=Theme.SECONDARY_TEXT).pack(
+                fill="both", expand=True
+            )
+
+        self._load_in_background()
+
+    def refresh(self, events: Sequence[DataChanged] = ()) -> None:
+        """Vuelve a calcular indicadores y gráficos si cambió el año en curso.
+
+        Los KPIs acumulan el año completo y los gráficos muestran el mes actual; los
+        valores anteriores quedan en pantalla hasta tener los nuevos.
+        """
+        year, _ = self._current_period()
+        if events and not any(event.affects(year) for event in events):
+            return
+        self._load_in_background()
+
+    def _load_in_background(self) -> None:
+        """Indicadores e importación de los módulos de gráficos, fuera del hilo de Tk."""
+        events = self._events
+
+        def run() -> None:
+            try:
+                from ..logic.calculos import obtener_dashboard_stats
+
+                events.put(("stats", obtener_dashboard_stats()))
+            except Exception as exc:  # pragma: no cover - interactivo
+                events.put(("stats_error", exc))
+            try:
+                from ..logic import graficos
+                from . import chart_panel
+
+                events.put(("charts", None))
+            except Exception as exc:  # pragma: no cover - interactivo
+                events.put(("charts_error", exc))
+
+        threading.Thread(target=run, daemon=True).start()
+        self._pending_loads += 1
+        if self._pending_loads == 1:
+            self.after(self.POLL_MS, self._poll_events)
+
+    def _poll_events(self) -> None:
+        if not self.winfo_exists():
+            # Se cerró la ventana antes de que terminara la carga.
+            return
+        while True:
+            try:
+                kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "stats":
+                self._show_stats(payload)
+            elif kind == "stats_error":
+                self._period_label.config(text=f"No se pudieron cargar las estadísticas: {payload}", fg="#a00")
+                self.event_generate(self.READY_EVENT)
+            elif kind == "charts":
+                if self._bar_container is None:
+                    self._install_charts()
+                else:
+                    self._refresh_bar_chart()
+                    self._refresh_pie_chart()
+                self._pending_loads -= 1
+            elif kind == "charts_error":
+                for frame in (self._bar_frame, self._pie_frame):
+                    for child in frame.winfo_children():
+                        child.config(text=f"No se pudo generar el gráfico: {payload}")
+                self._pending_loads -= 1
+        if self._pending_loads:
+            self.after(self.POLL_MS, self._poll_events)
+
+    def _show_stats(self, stats: Any) -> None:
+        # La etiqueta sale del propio resultado para no consultar de nuevo la base.
+        self._period_label.config(text=f"Estadísticas del {month_name[stats.month]} {stats.year}", fg=Theme.SECONDARY_TEXT)
+        for field, label in self._value_labels.items():
+            label.config(text=_format_currency(getattr(stats, field)))
+        self.event_generate(self.READY_EVENT)
+
+    def _install_charts(self) -> None:
+        from .chart_panel import ChartPanel
+
+        for frame in (self._bar_frame, self._pie_frame):
+            for child in frame.winfo_children():
+                child.destroy()
         # Los contenedores de los gráficos heredan el fondo de la tarjeta para evitar contrastes bruscos.
-        self._bar_container = tk.Frame(bar_frame, bg=Theme.CARD_BG)
+        self._bar_container = ChartPanel(self._bar_frame)
         self._bar_container.pack(fill="both", expand=True)
-        self._pie_container = tk.Frame(pie_frame, bg=Theme.CARD_BG)
+        self._pie_container = ChartPanel(self._pie_frame)
         self._pie_container.pack(fill="both", expand=True)
 
-        self._bar_container.bind("<Configure>", lambda _: self._refresh_bar_chart())
-        self._pie_container.bind("<Configure>", lambda _: self._refresh_pie_chart())
-
         self._refresh_bar_chart()
         self._refresh_pie_chart()
 
     def _refresh_bar_chart(self) -> None:
+        from ..logic.graficos import objective_comparison_figure
+
         year, month = self._current_period()
-        figure = objective_comparison_figure(year, month)
-        self._bar_canvas = self._render_figure_on_container(self._bar_container, figure, self._bar_canvas)
+        self._bar_container.show(lambda: objective_comparison_figure(year, month))
 
     def _refresh_pie_chart(self) -> None:
+        from ..logic.graficos import budget_pie_figure
+
         year, month = self._current_period()
-        figure = budget_pie_figure(year, month)
-        self._pie_canvas = self._render_figure_on_container(self._pie_container, figure, self._pie_canvas)
+        self._pie_container.show(lambda: budget_pie_figure(year, month))
 
     def _current_period(self) -> tuple[int, int]:
         now = datetime.now()
         return now.year, now.month
-
-    def _render_figure_on_container(
-        self,
-        container: tk.Misc,
-        figure: Figure,
-        existing: FigureCanvasTkAgg | None,
-    ) -> FigureCanvasTkAgg:
-        if existing:
-            existing.get_tk_widget().destroy()
-        canvas = FigureCanvasTkAgg(figure, master=container)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
-        # Mantiene la referencia para poder re-renderizar rápidamente cuando cambie el tamaño.
-        return canvas
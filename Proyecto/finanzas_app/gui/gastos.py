@@ -3,19 +3,20 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Sequence
 
 import tkinter as tk
 from tkinter import ttk, messagebox
 
 from ..db.connection import DatabaseConnection
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from ..events import DataChanged
 from ..logic.graficos import (
     fixed_category_stacked_figure,
     variable_annual_trend_figure,
     variable_month_pie_figure,
 )
 from ..repositories import CategoriaRepository, FinancialReportRepository, TransaccionRepository
+from .chart_panel import ChartPanel
 from .theme import Theme
 
 
@@ -40,6 +41,8 @@ def _make_tree(frame: tk.Frame, title: str, columns: tuple[str, ...]) -> ttk.Tre
 class GastosFrame(tk.Frame):
     """Panel con secciones para gastos fijos, variables y por categoría."""
 
+    DEPENDS_ON = frozenset({"transaccion", "resumen_mensual"})
+
     def __init__(self, parent: tk.Misc) -> None:
         super().__init__(parent, padx=12, pady=12, bg=Theme.BACKGROUND)
         # La vista completa se dibuja dentro de un canvas desplazable para poder navegar el panel.
@@ -68,12 +71,9 @@ class GastosFrame(tk.Frame):
         self._category_catalog = {cat.nombre: cat.id_categoria for cat in categories}
         self._category_var.set("Todas")
 
-        self._fixed_chart_container: tk.Frame | None = None
-        self._fixed_chart_canvas: FigureCanvasTkAgg | None = None
-        self._variable_month_chart_container: tk.Frame | None = None
-        self._variable_month_chart_canvas: FigureCanvasTkAgg | None = None
-        self._variable_year_chart_container: tk.Frame | None = None
-        self._variable_year_chart_canvas: FigureCanvasTkAgg | None = None
+        self._fixed_chart_container: ChartPanel | None = None
+        self._variable_month_chart_container: ChartPanel | None = None
+        self._variable_year_chart_container: ChartPanel | None = None
 
         # El fondo del canvas se mantiene coherente con el tema principal.
         # Encabezado contextual para explicar el propósito de este panel.
@@ -280,9 +280,8 @@ class GastosFrame(tk.Frame):
             fg="white",
             activebackground=Theme.ACTION_HOVER,
         ).pack(side="left")
-        self._fixed_chart_container = tk.Frame(section, bg=Theme.CARD_BG)
+        self._fixed_chart_container = ChartPanel(section)
         self._fixed_chart_container.pack(fill="both", expand=True, pady=(0, 8))
-        self._fixed_chart_container.bind("<Configure>", lambda _: self._refresh_fixed_chart())
 
         variable_pie_frame = tk.LabelFrame(
             section,
@@ -293,9 +292,8 @@ class GastosFrame(tk.Frame):
             fg=Theme.PRIMARY_TEXT,
         )
         variable_pie_frame.pack(fill="x", pady=(0, 8))
-        self._variable_month_chart_container = tk.Frame(section, bg=Theme.CARD_BG)
+        self._variable_month_chart_container = ChartPanel(section)
         self._variable_month_chart_container.pack(fill="both", expand=True, pady=(0, 8))
-        self._variable_month_chart_container.bind("<Configure>", lambda _: self._refresh_variable_month_chart())
 
         variable_year_frame = tk.LabelFrame(
             section,
@@ -320,9 +318,8 @@ class GastosFrame(tk.Frame):
             fg="white",
             activebackground=Theme.ACTION_HOVER,
         ).pack(side="left")
-        self._variable_year_chart_container = tk.Frame(section, bg=Theme.CARD_BG)
+        self._variable_year_chart_container = ChartPanel(section)
         self._variable_year_chart_container.pack(fill="both", expand=True)
-        self._variable_year_chart_container.bind("<Configure>", lambda _: self._refresh_variable_year_chart())
 
     def _refresh_category_history(self) -> None:
         selected = self._category_var.get()
@@ -362,29 +359,22 @@ class GastosFrame(tk.Frame):
         year = self._parse_year_from_var(self._global_year_var, "Año compartido (gráfico fijos)")
         if year is None or self._fixed_chart_container is None:
             return
-        figure = fixed_category_stacked_figure(year)
-        self._fixed_chart_canvas = self._render_figure_on_container(
-            self._fixed_chart_container, figure, self._fixed_chart_canvas
-        )
+        self._fixed_chart_container.show(lambda: fixed_category_stacked_figure(year))
 
     def _refresh_variable_month_chart(self) -> None:
         year = self._parse_year_from_var(self._global_year_var, "Año compartido (gráfico variables mensuales)")
         month = self._parse_month_from_var(self._variable_month_var)
         if year is None or month is None or self._variable_month_chart_container is None:
             return
-        figure = variable_month_pie_figure(year, month)
-        self._variable_month_chart_canvas = self._render_figure_on_container(
-            self._variable_month_chart_container, figure, self._variable_month_chart_canvas
-        )
+        self._variable_month_chart_container.show(lambda: variable_month_pie_figure(year, month))
 
     def _refresh_variable_year_chart(self) -> None:
         year = self._parse_year_from_var(self._global_year_var, "Año compartido (gráfico variables anuales)")
         if year is None or self._variable_year_chart_container is None:
             return
         category_id, label = self._selected_category_filter()
-        figure = variable_annual_trend_figure(year, category_id=category_id, category_label=label)
-        self._variable_year_chart_canvas = self._render_figure_on_container(
-            self._variable_year_chart_container, figure, self._variable_year_chart_canvas
+        self._variable_year_chart_container.show(
+            lambda: variable_annual_trend_figure(year, category_id=category_id, category_label=label)
         )
 
     def _selected_category_filter(self) -> tuple[Optional[int], str]:
@@ -393,6 +383,27 @@ class GastosFrame(tk.Frame):
             return None, "Todas"
         return self._category_catalog.get(selected), selected
 
+    def refresh(self, events: Sequence[DataChanged] = ()) -> None:
+        """Recarga sólo las secciones cuyo año o mes elegido tocan los eventos."""
+        try:
+            year = int(self._global_year_var.get())
+            fixed_month = int(self._fixed_month_var.get())
+            variable_month = int(self._variable_month_var.get())
+        except ValueError:
+            return
+        if not events:
+            self._refresh_all_views()
+            return
+        if not any(event.affects(year) for event in events):
+            return
+        if any(event.affects(year, fixed_month) for event in events):
+            self._refresh_fixed()
+        if any(event.affects(year, variable_month) for event in events):
+            # También redibuja el gráfico de variables del mes.
+            self._refresh_variable()
+        self._refresh_category_history()
+        self._refresh_fixed_chart()
+
     def _refresh_all_views(self) -> None:
         self._refresh_fixed()
         self._refresh_variable()
@@ -401,19 +412,6 @@ class GastosFrame(tk.Frame):
         self._refresh_variable_month_chart()
         self._refresh_variable_year_chart()
 
-    def _render_figure_on_container(
-        self,
-        container: tk.Misc,
-        figure,
-        existing: FigureCanvasTkAgg | None,
-    ) -> FigureCanvasTkAgg:
-        if existing:
-            existing.get_tk_widget().destroy()
-        canvas = FigureCanvasTkAgg(figure, master=container)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
-        return canvas
-
     def _populate_history(self, rows: list[Any]) -> None:
         for child in self._category_tree.get_children():
             self._category_tree.delete(child)
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Sequence
 
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from ..db.connection import DatabaseConnection
+from ..events import DataChanged
 from ..logic.graficos import annual_tax_paid_figure
 from ..repositories import ImpuestoAnualRepository
+from .chart_panel import ChartPanel
 from .theme import Theme
 
 
@@ -24,14 +26,15 @@ def _format_money(value: float | None) -> str:
 class ImpuestosFrame(tk.Frame):
     """Componente principal que expone los controles que pidió el usuario."""
 
+    DEPENDS_ON = frozenset({"impuesto"})
+
     def __init__(self, parent: tk.Misc) -> None:
         super().__init__(parent, padx=12, pady=12, bg=Theme.BACKGROUND)
         self._db_connection = DatabaseConnection()
         self._impuesto_repo = ImpuestoAnualRepository(self._db_connection)
         self._year_var = tk.StringVar(value=str(self._current_year()))
         self._amount_var = tk.StringVar()
-        self._chart_container: ttk.Frame | None = None
-        self._chart_canvas: FigureCanvasTkAgg | None = None
+        self._chart_container: ChartPanel | None = None
 
         tk.Label(
             self,
@@ -48,6 +51,11 @@ class ImpuestosFrame(tk.Frame):
         self._refresh_records()
         self._refresh_tax_chart()
 
+    def refresh(self, events: Sequence[DataChanged] = ()) -> None:
+        # La tabla y el gráfico muestran todos los años, así que cualquier cambio los afecta.
+        self._refresh_records()
+        self._refresh_tax_chart()
+
     def _current_year(self) -> int:
         return datetime.now().year
 
@@ -141,11 +149,9 @@ class ImpuestosFrame(tk.Frame):
             fg=Theme.PRIMARY_TEXT,
         )
         section.pack(fill="x", pady=(0, 12))
-        self._chart_container = tk.Frame(section, bg=Theme.CARD_BG)
-        self._chart_container.configure(height=300, width=420)
+        self._chart_container = ChartPanel(section, height=300, width=420)
         self._chart_container.pack(pady=(0, 4))
         self._chart_container.pack_propagate(False)
-        self._chart_container.bind("<Configure>", lambda _: self._refresh_tax_chart())
 
     def _show_user_message(self) -> None:
         message = self._message_var.get().strip() or "Sin mensaje"
@@ -187,18 +193,4 @@ class ImpuestosFrame(tk.Frame):
     def _refresh_tax_chart(self) -> None:
         if self._chart_container is None:
             return
-        figure = annual_tax_paid_figure(figsize=(5, 2.5))
-        self._chart_canvas = self._render_figure_on_container(self._chart_container, figure, self._chart_canvas)
-
-    def _render_figure_on_container(
-        self,
-        container: tk.Misc,
-        figure,
-        existing: FigureCanvasTkAgg | None,
-    ) -> FigureCanvasTkAgg:
-        if existing:
-            existing.get_tk_widget().destroy()
-        canvas = FigureCanvasTkAgg(figure, master=container)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
-        return canvas
+        self._chart_container.show(lambda: annual_tax_paid_figure(figsize=(5, 2.5)))
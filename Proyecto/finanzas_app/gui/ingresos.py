@@ -9,12 +9,11 @@ from typing import Any, Sequence
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-
 from ..db.connection import DatabaseConnection
+from ..events import DataChanged
 from ..logic.graficos import annual_incomes_figure, monthly_incomes_stacked_figure
 from ..repositories import FinancialReportRepository
+from .chart_panel import ChartPanel
 from .theme import Theme
 
 
@@ -39,6 +38,8 @@ def _make_tree(frame: tk.Frame, title: str, columns: tuple[str, ...]) -> ttk.Tre
 class IngresosFrame(tk.Frame):
     """Panel con los reportes mensuales, anuales y por categoría."""
 
+    DEPENDS_ON = frozenset({"transaccion", "resumen_mensual"})
+
     def __init__(self, parent: tk.Misc) -> None:
         super().__init__(parent, padx=12, pady=12, bg=Theme.BACKGROUND)
         self._report = FinancialReportRepository(DatabaseConnection())
@@ -82,10 +83,8 @@ class IngresosFrame(tk.Frame):
         self._annual_tree = _make_tree(tree_frame, "Ingresos anuales", ("Año", "Total"))
         self._category_tree = _make_tree(tree_frame, "Ingresos por categoría", ("Categoría", "Total"))
 
-        self._monthly_chart_canvas: FigureCanvasTkAgg | None = None
-        self._annual_chart_canvas: FigureCanvasTkAgg | None = None
-        self._monthly_chart_container: tk.Frame | None = None
-        self._annual_chart_container: tk.Frame | None = None
+        self._monthly_chart_container: ChartPanel | None = None
+        self._annual_chart_container: ChartPanel | None = None
         self._build_charts_section(chart_frame)
 
         self._refresh_monthly()
@@ -94,6 +93,19 @@ class IngresosFrame(tk.Frame):
         self._refresh_monthly_chart()
         self._refresh_annual_chart()
 
+    def refresh(self, events: Sequence[DataChanged] = ()) -> None:
+        """El detalle mensual sólo se recarga si cambió su año; los totales por año y categoría, siempre."""
+        try:
+            year = int(self._monthly_year_var.get())
+        except ValueError:
+            year = None
+        if year is not None and (not events or any(event.affects(year) for event in events)):
+            # `_refresh_monthly` ya redibuja el gráfico mensual.
+            self._refresh_monthly()
+        self._refresh_annual()
+        self._refresh_category()
+        self._refresh_annual_chart()
+
     def _initial_year(self) -> int:
         return datetime.now().year
 
@@ -164,9 +176,8 @@ class IngresosFrame(tk.Frame):
             fg=Theme.PRIMARY_TEXT,
         )
         monthly_frame.pack(fill="both", expand=True, pady=(0, 6))
-        self._monthly_chart_container = tk.Frame(monthly_frame, bg=Theme.CARD_BG)
+        self._monthly_chart_container = ChartPanel(monthly_frame)
         self._monthly_chart_container.pack(fill="both", expand=True)
-        self._monthly_chart_container.bind("<Configure>", lambda _: self._refresh_monthly_chart())
 
         annual_frame = tk.LabelFrame(
             frame,
@@ -177,9 +188,8 @@ class IngresosFrame(tk.Frame):
             fg=Theme.PRIMARY_TEXT,
         )
         annual_frame.pack(fill="both", expand=True)
-        self._annual_chart_container = tk.Frame(annual_frame, bg=Theme.CARD_BG)
+        self._annual_chart_container = ChartPanel(annual_frame)
         self._annual_chart_container.pack(fill="both", expand=True)
-        self._annual_chart_container.bind("<Configure>", lambda _: self._refresh_annual_chart())
 
     def _refresh_monthly_chart(self, year_override: int | None = None) -> None:
         try:
@@ -188,32 +198,12 @@ class IngresosFrame(tk.Frame):
             return
         if not self._monthly_chart_container:
             return
-        figure = monthly_incomes_stacked_figure(year)
-        self._monthly_chart_canvas = self._render_figure_on_container(
-            self._monthly_chart_container, figure, self._monthly_chart_canvas
-        )
+        self._monthly_chart_container.show(lambda: monthly_incomes_stacked_figure(year))
 
     def _refresh_annual_chart(self) -> None:
         if not self._annual_chart_container:
             return
-        figure = annual_incomes_figure()
-        self._annual_chart_canvas = self._render_figure_on_container(
-            self._annual_chart_container, figure, self._annual_chart_canvas
-        )
-
-    def _render_figure_on_container(
-        self,
-        container: tk.Misc,
-        figure: Figure,
-        existing: FigureCanvasTkAgg | None,
-    ) -> FigureCanvasTkAgg:
-        if existing:
-            existing.get_tk_widget().destroy()
-        canvas = FigureCanvasTkAgg(figure, master=container)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
-        # Mantiene la referencia para poder refrescar el lienzo cuando se redimensiona.
-        return canvas
+        self._annual_chart_container.show(annual_incomes_figure)
 
     def _populate_tree(self, tree: ttk.Treeview, rows: Sequence[dict[str, Any]], label_key: str) -> None:
         for child in tree.get_children():
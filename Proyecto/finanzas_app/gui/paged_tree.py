@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import tkinter as tk
+from tkinter import ttk
+
+from .theme import Theme
+
+Row = Dict[str, Any]
+FetchPage = Callable[[Optional[str]], Tuple[List[Row], Optional[str]]]
+
+
+@dataclass
+class _Page:
+    """Página cargada: el token con que se pidió, sus filas y el token de la siguiente."""
+
+    token: Optional[str]
+    iids: List[str]
+    next_token: Optional[str]
+
+
+class PagedTreeview(tk.Frame):
+    """Treeview con una ventana de páginas que se desplaza junto con el scroll.
+
+    `fetch_page(token)` debe retornar `(filas, siguiente_token)` como
+    `TransaccionRepository.list_page`. Al acercarse al final se pide la página
+    siguiente y al acercarse al principio se vuelve a pedir la anterior; sólo se
+    conservan `MAX_PAGES` páginas, así que la tabla nunca supera `MAX_PAGES` por
+    tamaño de página filas por mucho que se desplace. Las ediciones puntuales se
+    aplican con `update_row`/`remove_row` sin reconstruir la tabla; con `row_key`
+    (clave creciente en el orden de la tabla) una fila editada que cambió de
+    posición se reubica.
+    """
+
+    # Fracción desplazada a partir de la cual se pide la página siguiente (o, simétrica, la anterior).
+    PREFETCH_THRESHOLD = 0.85
+    MAX_PAGES = 5
+
+    def __init__(
+        self,
+        parent: tk.Misc,
+        columns: Sequence[Tuple[str, str, int, str]],
+        fetch_page: FetchPage,
+        row_values: Callable[[Row], Tuple[Any, ...]],
+        row_id: Callable[[Row], Any],
+        row_key: Optional[Callable[[Row], Any]] = None,
+    ) -> None:
+        super().__init__(parent, bg=Theme.CARD_BG)
+        self._fetch_page = fetch_page
+        self._row_values = row_values
+        self._row_id = row_id
+        self._row_key = row_key
+        self._rows: Dict[str, Row] = {}
+        self._pages: List[_Page] = []
+        # Tokens de las páginas descartadas por arriba, la más cercana al final de la lista.
+        self._evicted_above: List[Optional[str]] = []
+        self._loading = False
+
+        self.tree = ttk.Treeview(
+            self,
+            columns=[col[0] for col in columns],
+            show="headings",
+            selectmode="browse",
+        )
+        for key, heading, width, anchor in columns:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width, anchor=anchor)
+
+        self._scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_scroll)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self._scrollbar.pack(side="right", fill="y")
+
+    def reload(self) -> None:
+        """Descarta las filas cargadas y vuelve a pedir la primera página."""
+        self.tree.delete(*self.tree.get_children())
+        self._rows.clear()
+        self._pages.clear()
+        self._evicted_above.clear()
+        self._load_below()
+
+    def get_row(self, iid: str) -> Optional[Row]:
+        return self._rows.get(iid)
+
+    def update_row(self, row: Row) -> None:
+        """Reemplaza los valores de una fila ya cargada; si cambió su orden, la reubica."""
+        iid = str(self._row_id(row))
+        previous = self._rows.get(iid)
+        if previous is None:
+            return
+        self._rows[iid] = row
+        self.tree.item(iid, values=self._row_values(row))
+        if self._row_key is not None and self._row_key(previous) != self._row_key(row):
+            self._relocate(iid, row)
+
+    def remove_row(self, iid: str) -> None:
+        if iid in self._rows:
+            del self._rows[iid]
+            self.tree.delete(iid)
+            for page in self._pages:
+                if iid in page.iids:
+                    page.iids.remove(iid)
+
+    def _relocate(self, iid: str, row: Row) -> None:
+        """Vuelve a insertar la fila donde la ubica `row_key`, o la quita si cae fuera de la ventana."""
+        self.remove_row(iid)
+        ordered = list(self.tree.get_children())
+        keys = [self._row_key(self._rows[child]) for child in ordered]
+        position = bisect.bisect_left(keys, self._row_key(row))
+        # Antes de la primera fila cargada o después de la última: aparecerá al pedir su página.
+        if (position == 0 and self._evicted_above) or (position == len(ordered) and not self._exhausted()):
+            return
+        self._insert(row, position)
+        # Pasa a la página de la fila que queda justo antes; al principio, a la primera.
+        before = ordered[position - 1] if position else None
+        page = next((page for page in self._pages if before in page.iids), self._pages[0])
+        page.iids.append(iid)
+
+    def _exhausted(self) -> bool:
+        return bool(self._pages) and self._pages[-1].next_token is None
+
+    def _on_scroll(self, first: str, last: str) -> None:
+        self._scrollbar.set(first, last)
+        if self._loading:
+            return
+        if float(last) >= self.PREFETCH_THRESHOLD and not self._exhausted():
+            loader = self._load_below
+        elif float(first) <= 1 - self.PREFETCH_THRESHOLD and self._evicted_above:
+            loader = self._load_above
+        else:
+            return
+        # Se difiere la carga para no insertar filas dentro del propio callback de scroll.
+        self._loading = True
+        self.after_idle(loader)
+
+    def _fetch(self, token: Optional[str]) -> Tuple[List[Row], Optional[str]]:
+        try:
+            return self._fetch_page(token)
+        finally:
+            self._loading = False
+
+    def _load_below(self) -> None:
+        if self._exhausted():
+            self._loading = False
+            return
+        token = self._pages[-1].next_token if self._pages else None
+        rows, next_token = self._fetch(token)
+        iids = [iid for iid in (self._insert(row, "end") for row in rows) if iid is not None]
+        self._pages.append(_Page(token, iids, next_token))
+        if len(self._pages) > self.MAX_PAGES:
+            top = self._top_index()
+            dropped = self._pages.pop(0)
+            self._evicted_above.append(dropped.token)
+            # Sin la página de arriba las filas visibles suben: se compensa para que no salten.
+            self._scroll_to_index(top - self._forget(dropped))
+
+    def _load_above(self) -> None:
+        if not self._evicted_above:
+            self._loading = False
+            return
+        token = self._evicted_above.pop()
+        rows, next_token = self._fetch(token)
+        top = self._top_index()
+        iids: List[str] = []
+        for row in rows:
+            iid = self._insert(row, len(iids))
+            if iid is not None:
+                iids.append(iid)
+        self._pages.insert(0, _Page(token, iids, next_token))
+        if len(self._pages) > self.MAX_PAGES:
+            self._forget(self._pages.pop())
+        self._scroll_to_index(top + len(iids))
+
+    def _insert(self, row: Row, index: Any) -> Optional[str]:
+        """Inserta la fila en `index` y retorna su iid, o None si ya estaba cargada."""
+        iid = str(self._row_id(row))
+        if iid in self._rows:
+            return None
+        self._rows[iid] = row
+        self.tree.insert("", index, iid=iid, values=self._row_values(row))
+        return iid
+
+    def _forget(self, page: _Page) -> int:
+        """Quita de la tabla las filas de `page` y retorna cuántas eran."""
+        present = [iid for iid in page.iids if iid in self._rows]
+        for iid in present:
+            del self._rows[iid]
+        if present:
+            self.tree.delete(*present)
+        return len(present)
+
+    def _top_index(self) -> int:
+        return round(float(self.tree.yview()[0]) * len(self.tree.get_children()))
+
+    def _scroll_to_index(self, index: int) -> None:
+        total = len(self.tree.get_children())
+        if total:
+            self.tree.yview_moveto(max(0, index) / total)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import queue
+import threading
+from typing import Any, Optional, Sequence, Tuple
 import pandas as pd
 import tkinter as tk
 from tkinter import messagebox
@@ -10,15 +12,31 @@ from tkinter import messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 
-from ..logic.modelo import predict_future_expenses
+from ..db.connection import DatabaseConnection
+from ..events import DataChanged
+from ..logic.almacen_modelo import ModelStore
+from ..logic.modelo import Prediction, predict
 from .theme import Theme
 
 
 class PrediccionFrame(tk.Frame):
-    """Interfaz que permite invocar el modelo de predicción y ver su gráfico."""
+    """Interfaz que permite invocar el modelo de predicción y ver su gráfico.
+
+    La predicción corre en un hilo aparte y reutiliza el modelo guardado en
+    `ModelStore` mientras las transacciones no cambien; el resultado vuelve al
+    hilo de Tk por una cola que se revisa con `after()`.
+    """
+
+    POLL_MS = 100
+    DEPENDS_ON = frozenset({"transaccion"})
 
     def __init__(self, parent: tk.Misc) -> None:
         super().__init__(parent, padx=18, pady=18, bg=Theme.BACKGROUND)
+        self._store = ModelStore(DatabaseConnection())
+        self._events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        self._busy = False
+        self._waiting_retrain = False
+        self._has_prediction = False
         tk.Label(
             self,
             text="Predicción de gastos",
@@ -59,7 +77,7 @@ class PrediccionFrame(tk.Frame):
         )
         self._metrics_label.pack(anchor="w", pady=(0, 6))
 
-        btn = tk.Button(
+        self._button = btn = tk.Button(
             self,
             text="Generar predicción",
             command=self._generate_prediction,
@@ -117,26 +135,91 @@ class PrediccionFrame(tk.Frame):
             self._importance_canvas.get_tk_widget().destroy()
             self._importance_canvas = None
 
+    def refresh(self, events: Sequence[DataChanged] = ()) -> None:
+        # Sin predicción en pantalla no hay nada desactualizado; con ella, se recalcula
+        # (el modelo guardado se sigue mostrando mientras se reentrena).
+        if self._has_prediction:
+            self._generate_prediction()
+
     def _generate_prediction(self) -> None:
-        try:
-            forecast, metrics_real, metrics_cv, importances = predict_future_expenses(months=6)
-        except ValueError as exc:
+        if self._busy:
+            return
+        self._busy = True
+        self._button.config(state="disabled")
+        self._status_label.config(text="Calculando predicción…", fg=Theme.SECONDARY_TEXT)
+
+        def on_retrained(future: Any) -> None:
+            self._events.put(("retrained", future))
+
+        def run() -> None:
+            try:
+                self._events.put(("prediction", predict(months=6, store=self._store, on_retrained=on_retrained)))
+            except Exception as exc:
+                self._events.put(("error", exc))
+
+        threading.Thread(target=run, daemon=True).start()
+        self.after(self.POLL_MS, self._poll_events)
+
+    def _poll_events(self) -> None:
+        while True:
+            try:
+                kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "prediction":
+                self._finish()
+                self._waiting_retrain = payload.stale
+                self._show_prediction(payload)
+            elif kind == "error":
+                self._finish()
+                self._show_error(payload)
+            elif kind == "retrained":
+                self._waiting_retrain = False
+                if payload.exception() is None:
+                    # El modelo nuevo ya está guardado: volver a predecir es inmediato.
+                    self._generate_prediction()
+                else:
+                    self._status_label.config(
+                        text=f"No se pudo reentrenar el modelo: {payload.exception()}", fg="#a00"
+                    )
+        if self._busy or self._waiting_retrain:
+            self.after(self.POLL_MS, self._poll_events)
+
+    def _finish(self) -> None:
+        self._busy = False
+        self._button.config(state="normal")
+
+    def _show_error(self, exc: Exception) -> None:
+        if isinstance(exc, ValueError):
             messagebox.showwarning("Predicción", str(exc))
             self._status_label.config(text=str(exc), fg="#a00")
-            self._clear_chart()
-            return
-        except Exception as exc:
+        else:
             messagebox.showerror("Predicción", f"No se pudo ejecutar el modelo: {exc}")
             self._status_label.config(text="Ocurrió un error inesperado.", fg="#a00")
-            self._clear_chart()
-            return
+        self._clear_chart()
+
+    def _show_prediction(self, prediction: Prediction) -> None:
+        forecast = prediction.forecast
+        metrics_real, metrics_cv = prediction.metrics_real, prediction.metrics_cv
+        importances = prediction.importance
 
         if forecast.empty:
             self._status_label.config(text="El modelo no pudo generar predicciones.", fg="#a00")
             self._clear_chart()
             return
 
-        self._status_label.config(text="Predicción generada (TimeSeriesSplit, sin fuga temporal).", fg="#070")
+        self._has_prediction = True
+        trained_at = prediction.trained_at.strftime("%Y-%m-%d %H:%M")
+        if prediction.stale:
+            self._status_label.config(
+                text=f"Hay transacciones nuevas: se muestra el modelo del {trained_at} mientras se reentrena en segundo plano.",
+                fg=Theme.SECONDARY_TEXT,
+            )
+        else:
+            self._status_label.config(
+                text=f"Predicción generada (TimeSeriesSplit, sin fuga temporal). Modelo entrenado el {trained_at}.",
+                fg="#070",
+            )
         months = len(forecast)
         accumulated_error = metrics_real["MAE"] * months
         metrics_text = (
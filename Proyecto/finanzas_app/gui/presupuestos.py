@@ -1,23 +1,26 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Sequence
 
 import tkinter as tk
 from tkinter import messagebox, ttk
 
 from ..db.connection import DatabaseConnection
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from ..events import DataChanged
 from ..logic.graficos import budget_pie_figure, objective_comparison_figure
 from ..models import Categoria, PresupuestoEspecifico
 from ..repositories import CategoriaRepository, PresupuestoEspecificoRepository
+from .chart_panel import ChartPanel
 from .theme import Theme
 
 
 class PresupuestosFrame(tk.Frame):
     """Gestor de objetivos de gasto por categoría y sus comparativas."""
 
+    # Las comparativas cruzan los objetivos con el gasto real del periodo.
+    DEPENDS_ON = frozenset({"presupuesto", "transaccion", "resumen_mensual"})
+
     def __init__(self, parent: tk.Misc) -> None:
         super().__init__(parent, padx=24, pady=24, bg=Theme.BACKGROUND)
         self._db_connection = DatabaseConnection()
@@ -38,10 +41,8 @@ class PresupuestosFrame(tk.Frame):
         self._chart_year_var = tk.StringVar(value=str(now.year))
         self._chart_month_var = tk.StringVar(value=str(now.month))
 
-        self._comparacion_canvas: FigureCanvasTkAgg | None = None
-        self._pie_chart_canvas: FigureCanvasTkAgg | None = None
-        self._comparacion_container: tk.Frame | None = None
-        self._pie_container: tk.Frame | None = None
+        self._comparacion_container: ChartPanel | None = None
+        self._pie_container: ChartPanel | None = None
         self._objectives_tree: ttk.Treeview | None = None
         self._objectives_data: list[dict[str, Any]] = []
         self._delete_btn: tk.Button | None = None
@@ -240,14 +241,11 @@ class PresupuestosFrame(tk.Frame):
         comparison_frame = tk.Frame(charts_container, bg=Theme.BACKGROUND)
         comparison_frame.grid(row=0, column=1, sticky="nsew", padx=(8, 0))
 
-        self._pie_container = tk.Frame(pie_frame, bg=Theme.CARD_BG)
+        self._pie_container = ChartPanel(pie_frame)
         self._pie_container.pack(fill="both", expand=True)
-        self._comparacion_container = tk.Frame(comparison_frame, bg=Theme.CARD_BG)
+        self._comparacion_container = ChartPanel(comparison_frame)
         self._comparacion_container.pack(fill="both", expand=True)
 
-        self._pie_container.bind("<Configure>", lambda _: self._refresh_charts())
-        self._comparacion_container.bind("<Configure>", lambda _: self._refresh_charts())
-
         self._refresh_period_views()
         return labelframe
 
@@ -306,6 +304,11 @@ class PresupuestosFrame(tk.Frame):
             month = now.month
         return year, month
 
+    def refresh(self, events: Sequence[DataChanged] = ()) -> None:
+        year, month = self._chart_period()
+        if not events or any(event.affects(year, month) for event in events):
+            self._refresh_period_views()
+
     def _refresh_period_views(self) -> None:
         self._refresh_objective_list()
         self._refresh_charts()
@@ -367,26 +370,6 @@ class PresupuestosFrame(tk.Frame):
     def _refresh_charts(self) -> None:
         period_year, period_month = self._chart_period()
         if self._pie_container:
-            figure = budget_pie_figure(period_year, period_month)
-            self._pie_chart_canvas = self._render_figure_on_container(
-                self._pie_container, figure, self._pie_chart_canvas
-            )
+            self._pie_container.show(lambda: budget_pie_figure(period_year, period_month))
         if self._comparacion_container:
-            figure = objective_comparison_figure(period_year, period_month)
-            self._comparacion_canvas = self._render_figure_on_container(
-                self._comparacion_container, figure, self._comparacion_canvas
-            )
-
-    def _render_figure_on_container(
-        self,
-        container: tk.Misc,
-        figure: Figure,
-        existing: FigureCanvasTkAgg | None,
-    ) -> FigureCanvasTkAgg:
-        if existing:
-            existing.get_tk_widget().destroy()
-        canvas = FigureCanvasTkAgg(figure, master=container)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
-        # Mantiene referencia para poder refrescar/reemplazar el lienzo fácilmente.
-        return canvas
+            self._comparacion_container.show(lambda: objective_comparison_figure(period_year, period_month))
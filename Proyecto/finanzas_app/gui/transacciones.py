@@ -1,20 +1,26 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 import tkinter as tk
 from tkinter import messagebox, ttk
 
 from ..db.connection import DatabaseConnection
+from ..events import DataChanged
 from ..models import Categoria, Transaccion
 from ..repositories import CategoriaRepository, TransaccionRepository
+from .paged_tree import PagedTreeview
 from .theme import Theme
 
+PAGE_SIZE = 200
+
 
 class TransactionForm(tk.Frame):
     """Formulario reutilizable para registrar gastos e ingresos."""
 
+    DEPENDS_ON = frozenset({"transaccion"})
+
     def __init__(self, parent: tk.Misc) -> None:
         super().__init__(parent, bg=Theme.BACKGROUND)
         self._db_connection = DatabaseConnection()
@@ -30,9 +36,8 @@ class TransactionForm(tk.Frame):
             for tipo in ("gasto", "ingreso")
         }
         self._form_vars: dict[str, dict[str, tk.StringVar]] = {}
-        self._transactions_tree: Optional[ttk.Treeview] = None
+        self._transactions_table: Optional[PagedTreeview] = None
         self._selected_transaction_id: Optional[int] = None
-        self._transactions_data: list[dict[str, Any]] = []
         self._edit_vars: dict[str, tk.StringVar] = {}
         self._category_display: Optional[tk.Label] = None
         self._update_btn: Optional[tk.Button] = None
@@ -186,21 +191,17 @@ class TransactionForm(tk.Frame):
             ("monto", "Monto", 100, "e"),
             ("cantidad", "Cantidad", 80, "center"),
         )
-        self._transactions_tree = ttk.Treeview(
+        # Las filas se piden por páginas al desplazarse; no se carga la tabla completa.
+        self._transactions_table = PagedTreeview(
             table_frame,
-            columns=[col[0] for col in columns],
-            show="headings",
-            selectmode="browse",
+            columns,
+            fetch_page=lambda token: self._trans_repo.list_page(token, PAGE_SIZE),
+            row_values=self._row_values,
+            row_id=lambda row: row.get("id_transaccion"),
+            row_key=self._row_order,
         )
-        for key, heading, width, anchor in columns:
-            self._transactions_tree.heading(key, text=heading)
-            self._transactions_tree.column(key, width=width, anchor=anchor)
-
-        vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self._transactions_tree.yview)
-        self._transactions_tree.configure(yscrollcommand=vsb.set)
-        self._transactions_tree.pack(side="left", fill="both", expand=True)
-        vsb.pack(side="right", fill="y")
-        self._transactions_tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self._transactions_table.pack(fill="both", expand=True)
+        self._transactions_table.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
 
         edit_frame = tk.LabelFrame(
             self,
@@ -306,42 +307,62 @@ class TransactionForm(tk.Frame):
 
         self._refresh_transactions()
 
+    @staticmethod
+    def _row_order(row: dict[str, Any]) -> tuple[Any, ...]:
+        """Clave creciente en el orden de `list_page`: (fecha, id) descendente y sin fecha al final."""
+        fecha = row.get("fecha")
+        if fecha is None:
+            return (True, 0, 0, -row["id_transaccion"])
+        seconds = fecha.hour * 3600 + fecha.minute * 60 + fecha.second if isinstance(fecha, datetime) else 0
+        return (False, -fecha.toordinal(), -seconds, -row["id_transaccion"])
+
+    @staticmethod
+    def _row_values(row: dict[str, Any]) -> tuple[Any, ...]:
+        fecha = row.get("fecha")
+        fecha_text = fecha.isoformat() if hasattr(fecha, "isoformat") else (str(fecha) if fecha else "")
+        monto = row.get("monto") or 0.0
+        cantidad = row.get("cantidad")
+        return (
+            fecha_text,
+            row.get("categoria") or "-",
+            row.get("tipo", "-").capitalize() if row.get("tipo") else "-",
+            row.get("periodicidad", "-").capitalize() if row.get("periodicidad") else "-",
+            row.get("description") or "",
+            f"${monto:,.2f}",
+            cantidad if cantidad is not None else "",
+        )
+
+    def refresh(self, events: Sequence[DataChanged] = ()) -> None:
+        """Ediciones y bajas de otras partes se aplican fila por fila; las altas recargan la tabla."""
+        if not self._transactions_table:
+            return
+        if not events or any(event.action not in ("update", "delete") or not event.ids for event in events):
+            self._refresh_transactions()
+            return
+        for event in events:
+            for transaction_id in event.ids:
+                row = self._trans_repo.get_with_category(transaction_id) if event.action == "update" else None
+                if row:
+                    self._transactions_table.update_row(row)
+                else:
+                    self._transactions_table.remove_row(str(transaction_id))
+        self._clear_selection()
+
     def _refresh_transactions(self) -> None:
-        if not self._transactions_tree:
+        if not self._transactions_table:
             return
-        self._transactions_data = self._trans_repo.list_all_with_category()
-        for child in self._transactions_tree.get_children():
-            self._transactions_tree.delete(child)
-        for row in self._transactions_data:
-            fecha = row.get("fecha")
-            fecha_text = fecha.isoformat() if hasattr(fecha, "isoformat") else (str(fecha) if fecha else "")
-            monto = row.get("monto") or 0.0
-            cantidad = row.get("cantidad")
-            self._transactions_tree.insert(
-                "",
-                "end",
-                iid=str(row.get("id_transaccion")),
-                values=(
-                    fecha_text,
-                    row.get("categoria") or "-",
-                    row.get("tipo", "-").capitalize() if row.get("tipo") else "-",
-                    row.get("periodicidad", "-").capitalize() if row.get("periodicidad") else "-",
-                    row.get("description") or "",
-                    f"${monto:,.2f}",
-                    cantidad if cantidad is not None else "",
-                ),
-            )
+        self._transactions_table.reload()
         self._clear_selection()
 
     def _on_tree_select(self, event: tk.Event) -> None:
-        if not self._transactions_tree:
+        if not self._transactions_table:
             return
-        selection = self._transactions_tree.selection()
+        selection = self._transactions_table.tree.selection()
         if not selection:
             self._clear_selection()
             return
         trans_id = int(selection[0])
-        transaction = next((t for t in self._transactions_data if t.get("id_transaccion") == trans_id), None)
+        transaction = self._transactions_table.get_row(selection[0])
         if not transaction:
             self._clear_selection()
             return
@@ -406,7 +427,14 @@ class TransactionForm(tk.Frame):
             messagebox.showerror("Error al actualizar", str(exc))
             return
         self.status_label.configure(text=f"Transacción #{self._selected_transaction_id} actualizada", fg="green")
-        self._refresh_transactions()
+        # Sólo se vuelve a leer la fila editada; el resto de la tabla queda intacto.
+        row = self._trans_repo.get_with_category(self._selected_transaction_id)
+        if self._transactions_table:
+            if row:
+                self._transactions_table.update_row(row)
+            else:
+                self._transactions_table.remove_row(str(self._selected_transaction_id))
+        self._clear_selection()
 
     def _delete_transaction(self) -> None:
         if not self._selected_transaction_id:
@@ -423,7 +451,9 @@ class TransactionForm(tk.Frame):
             messagebox.showerror("Error al eliminar", str(exc))
             return
         self.status_label.configure(text=f"Transacción #{self._selected_transaction_id} eliminada", fg="green")
-        self._refresh_transactions()
+        if self._transactions_table:
+            self._transactions_table.remove_row(str(self._selected_transaction_id))
+        self._clear_selection()
 
     def _on_submit(self, tipo: str) -> None:
         vars_map = self._form_vars.get(tipo)
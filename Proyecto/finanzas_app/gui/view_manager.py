@@ -0,0 +1,100 @@
+"""Vistas que se crean una sola vez y se ocultan al cambiar de pestaña.
+
+Cada vista puede declarar `DEPENDS_ON` (las tablas cuyo cambio la deja
+desactualizada: "transaccion", "presupuesto", "categoria", "impuesto",
+"resumen_mensual") y un método `refresh(events)` que recibe los `DataChanged`
+acumulados y recarga sólo las partes cuyo periodo cambió. Los eventos de
+`data_events` se guardan para las vistas ocultas que dependen de la tabla
+tocada; al volver a mostrarse, una vista con eventos pendientes llama a
+`refresh()` o, si no lo tiene, se reconstruye. Una vista sin eventos sólo se
+vuelve a empaquetar. La vista visible no acumula eventos: las escrituras de la
+GUI salen de ella y ya se actualiza sola.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+import tkinter as tk
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..events import DataChanged, data_events
+from .theme import Theme
+
+
+class ViewManager:
+    """Muestra una vista por vez dentro de `container`, conservando las ya creadas."""
+
+    def __init__(self, container: tk.Misc, views: Dict[str, Tuple[str, str]], package: str) -> None:
+        self._container = container
+        self._views = views
+        self._package = package
+        self._frames: Dict[str, tk.Widget] = {}
+        self._current: Optional[str] = None
+        # Los eventos pueden llegar desde hilos de trabajo: sólo tocan este diccionario, nunca Tk.
+        self._pending: Dict[str, List[DataChanged]] = {}
+        self._lock = threading.Lock()
+        data_events.subscribe(self._on_data_changed)
+
+    @property
+    def current(self) -> Optional[str]:
+        return self._current
+
+    def load_view(self, name: str) -> Callable[[tk.Misc], tk.Widget]:
+        """Clase de la vista `name`, importando su módulo si todavía no se cargó."""
+        module_name, class_name = self._views[name]
+        return getattr(importlib.import_module(module_name, self._package), class_name)
+
+    def show(self, name: str) -> Optional[tk.Widget]:
+        if name not in self._views:
+            return None
+        # `_frames` y `_current` se leen desde los hilos que publican eventos: se cambian con el
+        # candado tomado, pero Tk (ocultar, crear, recargar) se toca siempre fuera de él.
+        with self._lock:
+            frame = self._frames.get(name)
+            if name == self._current and frame is not None:
+                return frame
+            previous = self._frames.get(self._current) if self._current is not None else None
+            # Desde aquí la vista anterior acumula eventos y la pedida los recibe al mostrarse.
+            self._current = name
+            events = self._pending.pop(name, [])
+            if frame is not None and events and not callable(getattr(frame, "refresh", None)):
+                del self._frames[name]
+                stale, frame = frame, None
+            else:
+                stale = None
+        if previous is not None:
+            previous.pack_forget()
+        if stale is not None:
+            stale.destroy()
+        if frame is None:
+            frame = self._create(name)
+            with self._lock:
+                self._frames[name] = frame
+        elif events:
+            frame.refresh(events)
+        frame.pack(fill="both", expand=True)
+        return frame
+
+    def _create(self, name: str) -> tk.Widget:
+        # La primera apertura de una vista importa su módulo; mientras tanto se ve el aviso.
+        loading = tk.Label(self._container, text="Cargando…", bg=Theme.BACKGROUND, fg=Theme.SECONDARY_TEXT)
+        loading.pack(fill="both", expand=True)
+        self._container.update_idletasks()
+        try:
+            return self.load_view(name)(self._container)
+        finally:
+            loading.destroy()
+
+    def _on_data_changed(self, event: DataChanged) -> None:
+        """Guarda el evento para las vistas ocultas que dependen de su tabla; sin `DEPENDS_ON`, de todas."""
+        with self._lock:
+            for name, frame in self._frames.items():
+                if name == self._current:
+                    continue
+                depends_on = getattr(frame, "DEPENDS_ON", None)
+                if depends_on is None or event.entity in depends_on:
+                    self._pending.setdefault(name, []).append(event)
+
+    def close(self) -> None:
+        data_events.unsubscribe(self._on_data_changed)
@@ -0,0 +1,109 @@
+"""Importa transacciones desde un CSV o extracto bancario usando la carga por bloques."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from .db.connection import DatabaseConnection
+from .models import Transaccion
+from .repositories import CategoriaRepository, TransaccionRepository
+
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y")
+
+
+def _parse_fecha(value: str) -> Optional[date]:
+    value = value.strip()
+    if not value:
+        return None
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Fecha no reconocida: {value!r}")
+
+
+def _parse_monto(value: str) -> float:
+    """Acepta `1234.56`, `1234,56`, `1.234,56` y `1,234.56` como aparecen en los extractos.
+
+    Con ambos separadores, el que aparece último es el decimal. Una sola coma seguida
+    de exactamente tres dígitos (`1,234`) puede ser miles o decimales y se rechaza.
+    """
+    value = value.strip().replace(" ", "")
+    if "," in value and "." in value:
+        thousands, decimal = (".", ",") if value.rfind(",") > value.rfind(".") else (",", ".")
+        value = value.replace(thousands, "").replace(decimal, ".")
+    elif value.count(",") > 1:
+        value = value.replace(",", "")
+    elif "," in value:
+        if len(value) - value.index(",") - 1 == 3:
+            raise ValueError(f"Monto ambiguo: {value!r} (usa un separador decimal explícito)")
+        value = value.replace(",", ".")
+    return float(value)
+
+
+def read_transactions(
+    path: str | Path,
+    categorias: Dict[str, int],
+    delimiter: str = ",",
+    encoding: str = "utf-8-sig",
+) -> Iterator[Transaccion]:
+    """Genera transacciones a partir de un CSV con columnas `fecha`, `monto`, `categoria`.
+
+    `categoria` puede ser el id o el nombre (sin distinguir mayúsculas); `cantidad`
+    y `descripcion` son opcionales. Los montos negativos de un extracto se guardan
+    en valor absoluto, porque el signo lo determina el tipo de la categoría.
+    """
+    with open(path, newline="", encoding=encoding) as handle:
+        reader = csv.DictReader(handle, delimiter=delimiter)
+        for line, row in enumerate(reader, start=2):
+            try:
+                categoria = (row.get("categoria") or "").strip()
+                categoria_id = int(categoria) if categoria.isdigit() else categorias.get(categoria.lower())
+                if categoria_id is None:
+                    raise ValueError(f"Categoría desconocida: {categoria!r}")
+                cantidad = (row.get("cantidad") or "").strip()
+                yield Transaccion(
+                    monto=abs(_parse_monto(row.get("monto") or "")),
+                    cantidad=int(cantidad) if cantidad else 1,
+                    fecha=_parse_fecha(row.get("fecha") or ""),
+                    categoria_id=categoria_id,
+                    description=(row.get("descripcion") or row.get("description") or "").strip() or None,
+                )
+            except ValueError as exc:
+                raise ValueError(f"{path}, línea {line}: {exc}") from exc
+
+
+def import_csv(
+    path: str | Path,
+    connection: DatabaseConnection | None = None,
+    chunk_size: int = 500,
+    delimiter: str = ",",
+) -> int:
+    """Carga el archivo con `TransaccionRepository.create_many` y retorna las filas insertadas."""
+    db = connection or DatabaseConnection()
+    categorias = {
+        (categoria.nombre or "").lower(): categoria.id_categoria
+        for categoria in CategoriaRepository(db).list_all()
+        if categoria.id_categoria is not None
+    }
+    transacciones = read_transactions(path, categorias, delimiter=delimiter)
+    return TransaccionRepository(db).create_many(transacciones, chunk_size=chunk_size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("archivo", help="CSV con columnas fecha, monto, categoria[, cantidad, descripcion].")
+    parser.add_argument("--separador", default=",", help="Separador de columnas (por defecto ',').")
+    parser.add_argument("--bloque", type=int, default=500, help="Filas por INSERT/commit.")
+    args = parser.parse_args()
+    total = import_csv(args.archivo, chunk_size=args.bloque, delimiter=args.separador)
+    print(f"Transacciones importadas: {total}")
+
+
+if __name__ == "__main__":
+    main()
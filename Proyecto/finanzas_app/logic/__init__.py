@@ -1,5 +1,5 @@
 from __future__ import annotations
 
-from .calculos import obtener_dashboard_stats
+from .calculos import DashboardStats, compute_dashboard_stats, obtener_dashboard_stats
 
-__all__ = ["obtener_dashboard_stats"]
+__all__ = ["DashboardStats", "compute_dashboard_stats", "obtener_dashboard_stats"]
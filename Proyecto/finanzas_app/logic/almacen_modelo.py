@@ -0,0 +1,108 @@
+"""Persistencia del modelo de predicción entrenado, identificado por una huella de los datos."""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import joblib
+import pandas as pd
+
+from ..db.connection import DatabaseConnection
+from ..repositories import TransaccionRepository
+
+Fingerprint = Tuple[Any, ...]
+
+# Se incrementa cuando cambia el formato del artefacto o la forma de entrenar.
+ARTIFACT_VERSION = 2
+
+
+@dataclass
+class ModelArtifact:
+    """Todo lo necesario para predecir sin volver a entrenar."""
+
+    fingerprint: Fingerprint
+    model: Any
+    # `FeatureEncoder` de `logic.modelo`: vocabulario fijo de las columnas categóricas.
+    encoder: Any
+    feature_columns: List[str]
+    metrics_real: Dict[str, float]
+    metrics_cv: Dict[str, float]
+    baseline: pd.DataFrame
+    importance: pd.DataFrame
+    trained_at: datetime
+    version: int = ARTIFACT_VERSION
+
+
+def data_fingerprint(connection: DatabaseConnection) -> Fingerprint:
+    """Huella de `transaccion` (contador de escrituras, mayor id, filas, suma de montos, última fecha)."""
+    row = TransaccionRepository(connection).data_fingerprint()
+    return (
+        row.get("version"),
+        row.get("max_id"),
+        row.get("filas"),
+        str(row.get("suma_monto")),
+        str(row.get("ultima_fecha")),
+    )
+
+
+def _default_directory() -> Path:
+    configured = os.getenv("FINANZAS_MODEL_DIR")
+    if configured:
+        return Path(configured)
+    return Path.home() / ".finanzas_app" / "modelos"
+
+
+class ModelStore:
+    """Guarda en disco un artefacto por base de datos y lo mantiene en memoria.
+
+    El archivo se reemplaza de forma atómica, así que un entrenamiento en segundo
+    plano nunca deja a la vista un artefacto a medio escribir.
+    """
+
+    def __init__(self, connection: DatabaseConnection, directory: Optional[Path] = None) -> None:
+        self._connection = connection
+        self.path = (directory or _default_directory()) / f"prediccion_{connection.label}.joblib"
+        self._lock = threading.Lock()
+        self._loaded: Optional[ModelArtifact] = None
+
+    @property
+    def connection(self) -> DatabaseConnection:
+        return self._connection
+
+    def fingerprint(self) -> Fingerprint:
+        return data_fingerprint(self._connection)
+
+    def load(self) -> Optional[ModelArtifact]:
+        """Último artefacto guardado, o None si no hay uno utilizable."""
+        with self._lock:
+            if self._loaded is not None:
+                return self._loaded
+            if not self.path.exists():
+                return None
+            try:
+                artifact = joblib.load(self.path)
+            except Exception:
+                # Un archivo dañado o de otra versión de scikit-learn se trata como ausente.
+                return None
+            if not isinstance(artifact, ModelArtifact) or artifact.version != ARTIFACT_VERSION:
+                return None
+            self._loaded = artifact
+            return artifact
+
+    def save(self, artifact: ModelArtifact) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_suffix(".tmp")
+            joblib.dump(artifact, temporary)
+            os.replace(temporary, self.path)
+            self._loaded = artifact
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loaded = None
+            self.path.unlink(missing_ok=True)
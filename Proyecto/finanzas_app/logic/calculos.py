@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..db.connection import DatabaseConnection
+from ..db.periodos import period_bounds, period_filter
+from ..db.profiler import query_profiler
 from ..repositories import FinancialReportRepository
 
 
@@ -15,59 +18,97 @@ def _get_current_period() -> Tuple[int, int]:
 def _scalar_query(query: str, params: Tuple[Any, ...]) -> Optional[float]:
     db_conn = DatabaseConnection()
     with db_conn.get_connection() as connection:
-        with connection.cursor() as cursor:
+        with connection.cursor() as cursor, query_profiler.measure(db_conn, query, params) as measure:
             cursor.execute(query, params)
             row = cursor.fetchone()
+            measure.rows = 1 if row else 0
             if not row or row[0] is None:
                 return None
             return float(row[0])
 
 
-def _net_balance(year: int, month: Optional[int] = None) -> Optional[float]:
-    query = """
-    SELECT SUM(t.monto * CASE WHEN c.tipo = 'ingreso' THEN 1 ELSE -1 END)
+@dataclass(frozen=True)
+class DashboardStats:
+    """Indicadores del tablero para un periodo; `None` significa que no hay datos."""
+
+    year: int
+    month: int
+    monthly_savings: Optional[float] = None
+    annual_savings: Optional[float] = None
+    monthly_expenses: Optional[float] = None
+    monthly_incomes: Optional[float] = None
+    monthly_budget: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# Cada KPI es una agregación condicional evaluada en una única pasada sobre el año.
+# Para añadir un indicador basta con sumar una entrada aquí y el campo en DashboardStats.
+_IN_MONTH = "t.fecha >= %(month_start)s AND t.fecha < %(month_end)s"
+_SIGNED_AMOUNT = "t.monto * CASE WHEN c.tipo = 'ingreso' THEN 1 ELSE -1 END"
+_TRANSACTION_KPIS: Dict[str, str] = {
+    "monthly_savings": f"SUM(CASE WHEN {_IN_MONTH} THEN {_SIGNED_AMOUNT} END)",
+    "annual_savings": f"SUM({_SIGNED_AMOUNT})",
+    "monthly_expenses": f"SUM(CASE WHEN {_IN_MONTH} AND c.tipo = 'gasto' THEN t.monto END)",
+    "monthly_incomes": f"SUM(CASE WHEN {_IN_MONTH} AND c.tipo = 'ingreso' THEN t.monto END)",
+}
+_BUDGET_KPIS: Dict[str, str] = {
+    "monthly_budget": "SUM(CASE WHEN p.mes = %(month)s THEN p.monto END)",
+}
+
+
+def _kpi_select(kpis: Dict[str, str]) -> str:
+    return ",\n        ".join(f"{expression} AS {name}" for name, expression in kpis.items())
+
+
+def compute_dashboard_stats(
+    year: int,
+    month: int,
+    connection: DatabaseConnection | None = None,
+) -> DashboardStats:
+    """Calcula todos los KPIs con una consulta por tabla sobre una sola conexión."""
+    year_start, year_end = period_bounds(year)
+    month_start, month_end = period_bounds(year, month)
+    params = {
+        "year": year,
+        "month": month,
+        "year_start": year_start,
+        "year_end": year_end,
+        "month_start": month_start,
+        "month_end": month_end,
+    }
+    transaction_query = f"""
+    SELECT
+        {_kpi_select(_TRANSACTION_KPIS)}
     FROM transaccion t
     JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
-    WHERE YEAR(t.fecha) = %s
+    WHERE t.fecha >= %(year_start)s
+      AND t.fecha < %(year_end)s
     """
-    params: Tuple[Any, ...] = (year,)
-    if month is not None:
-        query += " AND MONTH(t.fecha) = %s"
-        params = (year, month)
-    return _scalar_query(query, params)
-
-
-def _sum_by_type(year: int, month: int, tipo: str) -> Optional[float]:
-    query = """
-    SELECT SUM(t.monto)
-    FROM transaccion t
-    JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
-    WHERE YEAR(t.fecha) = %s
-      AND MONTH(t.fecha) = %s
-      AND c.tipo = %s
+    budget_query = f"""
+    SELECT
+        {_kpi_select(_BUDGET_KPIS)}
+    FROM presupuesto_especifico p
+    WHERE p.anio = %(year)s
     """
-    return _scalar_query(query, (year, month, tipo))
-
-
-def _monthly_budget(year: int, month: int) -> Optional[float]:
-    query = """
-        SELECT SUM(monto)
-        FROM presupuesto_especifico
-    WHERE anio = %s
-      AND mes = %s
-    """
-    return _scalar_query(query, (year, month))
-
-
-def obtener_dashboard_stats() -> Dict[str, Optional[float]]:
+    values: Dict[str, Optional[float]] = {}
+    db_conn = connection or DatabaseConnection()
+    with db_conn.get_connection() as conn:
+        with conn.cursor(dictionary=True) as cursor:
+            for query in (transaction_query, budget_query):
+                with query_profiler.measure(db_conn, query, params) as measure:
+                    cursor.execute(query, params)
+                    row = cursor.fetchone() or {}
+                    measure.rows = 1 if row else 0
+                for name, value in row.items():
+                    values[name] = float(value) if value is not None else None
+    return DashboardStats(year=year, month=month, **values)
+
+
+def obtener_dashboard_stats() -> DashboardStats:
     year, month = _get_current_period()
-    return {
-        "monthly_savings": _net_balance(year, month),
-        "annual_savings": _net_balance(year),
-        "monthly_expenses": _sum_by_type(year, month, "gasto"),
-        "monthly_incomes": _sum_by_type(year, month, "ingreso"),
-        "monthly_budget": _monthly_budget(year, month),
-    }
+    return compute_dashboard_stats(year, month)
 
 
 def available_years() -> List[int]:
@@ -76,14 +117,15 @@ def available_years() -> List[int]:
 
 
 def _sum_transacciones(year: int, tipo: str) -> Optional[float]:
-    query = """
+    period_clauses, params = period_filter(year)
+    query = f"""
     SELECT SUM(t.monto)
     FROM transaccion t
     JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
-    WHERE YEAR(t.fecha) = %s
+    WHERE {' AND '.join(period_clauses)}
       AND c.tipo = %s
     """
-    return _scalar_query(query, (year, tipo))
+    return _scalar_query(query, (*params, tipo))
 
 
 def annual_income(year: int) -> Optional[float]:
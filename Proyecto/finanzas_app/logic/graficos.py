@@ -2,39 +2,135 @@
 
 from __future__ import annotations
 
+import hashlib
+import pickle
+import threading
 from calendar import month_name
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
+import matplotlib
 import pandas as pd
 import tkinter as tk
+
+# Las figuras se construyen en hilos de trabajo (ver `gui/chart_panel.py`); pyplot no
+# debe crear ventanas Tk fuera del hilo principal, así que se fija un backend sin GUI.
+# La GUI las muestra igualmente con `FigureCanvasTkAgg`.
+matplotlib.use("Agg")
+
 from matplotlib.figure import Figure
 from matplotlib import pyplot as plt
 from plotnine import *
 
+from ..db.columnar import frame_from_rows
 from ..db.connection import DatabaseConnection
+from ..db.periodos import period_filter
+from ..db.profiler import query_profiler
 from ..repositories import FinancialReportRepository, ImpuestoAnualRepository
 
 
 def _value_for_type(year: int, month: int, tipo: str) -> float:
     """Consulta la suma de montos de una categoría de tipo `tipo` en el mes solicitado."""
-    query = """
+    period_clauses, params = period_filter(year, month)
+    query = f"""
     SELECT SUM(t.monto)
     FROM transaccion t
     JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
-    WHERE YEAR(t.fecha) = %s
-      AND MONTH(t.fecha) = %s
+    WHERE {' AND '.join(period_clauses)}
       AND c.tipo = %s
     """
-    with DatabaseConnection().get_connection() as conn:
-        with conn.cursor() as cursor:
-            cursor.execute(query, (year, month, tipo))
+    db_conn = DatabaseConnection()
+    with db_conn.get_connection() as conn:
+        with conn.cursor() as cursor, query_profiler.measure(db_conn, query, (*params, tipo)) as measure:
+            cursor.execute(query, (*params, tipo))
             row = cursor.fetchone()
+            measure.rows = 1 if row else 0
             if not row or row[0] is None:
                 return 0.0
             return float(row[0])
 
 
+def _draw(plot: ggplot) -> Figure:
+    """Dibuja un gráfico de plotnine y lo retira del registro global de pyplot."""
+    figure = plot.draw()
+    # Sin cerrar, pyplot conserva una referencia a cada figura y la memoria crece en cada refresco.
+    plt.close(figure)
+    return figure
+
+
+class FigureCache:
+    """Figuras ya dibujadas, indexadas por (gráfico, parámetros, huella de los datos, tamaño).
+
+    Como la huella se calcula sobre las filas de origen, una figura sólo se reutiliza
+    mientras los datos sean idénticos; no hace falta invalidarla tras una escritura.
+    Se guarda la figura serializada con `pickle`, no el objeto: cada llamada recibe su
+    propia copia, así dos lienzos (p. ej. tablero y objetivos) nunca comparten ni
+    reescalan la misma figura. El número de entradas está acotado y se desaloja la
+    menos usada.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self._maxsize = maxsize
+        self._figures: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Figure]) -> Figure:
+        with self._lock:
+            payload = self._figures.get(key)
+            if payload is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if payload is not None:
+            return pickle.loads(payload)
+        # El dibujo se hace fuera del candado para no serializar a los hilos de la GUI.
+        figure = build()
+        try:
+            payload = pickle.dumps(figure, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Una figura que no se puede serializar se entrega igual, sin guardarla.
+            return figure
+        with self._lock:
+            self._figures[key] = payload
+            self._figures.move_to_end(key)
+            while len(self._figures) > self._maxsize:
+                self._figures.popitem(last=False)
+        return figure
+
+    def clear(self) -> None:
+        with self._lock:
+            self._figures.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._figures)}
+
+
+figure_cache = FigureCache()
+
+
+def _fingerprint(data: Any) -> str:
+    """Huella estable de las filas que alimentan un gráfico."""
+    return hashlib.blake2b(repr(data).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cached_figure(
+    name: str,
+    params: Tuple[Any, ...],
+    data: Any,
+    size: Tuple[float, float],
+    build: Callable[[], Figure],
+) -> Figure:
+    figure = figure_cache.get_or_build((name, params, _fingerprint(data), size), build)
+    # La copia es de quien la pidió: fijar su tamaño nominal no afecta a otros lienzos.
+    figure.set_size_inches(size, forward=False)
+    return figure
+
+
 def _get_period(year: Optional[int] = None, month: Optional[int] = None) -> Tuple[int, int]:
     """Devuelve (año, mes) usando la fecha actual cuando no se especifica un valor."""
     now = datetime.now()
@@ -106,38 +202,42 @@ def monthly_budget_pie_data(year: Optional[int] = None, month: Optional[int] = N
 def budget_pie_figure(year: int, month: int) -> Figure:
     """Devuelve un pastel de los presupuestos del periodo usando Matplotlib."""
     label, slices = monthly_budget_pie_data(year, month)
-    fig = Figure(figsize=(6, 4))
-    ax = fig.subplots()
-    if not slices:
-        ax.text(0.5, 0.5, "Sin presupuesto específico", ha="center", va="center", fontsize=11, color="#888")
-        ax.set_axis_off()
+
+    def build() -> Figure:
+        fig = Figure(figsize=(6, 4))
+        ax = fig.subplots()
+        if not slices:
+            ax.text(0.5, 0.5, "Sin presupuesto específico", ha="center", va="center", fontsize=11, color="#888")
+            ax.set_axis_off()
+            return fig
+
+        totals = [value for _, value in slices]
+        labels = [name for name, _ in slices]
+        cmap = plt.get_cmap("Set3")
+        colors = [cmap(i / max(len(labels) - 1, 1)) for i in range(len(labels))]
+        # Dibujamos el pastel con porcentajes y leyenda lateral para la categoría.
+        wedges, _, _ = ax.pie(
+            totals,
+            labels=None,
+            autopct="%.1f%%",
+            startangle=90,
+            colors=colors,
+            wedgeprops={"edgecolor": "white"},
+        )
+        ax.set_title(label)
+        ax.axis("equal")
+        ax.legend(
+            wedges,
+            labels,
+            title="Categoría",
+            loc="center left",
+            bbox_to_anchor=(1.05, 0.5),
+            frameon=False,
+        )
+        fig.subplots_adjust(left=0.08, right=0.65)
         return fig
 
-    totals = [value for _, value in slices]
-    labels = [name for name, _ in slices]
-    cmap = plt.get_cmap("Set3")
-    colors = [cmap(i / max(len(labels) - 1, 1)) for i in range(len(labels))]
-    # Dibujamos el pastel con porcentajes y leyenda lateral para la categoría.
-    wedges, _, _ = ax.pie(
-        totals,
-        labels=None,
-        autopct="%.1f%%",
-        startangle=90,
-        colors=colors,
-        wedgeprops={"edgecolor": "white"},
-    )
-    ax.set_title(label)
-    ax.axis("equal")
-    ax.legend(
-        wedges,
-        labels,
-        title="Categoría",
-        loc="center left",
-        bbox_to_anchor=(1.05, 0.5),
-        frameon=False,
-    )
-    fig.subplots_adjust(left=0.08, right=0.65)
-    return fig
+    return _cached_figure("budget_pie_figure", (year, month), (label, slices), (6, 4), build)
 
 
 def _objective_total_for_month(year: int, month: int) -> float:
@@ -159,32 +259,36 @@ def monthly_objective_comparison_data(
 
 def objective_comparison_figure(year: int, month: int) -> Figure:
     label, data, difference = monthly_objective_comparison_data(year, month)
-    records = [{"tipo": name, "total": value} for name, value in data]
-    df = pd.DataFrame(records)
-    fig = Figure(figsize=(6, 4))
-    if df.empty:
-        ax = fig.subplots()
-        ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
-        ax.set_axis_off()
-        return fig
 
-    # Usamos plotnine para mantener la línea visual con los demás gráficos.
-    plot = (
-        ggplot(df, aes(x="tipo", y="total", fill="tipo"))
-        + geom_col(width=0.6)
-        + labs(title=label, x="Tipo", y="Monto ($)")
-        + scale_fill_brewer(type="qual", palette="Set2")
-        + theme_minimal()
-        + theme(
-            axis_text_x=element_text(rotation=0, hjust=0.5),
-            figure_size=(6, 4),
-            legend_position="none",
+    def build() -> Figure:
+        records = [{"tipo": name, "total": value} for name, value in data]
+        df = pd.DataFrame(records)
+        fig = Figure(figsize=(6, 4))
+        if df.empty:
+            ax = fig.subplots()
+            ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
+            ax.set_axis_off()
+            return fig
+
+        # Usamos plotnine para mantener la línea visual con los demás gráficos.
+        plot = (
+            ggplot(df, aes(x="tipo", y="total", fill="tipo"))
+            + geom_col(width=0.6)
+            + labs(title=label, x="Tipo", y="Monto ($)")
+            + scale_fill_brewer(type="qual", palette="Set2")
+            + theme_minimal()
+            + theme(
+                axis_text_x=element_text(rotation=0, hjust=0.5),
+                figure_size=(6, 4),
+                legend_position="none",
+            )
         )
-    )
-    figure = plot.draw()
-    ax = figure.axes[0]
-    ax.text(0.02, 0.95, f"Ahorro mensual: ${difference:,.2f}", transform=ax.transAxes, va="top", fontsize=9, color="#555")
-    return figure
+        figure = _draw(plot)
+        ax = figure.axes[0]
+        ax.text(0.02, 0.95, f"Ahorro mensual: ${difference:,.2f}", transform=ax.transAxes, va="top", fontsize=9, color="#555")
+        return figure
+
+    return _cached_figure("objective_comparison_figure", (year, month), (label, data), (6, 4), build)
 
 
 def fixed_monthly_stacked_data(year: int) -> Tuple[List[str], List[str], Dict[str, List[float]]]:
@@ -208,33 +312,37 @@ def fixed_monthly_stacked_data(year: int) -> Tuple[List[str], List[str], Dict[st
 
 def fixed_category_stacked_figure(year: int) -> Figure:
     months, categories, series = fixed_monthly_stacked_data(year)
-    records: list[dict[str, float | str]] = []
-    for category in categories:
-        values = series.get(category, [0.0] * len(months))
-        for idx, total in enumerate(values):
-            records.append({"mes": months[idx], "categoria": category, "total": total})
-    df = pd.DataFrame(records)
-    if df.empty:
-        fig = Figure(figsize=(8, 4))
-        ax = fig.subplots()
-        ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
-        ax.set_axis_off()
-        return fig
-    plot = (
-        ggplot(df, aes(x="mes", y="total", fill="categoria"))
-        + geom_bar(stat="identity")
-        + labs(title=f"Gastos fijos mensuales {year}", x="Mes", y="Gastos ($)")
-        + scale_fill_brewer(type="qual", palette="Set3")
-        + scale_x_discrete(limits=months)
-        + theme_minimal()
-        + theme(
-            axis_text_x=element_text(rotation=45, hjust=1),
-            figure_size=(8, 4),
-            legend_position="right",
+
+    def build() -> Figure:
+        records: list[dict[str, float | str]] = []
+        for category in categories:
+            values = series.get(category, [0.0] * len(months))
+            for idx, total in enumerate(values):
+                records.append({"mes": months[idx], "categoria": category, "total": total})
+        df = pd.DataFrame(records)
+        if df.empty:
+            fig = Figure(figsize=(8, 4))
+            ax = fig.subplots()
+            ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
+            ax.set_axis_off()
+            return fig
+        plot = (
+            ggplot(df, aes(x="mes", y="total", fill="categoria"))
+            + geom_bar(stat="identity")
+            + labs(title=f"Gastos fijos mensuales {year}", x="Mes", y="Gastos ($)")
+            + scale_fill_brewer(type="qual", palette="Set3")
+            + scale_x_discrete(limits=months)
+            + theme_minimal()
+            + theme(
+                axis_text_x=element_text(rotation=45, hjust=1),
+                figure_size=(8, 4),
+                legend_position="right",
+            )
         )
-    )
-    figure = plot.draw()
-    return figure
+        figure = _draw(plot)
+        return figure
+
+    return _cached_figure("fixed_category_stacked_figure", (year,), (categories, series), (8, 4), build)
 
 
 def variable_month_pie_data(year: int, month: int) -> Tuple[str, List[Tuple[str, float]]]:
@@ -272,166 +380,190 @@ def variable_annual_trend_data(year: int, category_id: Optional[int] = None, cat
 
 def variable_month_pie_figure(year: int, month: int) -> Figure:
     label, data = variable_month_pie_data(year, month)
-    records = [{"categoria": name, "total": total} for name, total in data]
-    df = pd.DataFrame(records)
-    if df.empty:
+
+    def build() -> Figure:
+        records = [{"categoria": name, "total": total} for name, total in data]
+        df = pd.DataFrame(records)
+        if df.empty:
+            fig = Figure(figsize=(6, 4))
+            ax = fig.subplots()
+            ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
+            ax.set_axis_off()
+            return fig
         fig = Figure(figsize=(6, 4))
         ax = fig.subplots()
-        ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
-        ax.set_axis_off()
+        totals = df["total"].tolist()
+        labels = df["categoria"].tolist()
+        cmap = plt.get_cmap("Set3")
+        colors = [cmap(i / max(len(labels) - 1, 1)) for i in range(len(labels))]
+        # Dibujamos un pastel clásico usando los totales y etiquetamos con leyendas laterales.
+        wedges, _, _ = ax.pie(
+            totals,
+            labels=None,
+            autopct="%.1f%%",
+            startangle=90,
+            colors=colors,
+            wedgeprops={"edgecolor": "white"},
+        )
+        ax.set_title(label)
+        ax.axis("equal")
+        ax.legend(
+            wedges,
+            labels,
+            title="Categorías",
+            loc="center left",
+            bbox_to_anchor=(1, 0.5),
+            frameon=False,
+        )
+        fig.subplots_adjust(left=0.08, right=0.65)
         return fig
-    fig = Figure(figsize=(6, 4))
-    ax = fig.subplots()
-    totals = df["total"].tolist()
-    labels = df["categoria"].tolist()
-    cmap = plt.get_cmap("Set3")
-    colors = [cmap(i / max(len(labels) - 1, 1)) for i in range(len(labels))]
-    # Dibujamos un pastel clásico usando los totales y etiquetamos con leyendas laterales.
-    wedges, _, _ = ax.pie(
-        totals,
-        labels=None,
-        autopct="%.1f%%",
-        startangle=90,
-        colors=colors,
-        wedgeprops={"edgecolor": "white"},
-    )
-    ax.set_title(label)
-    ax.axis("equal")
-    ax.legend(
-        wedges,
-        labels,
-        title="Categorías",
-        loc="center left",
-        bbox_to_anchor=(1, 0.5),
-        frameon=False,
-    )
-    fig.subplots_adjust(left=0.08, right=0.65)
-    return fig
+
+    return _cached_figure("variable_month_pie_figure", (year, month), (label, data), (6, 4), build)
 
 
 def variable_annual_trend_figure(year: int, category_id: Optional[int] = None, category_label: str | None = None) -> Figure:
     label, data = variable_annual_trend_data(year, category_id, category_label)
-    df = pd.DataFrame(data, columns=["mes", "total"])
-    if df.empty:
-        fig = Figure(figsize=(8, 4))
-        ax = fig.subplots()
-        ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
-        ax.set_axis_off()
-        return fig
-    limits = [row[0] for row in data]
-    plot = (
-        ggplot(df, aes(x="mes", y="total", group=1))
-        + geom_line(color="#1976d2", size=1.4)
-        + geom_point(color="#1976d2", size=3)
-        + labs(title=label, x="Mes", y="Gastos ($)")
-        + scale_x_discrete(limits=limits)
-        + theme_minimal()
-        + theme(
-            axis_text_x=element_text(rotation=45, hjust=1),
-            figure_size=(8, 4),
+
+    def build() -> Figure:
+        df = pd.DataFrame(data, columns=["mes", "total"])
+        if df.empty:
+            fig = Figure(figsize=(8, 4))
+            ax = fig.subplots()
+            ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
+            ax.set_axis_off()
+            return fig
+        limits = [row[0] for row in data]
+        plot = (
+            ggplot(df, aes(x="mes", y="total", group=1))
+            + geom_line(color="#1976d2", size=1.4)
+            + geom_point(color="#1976d2", size=3)
+            + labs(title=label, x="Mes", y="Gastos ($)")
+            + scale_x_discrete(limits=limits)
+            + theme_minimal()
+            + theme(
+                axis_text_x=element_text(rotation=45, hjust=1),
+                figure_size=(8, 4),
+            )
         )
-    )
-    figure = plot.draw()
-    return figure
+        figure = _draw(plot)
+        return figure
+
+    return _cached_figure("variable_annual_trend_figure", (year, category_id, category_label), (label, data), (8, 4), build)
 
 
 def monthly_incomes_stacked_figure(year: int) -> Figure:
     repo = FinancialReportRepository(DatabaseConnection())
     rows = repo.monthly_incomes_by_category(year)
-    months = [month_name[i] for i in range(1, 13)]
-    if not rows:
-        fig = Figure(figsize=(8, 4))
-        ax = fig.subplots()
-        ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
-        ax.set_axis_off()
-        return fig
-    records: list[dict[str, float | str]] = []
-    for row in rows:
-        periodo = row.get("periodo") or ""
-        nombre = row.get("nombre") or "Sin categoría"
-        total = float(row.get("total") or 0.0)
-        try:
-            month_index = int(periodo.split("-")[1])
-        except (IndexError, ValueError):
-            continue
-        if not 1 <= month_index <= 12:
-            continue
-        records.append({"mes": month_name[month_index], "categoria": nombre, "total": total})
-    df = pd.DataFrame(records)
-    if df.empty:
-        fig = Figure(figsize=(8, 4))
-        ax = fig.subplots()
-        ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
-        ax.set_axis_off()
-        return fig
-    df["mes"] = pd.Categorical(df["mes"], categories=months, ordered=True)
-    plot = (
-        ggplot(df, aes(x="mes", y="total", fill="categoria"))
-        + geom_col(position="stack")
-        + labs(title=f"Ingresos mensuales por categoría {year}", x="Mes", y="Ingresos ($)")
-        + scale_fill_brewer(type="qual", palette="Set3")
-        + scale_x_discrete(limits=months)
-        + theme_minimal()
-        + theme(
-            axis_text_x=element_text(rotation=45, hjust=1),
-            figure_size=(8, 4),
+
+    def build() -> Figure:
+        months = [month_name[i] for i in range(1, 13)]
+        if not rows:
+            fig = Figure(figsize=(8, 4))
+            ax = fig.subplots()
+            ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
+            ax.set_axis_off()
+            return fig
+        records: list[dict[str, float | str]] = []
+        for row in rows:
+            periodo = row.get("periodo") or ""
+            nombre = row.get("nombre") or "Sin categoría"
+            total = float(row.get("total") or 0.0)
+            try:
+                month_index = int(periodo.split("-")[1])
+            except (IndexError, ValueError):
+                continue
+            if not 1 <= month_index <= 12:
+                continue
+            records.append({"mes": month_name[month_index], "categoria": nombre, "total": total})
+        df = pd.DataFrame(records)
+        if df.empty:
+            fig = Figure(figsize=(8, 4))
+            ax = fig.subplots()
+            ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
+            ax.set_axis_off()
+            return fig
+        df["mes"] = pd.Categorical(df["mes"], categories=months, ordered=True)
+        plot = (
+            ggplot(df, aes(x="mes", y="total", fill="categoria"))
+            + geom_col(position="stack")
+            + labs(title=f"Ingresos mensuales por categoría {year}", x="Mes", y="Ingresos ($)")
+            + scale_fill_brewer(type="qual", palette="Set3")
+            + scale_x_discrete(limits=months)
+            + theme_minimal()
+            + theme(
+                axis_text_x=element_text(rotation=45, hjust=1),
+                figure_size=(8, 4),
+            )
         )
-    )
-    figure = plot.draw()
-    return figure
+        figure = _draw(plot)
+        return figure
+
+    return _cached_figure("monthly_incomes_stacked_figure", (year,), rows, (8, 4), build)
 
 
 def annual_incomes_figure() -> Figure:
     repo = FinancialReportRepository(DatabaseConnection())
     rows = repo.annual_incomes()
-    df = pd.DataFrame(rows)
-    if df.empty:
-        fig = Figure(figsize=(8, 4))
-        ax = fig.subplots()
-        ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
-        ax.set_axis_off()
-        return fig
-    df["anio"] = df["anio"].astype(int)
-    df["anio_str"] = df["anio"].astype(str)
-    plot = (
-        ggplot(df, aes(x="anio_str", y="total"))
-        + geom_col(fill="#42a5f5", width=0.7)
-        + labs(title="Ingresos anuales", x="Año", y="Ingresos ($)")
-        + theme_minimal()
-        + theme(
-            axis_text_x=element_text(rotation=45, hjust=1),
-            figure_size=(8, 4),
+
+    def build() -> Figure:
+        df = frame_from_rows(rows, floats=("total",))
+        if df.empty:
+            fig = Figure(figsize=(8, 4))
+            ax = fig.subplots()
+            ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
+            ax.set_axis_off()
+            return fig
+        df["anio"] = df["anio"].astype(int)
+        df["anio_str"] = df["anio"].astype(str)
+        plot = (
+            ggplot(df, aes(x="anio_str", y="total"))
+            + geom_col(fill="#42a5f5", width=0.7)
+            + labs(title="Ingresos anuales", x="Año", y="Ingresos ($)")
+            + theme_minimal()
+            + theme(
+                axis_text_x=element_text(rotation=45, hjust=1),
+                figure_size=(8, 4),
+            )
         )
-    )
-    figure = plot.draw()
-    return figure
+        figure = _draw(plot)
+        return figure
+
+    return _cached_figure("annual_incomes_figure", (), rows, (8, 4), build)
 
 
 def annual_tax_paid_figure(figsize: tuple[int, int] = (6, 3)) -> Figure:
     """Construye la barra de los impuestos pagados por año."""
     repo = ImpuestoAnualRepository(DatabaseConnection())
     rows = repo.list_tax_payments()
-    df = pd.DataFrame(rows)
-    fig = Figure(figsize=figsize)
-    if df.empty:
-        ax = fig.subplots()
-        ax.text(0.5, 0.5, "Sin registros", ha="center", va="center", fontsize=11, color="#666")
-        ax.set_axis_off()
-        return fig
-    df["anio"] = df["anio"].astype(int)
-    df["anio_str"] = df["anio"].astype(str)
-    df["impuesto_pagado"] = df["impuesto_pagado"].astype(float)
-    plot = (
-        ggplot(df, aes(x="anio_str", y="impuesto_pagado"))
-        + geom_col(fill="#8e24aa", width=0.7)
-        + labs(title="Impuesto pagado por año", x="Año", y="Impuesto pagado ($)")
-        + theme_minimal()
-        + theme(
-            axis_text_x=element_text(rotation=45, hjust=1),
-            figure_size=(8, 4),
+
+    def build() -> Figure:
+        df = frame_from_rows(rows, floats=("impuesto_pagado",))
+        fig = Figure(figsize=figsize)
+        if df.empty:
+            ax = fig.subplots()
+            ax.text(0.5, 0.5, "Sin registros", ha="center", va="center", fontsize=11, color="#666")
+            ax.set_axis_off()
+            return fig
+        df["anio"] = df["anio"].astype(int)
+        df["anio_str"] = df["anio"].astype(str)
+        plot = (
+            ggplot(df, aes(x="anio_str", y="impuesto_pagado"))
+            + geom_col(fill="#8e24aa", width=0.7)
+            + labs(title="Impuesto pagado por año", x="Año", y="Impuesto pagado ($)")
+            + theme_minimal()
+            + theme(
+                axis_text_x=element_text(rotation=45, hjust=1),
+                figure_size=(8, 4),
+            )
         )
-    )
-    return plot.draw()
+        return _draw(plot)
+
+    return _cached_figure("annual_tax_paid_figure", (), rows, tuple(figsize), build)
+
+
+def _month_names(months: pd.Series) -> pd.Series:
+    """Nombre del mes para una columna de números de mes, sin recorrer filas en Python."""
+    return months.astype(int).map(dict(enumerate(month_name)))
 
 
 def _empty_placeholder_figure(message: str, size: tuple[int, int] = (8, 4)) -> Figure:
@@ -442,13 +574,10 @@ def _empty_placeholder_figure(message: str, size: tuple[int, int] = (8, 4)) -> F
     return fig
 
 
-def monthly_spending_bar_figure(year: int, month: int) -> Figure:
-    repo = FinancialReportRepository(DatabaseConnection())
-    rows = repo.expenses_by_category(year, month)
+def monthly_spending_bar_from_rows(rows: List[Dict[str, Any]], year: int, month: int) -> Figure:
     if not rows:
         return _empty_placeholder_figure("Sin datos de gasto por categoría")
-    df = pd.DataFrame(rows)
-    df["total"] = df["total"].astype(float)
+    df = frame_from_rows(rows, floats=("total",))
     plot = (
         ggplot(df, aes(x="categoria", y="total", fill="categoria"))
         + geom_col(show_legend=False)
@@ -456,16 +585,25 @@ def monthly_spending_bar_figure(year: int, month: int) -> Figure:
         + theme_minimal()
         + theme(axis_text_x=element_text(rotation=45, hjust=1), figure_size=(8, 4))
     )
-    return plot.draw()
+    return _draw(plot)
 
 
-def monthly_spending_pie_figure(year: int, month: int) -> Figure:
+def monthly_spending_bar_figure(year: int, month: int) -> Figure:
     repo = FinancialReportRepository(DatabaseConnection())
     rows = repo.expenses_by_category(year, month)
-    df = pd.DataFrame(rows)
+    return _cached_figure(
+        "monthly_spending_bar_figure",
+        (year, month),
+        rows,
+        (8, 4),
+        lambda: monthly_spending_bar_from_rows(rows, year, month),
+    )
+
+
+def monthly_spending_pie_from_rows(rows: List[Dict[str, Any]], year: int, month: int) -> Figure:
+    df = frame_from_rows(rows, floats=("total",))
     if df.empty:
         return _empty_placeholder_figure("Sin datos para el pastel de gasto")
-    df["total"] = df["total"].astype(float)
     fig = Figure(figsize=(6, 4))
     ax = fig.subplots()
     wedges, _, _ = ax.pie(
@@ -481,14 +619,22 @@ def monthly_spending_pie_figure(year: int, month: int) -> Figure:
     return fig
 
 
-def monthly_daily_expense_line_figure(year: int, month: int) -> Figure:
+def monthly_spending_pie_figure(year: int, month: int) -> Figure:
     repo = FinancialReportRepository(DatabaseConnection())
-    rows = repo.daily_totals_by_type(year, month, "gasto")
+    rows = repo.expenses_by_category(year, month)
+    return _cached_figure(
+        "monthly_spending_pie_figure",
+        (year, month),
+        rows,
+        (6, 4),
+        lambda: monthly_spending_pie_from_rows(rows, year, month),
+    )
+
+
+def monthly_daily_expense_line_from_rows(rows: List[Dict[str, Any]], year: int, month: int) -> Figure:
     if not rows:
         return _empty_placeholder_figure("Sin datos diarios de gasto")
-    df = pd.DataFrame(rows)
-    df["total"] = df["total"].astype(float)
-    df["fecha"] = pd.to_datetime(df["fecha"])
+    df = frame_from_rows(rows, floats=("total",), dates=("fecha",))
     plot = (
         ggplot(df, aes(x="fecha", y="total"))
         + geom_line(color="#d32f2f")
@@ -497,23 +643,29 @@ def monthly_daily_expense_line_figure(year: int, month: int) -> Figure:
         + theme_minimal()
         + theme(axis_text_x=element_text(rotation=45, hjust=1), figure_size=(8, 4))
     )
-    return plot.draw()
+    return _draw(plot)
 
 
-def monthly_income_vs_expense_stacked_figure(year: int, month: int) -> Figure:
+def monthly_daily_expense_line_figure(year: int, month: int) -> Figure:
     repo = FinancialReportRepository(DatabaseConnection())
-    expense_rows = repo.daily_totals_by_type(year, month, "gasto")
-    income_rows = repo.daily_totals_by_type(year, month, "ingreso")
-    df_expense = pd.DataFrame(expense_rows)
-    df_income = pd.DataFrame(income_rows)
+    rows = repo.daily_totals_by_type(year, month, "gasto")
+    return _cached_figure(
+        "monthly_daily_expense_line_figure",
+        (year, month),
+        rows,
+        (8, 4),
+        lambda: monthly_daily_expense_line_from_rows(rows, year, month),
+    )
+
+
+def monthly_income_vs_expense_stacked_from_rows(expense_rows: List[Dict[str, Any]], income_rows: List[Dict[str, Any]], year: int, month: int) -> Figure:
+    df_expense = frame_from_rows(expense_rows, floats=("total",), dates=("fecha",))
+    df_income = frame_from_rows(income_rows, floats=("total",), dates=("fecha",))
     if df_expense.empty and df_income.empty:
         return _empty_placeholder_figure("Sin datos de ingresos y gastos diarios")
-    df_expense["total"] = df_expense["total"].astype(float)
-    df_income["total"] = df_income["total"].astype(float)
     df_expense["tipo"] = "Gasto"
     df_income["tipo"] = "Ingreso"
     df_union = pd.concat([df_expense, df_income], ignore_index=True)
-    df_union["fecha"] = pd.to_datetime(df_union["fecha"])
     plot = (
         ggplot(df_union, aes(x="fecha", y="total", fill="tipo"))
         + geom_col(position="stack")
@@ -521,16 +673,26 @@ def monthly_income_vs_expense_stacked_figure(year: int, month: int) -> Figure:
         + theme_minimal()
         + theme(axis_text_x=element_text(rotation=45, hjust=1), figure_size=(8, 4))
     )
-    return plot.draw()
+    return _draw(plot)
 
 
-def monthly_expense_heatmap_figure(year: int, month: int) -> Figure:
+def monthly_income_vs_expense_stacked_figure(year: int, month: int) -> Figure:
     repo = FinancialReportRepository(DatabaseConnection())
-    rows = repo.weekly_expense_heatmap(year, month)
+    expense_rows = repo.daily_totals_by_type(year, month, "gasto")
+    income_rows = repo.daily_totals_by_type(year, month, "ingreso")
+    return _cached_figure(
+        "monthly_income_vs_expense_stacked_figure",
+        (year, month),
+        (expense_rows, income_rows),
+        (8, 4),
+        lambda: monthly_income_vs_expense_stacked_from_rows(expense_rows, income_rows, year, month),
+    )
+
+
+def monthly_expense_heatmap_from_rows(rows: List[Dict[str, Any]], year: int, month: int) -> Figure:
     if not rows:
         return _empty_placeholder_figure("Sin datos para el heatmap")
-    df = pd.DataFrame(rows)
-    df["total"] = df["total"].astype(float)
+    df = frame_from_rows(rows, floats=("total",))
     pivot = df.pivot(index="dia_semana", columns="semana", values="total").fillna(0)
     fig = Figure(figsize=(8, 4))
     ax = fig.subplots()
@@ -547,15 +709,23 @@ def monthly_expense_heatmap_figure(year: int, month: int) -> Figure:
     return fig
 
 
-def annual_expense_line_figure(year: int) -> Figure:
+def monthly_expense_heatmap_figure(year: int, month: int) -> Figure:
     repo = FinancialReportRepository(DatabaseConnection())
-    rows = repo.monthly_expense_totals(year)
+    rows = repo.weekly_expense_heatmap(year, month)
+    return _cached_figure(
+        "monthly_expense_heatmap_figure",
+        (year, month),
+        rows,
+        (8, 4),
+        lambda: monthly_expense_heatmap_from_rows(rows, year, month),
+    )
+
+
+def annual_expense_line_from_rows(rows: List[Dict[str, Any]], year: int) -> Figure:
     if not rows:
         return _empty_placeholder_figure("Sin datos mensuales de gasto")
-    df = pd.DataFrame(rows)
-    df["mes"] = df["mes"].astype(int)
-    df["total"] = df["total"].astype(float)
-    df["mes_nombre"] = df["mes"].apply(lambda m: month_name[int(m)])
+    df = frame_from_rows(rows, floats=("total",))
+    df["mes_nombre"] = _month_names(df["mes"])
     plot = (
         ggplot(df, aes(x="mes_nombre", y="total", group=1))
         + geom_line(color="#d84315")
@@ -564,18 +734,26 @@ def annual_expense_line_figure(year: int) -> Figure:
         + theme_minimal()
         + theme(axis_text_x=element_text(rotation=45, hjust=1), figure_size=(8, 4))
     )
-    return plot.draw()
+    return _draw(plot)
 
 
-def annual_expense_by_category_stacked_figure(year: int) -> Figure:
+def annual_expense_line_figure(year: int) -> Figure:
     repo = FinancialReportRepository(DatabaseConnection())
-    rows = repo.expenses_by_category_by_month(year)
+    rows = repo.monthly_expense_totals(year)
+    return _cached_figure(
+        "annual_expense_line_figure",
+        (year,),
+        rows,
+        (8, 4),
+        lambda: annual_expense_line_from_rows(rows, year),
+    )
+
+
+def annual_expense_by_category_stacked_from_rows(rows: List[Dict[str, Any]], year: int) -> Figure:
     if not rows:
         return _empty_placeholder_figure("Sin datos por categoría")
-    df = pd.DataFrame(rows)
-    df["mes"] = df["mes"].astype(int)
-    df["total"] = df["total"].astype(float)
-    df["mes_nombre"] = df["mes"].apply(lambda m: month_name[int(m)])
+    df = frame_from_rows(rows, floats=("total",))
+    df["mes_nombre"] = _month_names(df["mes"])
     plot = (
         ggplot(df, aes(x="mes_nombre", y="total", fill="categoria"))
         + geom_col(position="stack")
@@ -583,16 +761,25 @@ def annual_expense_by_category_stacked_figure(year: int) -> Figure:
         + theme_minimal()
         + theme(axis_text_x=element_text(rotation=45, hjust=1), figure_size=(8, 4))
     )
-    return plot.draw()
+    return _draw(plot)
 
 
-def annual_expense_boxplot_figure(year: int) -> Figure:
+def annual_expense_by_category_stacked_figure(year: int) -> Figure:
     repo = FinancialReportRepository(DatabaseConnection())
-    rows = repo.monthly_expense_totals(year)
+    rows = repo.expenses_by_category_by_month(year)
+    return _cached_figure(
+        "annual_expense_by_category_stacked_figure",
+        (year,),
+        rows,
+        (8, 4),
+        lambda: annual_expense_by_category_stacked_from_rows(rows, year),
+    )
+
+
+def annual_expense_boxplot_from_rows(rows: List[Dict[str, Any]], year: int) -> Figure:
     if not rows:
         return _empty_placeholder_figure("Sin datos para el boxplot")
-    df = pd.DataFrame(rows)
-    df["total"] = df["total"].astype(float)
+    df = frame_from_rows(rows, floats=("total",))
     plot = (
         ggplot(df, aes(x="1", y="total"))
         + geom_boxplot()
@@ -600,18 +787,26 @@ def annual_expense_boxplot_figure(year: int) -> Figure:
         + theme_minimal()
         + theme(axis_text_x=element_blank(), figure_size=(6, 4))
     )
-    return plot.draw()
+    return _draw(plot)
 
 
-def annual_cumulative_savings_figure(year: int) -> Figure:
+def annual_expense_boxplot_figure(year: int) -> Figure:
     repo = FinancialReportRepository(DatabaseConnection())
-    rows = repo.monthly_savings(year)
+    rows = repo.monthly_expense_totals(year)
+    return _cached_figure(
+        "annual_expense_boxplot_figure",
+        (year,),
+        rows,
+        (6, 4),
+        lambda: annual_expense_boxplot_from_rows(rows, year),
+    )
+
+
+def annual_cumulative_savings_from_rows(rows: List[Dict[str, Any]], year: int) -> Figure:
     if not rows:
         return _empty_placeholder_figure("Sin datos de ahorro acumulado")
-    df = pd.DataFrame(rows)
-    df["periodo"] = pd.to_datetime(df["periodo"])
+    df = frame_from_rows(rows, floats=("ahorro",), dates=("periodo",))
     df = df.sort_values("periodo")
-    df["ahorro"] = df["ahorro"].astype(float)
     df["acumulado"] = df["ahorro"].cumsum()
     plot = (
         ggplot(df, aes(x="periodo", y="acumulado"))
@@ -621,4 +816,16 @@ def annual_cumulative_savings_figure(year: int) -> Figure:
         + theme_minimal()
         + theme(axis_text_x=element_text(rotation=45, hjust=1), figure_size=(8, 4))
     )
-    return plot.draw()
\ No newline at end of file
+    return _draw(plot)
+
+
+def annual_cumulative_savings_figure(year: int) -> Figure:
+    repo = FinancialReportRepository(DatabaseConnection())
+    rows = repo.monthly_savings(year)
+    return _cached_figure(
+        "annual_cumulative_savings_figure",
+        (year,),
+        rows,
+        (8, 4),
+        lambda: annual_cumulative_savings_from_rows(rows, year),
+    )
\ No newline at end of file
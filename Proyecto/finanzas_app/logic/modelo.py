@@ -11,10 +11,16 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+import threading
+import warnings
 from calendar import month_name
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from math import sqrt
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 from sklearn.ensemble import RandomForestRegressor
@@ -22,70 +28,85 @@ from sklearn.metrics import mean_absolute_error, mean_squared_error
 from sklearn.model_selection import TimeSeriesSplit
 import numpy as np
 
+from ..db.columnar import iter_transaction_frames
 from ..db.connection import DatabaseConnection
+from .almacen_modelo import Fingerprint, ModelArtifact, ModelStore
 
 MIN_RECORDS_FOR_TRAINING = 12
 RARE_CATEGORY_THRESHOLD = 5  # categorías con menos de 5 apariciones se agrupan
+STREAM_BATCH_SIZE = 5000
+GROUP_KEYS = ["year", "month", "categoria", "periodicidad", "tipo"]
+TRAINING_COLUMNS = ["monto", "cantidad", "fecha", "categoria", "periodicidad", "tipo"]
 
 
 ###############################################
-# 1. Carga de transacciones desde BD
+# 1. Carga de transacciones desde BD (en streaming)
 ###############################################
-def _fetch_transactions() -> pd.DataFrame:
-    query = """
-    SELECT
-        t.monto,
-        t.cantidad,
-        t.fecha,
-        c.nombre AS categoria,
-        c.periodicidad,
-        c.tipo
-    FROM transaccion t
-    JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
-    WHERE t.fecha IS NOT NULL
-    """
-    with DatabaseConnection().get_connection() as connection:
-        with connection.cursor(dictionary=True) as cursor:
-            cursor.execute(query)
-            rows = cursor.fetchall()
-    if not rows:
+def _aggregate_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    """Sumas parciales por mes y categoría de un lote de transacciones de gasto."""
+    df = df[df["fecha"].notna() & (df["tipo"].str.lower() == "gasto")].copy()
+    if df.empty:
         return pd.DataFrame()
-    return pd.DataFrame(rows)
+    df["cantidad"] = df["cantidad"].fillna(0)
+    df["year"] = df["fecha"].dt.year
+    df["month"] = df["fecha"].dt.month
+    # `observed=True`: con columnas `category` sólo se agrupan las combinaciones presentes.
+    return (
+        df.groupby(GROUP_KEYS, dropna=False, observed=True)
+        .agg(
+            total_monto=("monto", "sum"),
+            sum_cantidad=("cantidad", "sum"),
+            transactions=("monto", "count"),
+        )
+        .reset_index()
+    )
+
+
+def _fetch_transactions(
+    batch_size: int = STREAM_BATCH_SIZE,
+    connection: Optional[DatabaseConnection] = None,
+) -> Optional[pd.DataFrame]:
+    """Lee los gastos fechados por lotes columnares y retorna sus sumas parciales.
+
+    Sólo se piden las columnas que usa el modelo y cada lote llega ya tipado
+    (`float64`, `datetime64`, `category`); retorna `None` si no hay transacciones.
+    """
+    frames = iter_transaction_frames(
+        connection,
+        columns=TRAINING_COLUMNS,
+        tipo="gasto",
+        dated_only=True,
+        batch_size=batch_size,
+    )
+    partials = [_aggregate_chunk(frame) for frame in frames]
+    if not partials:
+        return None
+    return pd.concat(partials, ignore_index=True)
 
 
 ###############################################
 # 2. Preparación mensual agregada
 ###############################################
-def _prepare_monthly_records(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df["cantidad"] = df["cantidad"].fillna(0)
-    df["fecha"] = pd.to_datetime(df["fecha"])
-    df["year"] = df["fecha"].dt.year
-    df["month"] = df["fecha"].dt.month
-
-    df = df[df["tipo"].str.lower() == "gasto"]
-    if df.empty:
+def _prepare_monthly_records(partials: pd.DataFrame) -> pd.DataFrame:
+    if partials.empty:
         return pd.DataFrame()
 
     # Agrupar categorías raras
-    counts = df["categoria"].value_counts()
+    counts = partials.groupby("categoria", observed=True)["transactions"].sum()
     rare = counts[counts < RARE_CATEGORY_THRESHOLD].index
-    df["categoria"] = df["categoria"].replace(rare, "OTRAS")
+    partials = partials.copy()
+    partials["categoria"] = partials["categoria"].astype(str).replace(rare, "OTRAS")
 
+    # Los lotes pueden repartir un mismo mes/categoría: se combinan sus sumas.
     records = (
-        df.groupby(["year", "month", "categoria", "periodicidad", "tipo"], dropna=False)
-        .agg(
-            total_monto=("monto", "sum"),
-            avg_cantidad=("cantidad", "mean"),
-            transactions=("monto", "count"),
-        )
+        partials.groupby(GROUP_KEYS, dropna=False, observed=True)[["total_monto", "sum_cantidad", "transactions"]]
+        .sum()
         .reset_index()
     )
-
-    records["avg_cantidad"] = records["avg_cantidad"].fillna(0)
+    records["avg_cantidad"] = (records["sum_cantidad"] / records["transactions"]).fillna(0)
     records["transactions"] = records["transactions"].fillna(0)
 
-    return records
+    return records[[*GROUP_KEYS, "total_monto", "avg_cantidad", "transactions"]]
 
 
 ###############################################
@@ -93,7 +114,7 @@ def _prepare_monthly_records(df: pd.DataFrame) -> pd.DataFrame:
 ###############################################
 def _category_baseline(records: pd.DataFrame) -> pd.DataFrame:
     baseline = (
-        records.groupby(["categoria", "periodicidad", "tipo"], dropna=False)
+        records.groupby(["categoria", "periodicidad", "tipo"], dropna=False, observed=True)
         .agg(
             avg_cantidad=("avg_cantidad", "mean"),
             transactions=("transactions", "mean"),
@@ -106,43 +127,174 @@ def _category_baseline(records: pd.DataFrame) -> pd.DataFrame:
 ###############################################
 # 4. Construcción de features (One-hot + numéricos)
 ###############################################
-def _build_features(records: pd.DataFrame, required_columns: List[str] | None = None) -> pd.DataFrame:
-    base = records[["year", "month", "avg_cantidad", "transactions"]].copy()
-    categorical = pd.get_dummies(records[["categoria", "periodicidad", "tipo"]].astype(str))
-    features = pd.concat([base, categorical], axis=1)
+NUMERIC_COLUMNS = ["year", "month", "avg_cantidad", "transactions"]
+CATEGORICAL_COLUMNS = ["categoria", "periodicidad", "tipo"]
+
+
+@dataclass
+class FeatureEncoder:
+    """Codificación one-hot con un vocabulario fijo, guardado junto al modelo.
 
-    if required_columns is not None:
-        # Añadir columnas faltantes con valor 0
-        for col in required_columns:
-            if col not in features.columns:
-                features[col] = 0
-        features = features[required_columns]
+    Las columnas se nombran como `pd.get_dummies` (`categoria_<valor>`) y los
+    valores que no estaban en el entrenamiento quedan con todas sus columnas en 0.
+    """
 
-    return features
+    vocabulary: Dict[str, List[str]]
+
+    @staticmethod
+    def fit(records: pd.DataFrame) -> "FeatureEncoder":
+        return FeatureEncoder({
+            column: sorted(records[column].astype(str).unique().tolist())
+            for column in CATEGORICAL_COLUMNS
+        })
+
+    @property
+    def columns(self) -> List[str]:
+        return [
+            *NUMERIC_COLUMNS,
+            *(f"{column}_{value}" for column in CATEGORICAL_COLUMNS for value in self.vocabulary[column]),
+        ]
+
+    def transform(self, frame: pd.DataFrame) -> np.ndarray:
+        """Matriz densa (filas × columnas) construida de una vez, sin recorrer filas."""
+        matrix = np.zeros((len(frame), len(self.columns)), dtype=float)
+        matrix[:, :len(NUMERIC_COLUMNS)] = frame[NUMERIC_COLUMNS].to_numpy(dtype=float)
+        rows = np.arange(len(frame))
+        offset = len(NUMERIC_COLUMNS)
+        for column in CATEGORICAL_COLUMNS:
+            vocabulary = self.vocabulary[column]
+            codes = pd.Categorical(frame[column].astype(str), categories=vocabulary).codes
+            known = codes >= 0
+            matrix[rows[known], offset + codes[known]] = 1.0
+            offset += len(vocabulary)
+        return matrix
 
 
 ###############################################
 # 5. Entrenamiento con VALIDACIÓN TEMPORAL REAL
 ###############################################
-def _train_model(records: pd.DataFrame, forecast_horizon: int = 6):
+@dataclass(frozen=True)
+class TrainingConfig:
+    """Presupuesto de CPU y criterio de parada del entrenamiento.
+
+    - `cpu_budget`: núcleos a usar en total (por defecto todos). Se reparten entre
+      los folds que corren a la vez (`fold_workers`) y los árboles de cada bosque.
+    - `early_stopping`: los bosques crecen de `tree_step` en `tree_step` árboles
+      (`warm_start`) y se detienen cuando el error out-of-bag mejora menos que
+      `tolerance` (relativo) durante `patience` rondas, o al llegar a `n_estimators`.
+    """
+
+    n_estimators: int = 200
+    random_state: int = 42
+    n_splits: int = 5
+    cpu_budget: Optional[int] = None
+    fold_workers: int = 1
+    early_stopping: bool = False
+    tree_step: int = 25
+    tolerance: float = 0.005
+    patience: int = 2
+
+    @staticmethod
+    def from_env() -> "TrainingConfig":
+        cpu_budget = os.getenv("FINANZAS_CPU")
+        return TrainingConfig(
+            cpu_budget=int(cpu_budget) if cpu_budget else None,
+            fold_workers=int(os.getenv("FINANZAS_CV_PROCESOS", "1")),
+            early_stopping=os.getenv("FINANZAS_CV_PARADA_TEMPRANA", "0") == "1",
+        )
+
+    def jobs_per_forest(self, concurrent_fits: int) -> int:
+        budget = self.cpu_budget or os.cpu_count() or 1
+        return max(1, budget // max(1, concurrent_fits))
+
+
+def _fit_forest(features: np.ndarray, target: np.ndarray, config: TrainingConfig, n_jobs: int) -> RandomForestRegressor:
+    if not config.early_stopping:
+        model = RandomForestRegressor(
+            n_estimators=config.n_estimators, random_state=config.random_state, n_jobs=n_jobs
+        )
+        return model.fit(features, target)
+
+    step = max(1, min(config.tree_step, config.n_estimators))
+    model = RandomForestRegressor(
+        n_estimators=step,
+        random_state=config.random_state,
+        n_jobs=n_jobs,
+        warm_start=True,
+        oob_score=True,
+    )
+    best_error = float("inf")
+    rounds_without_gain = 0
+    while True:
+        with warnings.catch_warnings():
+            # Con pocos árboles algunas filas aún no tienen predicción out-of-bag.
+            warnings.simplefilter("ignore", UserWarning)
+            model.fit(features, target)
+        error = mean_absolute_error(target, model.oob_prediction_)
+        if error < best_error * (1 - config.tolerance):
+            best_error = error
+            rounds_without_gain = 0
+        else:
+            rounds_without_gain += 1
+        if rounds_without_gain >= config.patience or model.n_estimators >= config.n_estimators:
+            return model
+        model.set_params(n_estimators=min(model.n_estimators + step, config.n_estimators))
+
+
+def _fit_fold(
+    train_X: np.ndarray,
+    train_y: np.ndarray,
+    test_X: np.ndarray,
+    config: TrainingConfig,
+    n_jobs: int,
+) -> np.ndarray:
+    """Entrena un fold y retorna sus predicciones; es de nivel de módulo para el pool de procesos."""
+    return _fit_forest(train_X, train_y, config, n_jobs).predict(test_X)
+
+
+def _cross_validate(features: np.ndarray, target: np.ndarray, config: TrainingConfig) -> np.ndarray:
+    tscv = TimeSeriesSplit(n_splits=config.n_splits)
+    splits = list(tscv.split(features))
+    cv_preds = np.zeros(len(target))
+    workers = max(1, min(config.fold_workers, len(splits)))
+    n_jobs = config.jobs_per_forest(workers)
+    args = [
+        (features[train_idx], target[train_idx], features[test_idx], config, n_jobs)
+        for train_idx, test_idx in splits
+    ]
+    if workers == 1:
+        results = [_fit_fold(*fold) for fold in args]
+    else:
+        # `spawn`: el reentrenamiento corre en un hilo de la GUI y un hijo bifurcado
+        # podría heredar candados tomados por Tk u otros hilos y bloquearse.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            results = list(pool.map(_fit_fold, *zip(*args)))
+    for (_, test_idx), preds in zip(splits, results):
+        cv_preds[test_idx] = preds
+    return cv_preds
+
+
+def _train_model(records: pd.DataFrame, forecast_horizon: int = 6, config: Optional[TrainingConfig] = None):
     if len(records) < MIN_RECORDS_FOR_TRAINING:
         raise ValueError(
             f"Se necesitan al menos {MIN_RECORDS_FOR_TRAINING} registros para entrenar el modelo."
         )
+    config = config or TrainingConfig.from_env()
 
-    features = _build_features(records)
-    target = records["total_monto"].astype(float)
+    encoder = FeatureEncoder.fit(records)
+    features = encoder.transform(records)
+    target = records["total_monto"].to_numpy(dtype=float)
 
     # Separar los últimos `forecast_horizon` meses como test de predicción realista
-    train_X = features.iloc[:-forecast_horizon]
-    train_y = target.iloc[:-forecast_horizon]
+    train_X = features[:-forecast_horizon]
+    train_y = target[:-forecast_horizon]
 
-    test_X = features.iloc[-forecast_horizon:]
-    test_y = target.iloc[-forecast_horizon:]
+    test_X = features[-forecast_horizon:]
+    test_y = target[-forecast_horizon:]
 
     # Entrenar modelo final
-    model = RandomForestRegressor(n_estimators=200, random_state=42)
-    model.fit(train_X, train_y)
+    model = _fit_forest(train_X, train_y, config, config.jobs_per_forest(1))
 
     # Evaluación real (pasado -> futuro)
     preds = model.predict(test_X)
@@ -154,12 +306,7 @@ def _train_model(records: pd.DataFrame, forecast_horizon: int = 6):
     }
 
     # Cross-validation temporal
-    tscv = TimeSeriesSplit(n_splits=5)
-    cv_preds = np.zeros(len(target))
-    for train_idx, test_idx in tscv.split(features):
-        cv_model = RandomForestRegressor(n_estimators=200, random_state=42)
-        cv_model.fit(features.iloc[train_idx], target.iloc[train_idx])
-        cv_preds[test_idx] = cv_model.predict(features.iloc[test_idx])
+    cv_preds = _cross_validate(features, target, config)
 
     metrics_cv = {
         "CV_MAE": mean_absolute_error(target, cv_preds),
@@ -168,72 +315,122 @@ def _train_model(records: pd.DataFrame, forecast_horizon: int = 6):
     }
 
     importance_df = (
-        pd.DataFrame({"feature": features.columns, "importance": model.feature_importances_})
+        pd.DataFrame({"feature": encoder.columns, "importance": model.feature_importances_})
         .sort_values("importance", ascending=False)
         .reset_index(drop=True)
     )
 
     baseline = _category_baseline(records)
 
-    return model, features.columns.tolist(), metrics_real, metrics_cv, baseline, importance_df
+    return model, encoder, metrics_real, metrics_cv, baseline, importance_df
 
 
 ###############################################
 # 6. Generar períodos futuros
 ###############################################
-def _future_periods(months: int) -> List[Tuple[int, int]]:
+def _future_periods(months: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Años y meses de los `months` meses siguientes al actual."""
     today = datetime.now()
-    periods = []
-    for offset in range(1, months + 1):
-        total_month = today.month - 1 + offset
-        year = today.year + total_month // 12
-        month = (total_month % 12) + 1
-        periods.append((year, month))
-    return periods
+    total_month = today.month - 1 + np.arange(1, months + 1)
+    return today.year + total_month // 12, total_month % 12 + 1
 
 
 ###############################################
 # 7. Plantilla futura basada en categorías
 ###############################################
 def _build_future_template(baseline: pd.DataFrame, months: int) -> pd.DataFrame:
-    rows = []
-    for year, month in _future_periods(months):
-        for _, entry in baseline.iterrows():
-            rows.append({
-                "year": year,
-                "month": month,
-                "categoria": entry["categoria"],
-                "periodicidad": entry["periodicidad"],
-                "tipo": entry["tipo"],
-                "avg_cantidad": entry["avg_cantidad"],
-                "transactions": entry["transactions"],
-            })
-    return pd.DataFrame(rows)
+    """Producto cruzado meses × baseline: cada mes futuro repite todas las categorías."""
+    years, month_numbers = _future_periods(months)
+    grid = baseline.iloc[np.tile(np.arange(len(baseline)), len(years))].reset_index(drop=True)
+    grid.insert(0, "year", np.repeat(years, len(baseline)))
+    grid.insert(1, "month", np.repeat(month_numbers, len(baseline)))
+    return grid[[*NUMERIC_COLUMNS[:2], *CATEGORICAL_COLUMNS, *NUMERIC_COLUMNS[2:]]]
 
 
 ###############################################
-# 8. Predicción final para meses futuros
+# 8. Artefacto entrenado y reentrenamiento en segundo plano
 ###############################################
-def predict_future_expenses(months: int = 6):
-    transactions = _fetch_transactions()
-    if transactions.empty:
+# Un único hilo de entrenamiento: dos clics seguidos no entrenan dos bosques a la vez.
+_RETRAIN_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="modelo")
+_retrains: Dict[str, "Future[ModelArtifact]"] = {}
+_retrains_lock = threading.Lock()
+
+
+@dataclass
+class Prediction:
+    forecast: pd.DataFrame
+    metrics_real: Dict[str, float]
+    metrics_cv: Dict[str, float]
+    importance: pd.DataFrame
+    trained_at: datetime
+    # True si el modelo se entrenó con datos anteriores y ya hay uno nuevo en camino.
+    stale: bool = False
+
+
+def train_artifact(
+    fingerprint: Fingerprint,
+    connection: Optional[DatabaseConnection] = None,
+    config: Optional[TrainingConfig] = None,
+) -> ModelArtifact:
+    """Entrena desde cero con las transacciones actuales."""
+    partials = _fetch_transactions(connection=connection)
+    if partials is None:
         raise ValueError("No se encontraron transacciones para entrenar el modelo.")
 
-    records = _prepare_monthly_records(transactions)
+    records = _prepare_monthly_records(partials)
     if records.empty:
         raise ValueError("No hay datos suficientes para entrenar gastos.")
 
-    model, feature_cols, metrics_real, metrics_cv, baseline, importance_df = _train_model(records)
+    model, encoder, metrics_real, metrics_cv, baseline, importance_df = _train_model(records, config=config)
+    return ModelArtifact(
+        fingerprint=fingerprint,
+        model=model,
+        encoder=encoder,
+        feature_columns=encoder.columns,
+        metrics_real=metrics_real,
+        metrics_cv=metrics_cv,
+        baseline=baseline,
+        importance=importance_df,
+        trained_at=datetime.now(),
+    )
+
 
-    future_template = _build_future_template(baseline, months)
+def retrain_in_background(
+    store: ModelStore,
+    fingerprint: Fingerprint,
+    on_done: Optional[Callable[["Future[ModelArtifact]"], None]] = None,
+) -> "Future[ModelArtifact]":
+    """Entrena y guarda un artefacto nuevo en el hilo de entrenamiento.
 
-    future_features = _build_features(future_template, required_columns=feature_cols)
+    Si ya hay un entrenamiento en curso para el mismo archivo se reutiliza su
+    `Future`. `on_done` se invoca desde el hilo de trabajo.
+    """
+    key = str(store.path)
+    with _retrains_lock:
+        future = _retrains.get(key)
+        if future is None or future.done():
+            def run() -> ModelArtifact:
+                artifact = train_artifact(fingerprint, store.connection)
+                store.save(artifact)
+                return artifact
+
+            future = _RETRAIN_EXECUTOR.submit(run)
+            _retrains[key] = future
+    if on_done is not None:
+        future.add_done_callback(on_done)
+    return future
+
+
+def _forecast(artifact: ModelArtifact, months: int) -> pd.DataFrame:
+    future_template = _build_future_template(artifact.baseline, months)
 
-    preds = model.predict(future_features)
+    future_features = artifact.encoder.transform(future_template)
+
+    preds = artifact.model.predict(future_features)
     future_template["predicted_monto"] = preds
 
-    future_template["segment"] = future_template["periodicidad"].str.lower().apply(
-        lambda x: "Variable" if x == "variable" else "Fijo"
+    future_template["segment"] = np.where(
+        future_template["periodicidad"].astype(str).str.lower() == "variable", "Variable", "Fijo"
     )
 
     pivot = (
@@ -247,4 +444,44 @@ def predict_future_expenses(months: int = 6):
 
     pivot = pivot.sort_values(["year", "month"]).reset_index(drop=True)
 
-    return pivot[["period", "Fijo", "Variable", "total"]], metrics_real, metrics_cv, importance_df
+    return pivot[["period", "Fijo", "Variable", "total"]]
+
+
+###############################################
+# 9. Predicción final para meses futuros
+###############################################
+def predict(
+    months: int = 6,
+    store: Optional[ModelStore] = None,
+    on_retrained: Optional[Callable[["Future[ModelArtifact]"], None]] = None,
+) -> Prediction:
+    """Predice con el modelo guardado si los datos no cambiaron desde que se entrenó.
+
+    - Misma huella: se reutiliza el artefacto sin consultar las transacciones.
+    - Huella distinta: se predice con el artefacto anterior (`stale=True`) y se
+      reentrena en segundo plano; `on_retrained` avisa cuando el nuevo está listo.
+    - Sin artefacto: se entrena en el hilo actual y se guarda.
+    """
+    store = store or ModelStore(DatabaseConnection())
+    fingerprint = store.fingerprint()
+    artifact = store.load()
+    stale = False
+    if artifact is None:
+        artifact = train_artifact(fingerprint, store.connection)
+        store.save(artifact)
+    elif artifact.fingerprint != fingerprint:
+        stale = True
+        retrain_in_background(store, fingerprint, on_retrained)
+    return Prediction(
+        forecast=_forecast(artifact, months),
+        metrics_real=artifact.metrics_real,
+        metrics_cv=artifact.metrics_cv,
+        importance=artifact.importance,
+        trained_at=artifact.trained_at,
+        stale=stale,
+    )
+
+
+def predict_future_expenses(months: int = 6):
+    prediction = predict(months)
+    return prediction.forecast, prediction.metrics_real, prediction.metrics_cv, prediction.importance
@@ -0,0 +1,21 @@
+"""Reconstruye `resumen_mensual` a partir de las transacciones registradas."""
+
+from __future__ import annotations
+
+import argparse
+
+from .db.connection import DatabaseConnection
+from .repositories import ResumenMensualRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--anio", type=int, default=None, help="Reconstruye sólo el año indicado.")
+    args = parser.parse_args()
+    rows = ResumenMensualRepository(DatabaseConnection()).rebuild(args.anio)
+    alcance = f"el año {args.anio}" if args.anio is not None else "todos los años"
+    print(f"Resumen mensual reconstruido para {alcance}: {rows} filas.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from .datos import (
+    AnnualReportData,
+    MonthlyReportData,
+    YearDataset,
+    prefetch_annual,
+    prefetch_monthly,
+    prefetch_year,
+)
+from .pipeline import (
+    ReportCancelled,
+    ReportTiming,
+    build_pdf,
+    shutdown_executor,
+    write_annual_report,
+    write_monthly_report,
+)
+
+__all__ = [
+    "AnnualReportData",
+    "MonthlyReportData",
+    "YearDataset",
+    "prefetch_annual",
+    "prefetch_monthly",
+    "prefetch_year",
+    "ReportCancelled",
+    "ReportTiming",
+    "build_pdf",
+    "shutdown_executor",
+    "write_annual_report",
+    "write_monthly_report",
+]
@@ -0,0 +1,175 @@
+"""Genera reportes PDF sin interfaz gráfica, para rangos de períodos y varias bases de datos.
+
+Ejemplo: `python -m finanzas_app.reports --mes 2024-01:2024-06 --anio 2019:2023 --config a.json`
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import multiprocessing
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..config import DBConfig
+from ..db.connection import DatabaseConnection
+from ..repositories import FinancialReportRepository
+from .datos import YearDataset, prefetch_year
+from .paginas import PageTask, annual_pages, monthly_pages
+from .pipeline import ReportTiming, build_pdf
+
+Month = Tuple[int, int]
+
+
+def _parse_month(value: str) -> Month:
+    try:
+        year, month = (int(part) for part in value.split("-", 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Mes inválido {value!r}; usa el formato AAAA-MM")
+    if not 1 <= month <= 12:
+        raise argparse.ArgumentTypeError(f"Mes fuera de rango: {value!r}")
+    return year, month
+
+
+def _month_range(value: str) -> List[Month]:
+    """`AAAA-MM` o `AAAA-MM:AAAA-MM` (ambos extremos incluidos)."""
+    start_text, _, end_text = value.partition(":")
+    start = _parse_month(start_text)
+    end = _parse_month(end_text) if end_text else start
+    if end < start:
+        raise argparse.ArgumentTypeError(f"Rango invertido: {value!r}")
+    months: List[Month] = []
+    year, month = start
+    while (year, month) <= end:
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def _year_range(value: str) -> List[int]:
+    """`AAAA` o `AAAA:AAAA` (ambos extremos incluidos)."""
+    start_text, _, end_text = value.partition(":")
+    try:
+        start = int(start_text)
+        end = int(end_text) if end_text else start
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Año inválido {value!r}; usa AAAA o AAAA:AAAA")
+    if end < start:
+        raise argparse.ArgumentTypeError(f"Rango invertido: {value!r}")
+    return list(range(start, end + 1))
+
+
+def _render(path: Path, dataset: YearDataset, month: Optional[int], renderers: ProcessPoolExecutor) -> ReportTiming:
+    start = time.perf_counter()
+    pages: List[PageTask] = monthly_pages(dataset.monthly(month)) if month else annual_pages(dataset.annual())
+    prepared = time.perf_counter()
+    count = build_pdf(path, pages, renderers)
+    return ReportTiming(str(path), count, prepared - start, time.perf_counter() - prepared)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mes", type=_month_range, action="append", default=[],
+                        help="Reportes mensuales AAAA-MM o AAAA-MM:AAAA-MM (se puede repetir).")
+    parser.add_argument("--anio", type=_year_range, action="append", default=[],
+                        help="Reportes anuales AAAA o AAAA:AAAA (se puede repetir).")
+    parser.add_argument("--config", type=Path, action="append", default=[],
+                        help="JSON de conexión (se puede repetir); por defecto usa el entorno.")
+    parser.add_argument("--salida", type=Path, default=Path("reportes"), help="Carpeta de destino.")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos para dibujar páginas.")
+    parser.add_argument("--hilos", type=int, default=4, help="Reportes ensamblados a la vez.")
+    args = parser.parse_args()
+    if not args.mes and not args.anio:
+        parser.error("indica al menos un --mes o un --anio")
+
+    # Reportes pedidos por año: None representa el reporte anual.
+    requested: Dict[int, Set[Optional[int]]] = defaultdict(set)
+    for months in args.mes:
+        for year, month in months:
+            requested[year].add(month)
+    for years in args.anio:
+        for year in years:
+            requested[year].add(None)
+
+    configs: List[DBConfig] = [DBConfig.from_json(path) for path in args.config] or [DBConfig.from_env()]
+    # (base, reporte, tiempos, error); un reporte que falla no detiene a los demás.
+    summary: List[Tuple[str, str, ReportTiming, str]] = []
+
+    # `spawn`: al crear los procesos ya corren los hilos de lectura y hay conexiones abiertas en el pool.
+    renderers = ProcessPoolExecutor(max_workers=args.procesos, mp_context=multiprocessing.get_context("spawn"))
+    with renderers, ThreadPoolExecutor(max_workers=args.hilos) as jobs:
+        pending: List[Tuple[str, str, Future]] = []
+        for config in configs:
+            repo = FinancialReportRepository(DatabaseConnection(config))
+            folder = args.salida / config.name
+            folder.mkdir(parents=True, exist_ok=True)
+            # Una sola lectura por año, compartida por sus reportes mensuales y el anual.
+            datasets = {year: jobs.submit(_timed_prefetch, repo, year) for year in requested}
+            for year, months in sorted(requested.items()):
+                try:
+                    dataset, seconds = datasets[year].result()
+                except Exception as exc:
+                    # Sin los datos del año no se puede generar ninguno de sus reportes.
+                    _record_failure(summary, config.name, f"datos {year}", exc)
+                    continue
+                summary.append((config.name, f"datos {year}", ReportTiming("", 0, seconds, 0.0), ""))
+                for month in sorted(months, key=lambda value: value or 0):
+                    if month is None:
+                        name, path = f"anual {year}", folder / f"reporte_anual_{year}.pdf"
+                    else:
+                        name, path = f"mensual {year}-{month:02d}", folder / f"reporte_mensual_{year}_{month}.pdf"
+                    pending.append((config.name, name, jobs.submit(_render, path, dataset, month, renderers)))
+
+        for database, name, future in pending:
+            try:
+                timing = future.result()
+            except Exception as exc:
+                _record_failure(summary, database, name, exc)
+                continue
+            summary.append((database, name, timing, ""))
+            print(f"{timing.path}: {timing.pages} páginas en {timing.total_seconds:.2f}s")
+
+    _write_summary(args.salida / "tiempos.csv", summary)
+    print(f"Resumen de tiempos en {args.salida / 'tiempos.csv'}")
+    failed = [name for _, name, _, error in summary if error]
+    if failed:
+        print(f"{len(failed)} fallidos: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _timed_prefetch(repo: FinancialReportRepository, year: int) -> Tuple[YearDataset, float]:
+    start = time.perf_counter()
+    dataset = prefetch_year(repo, year)
+    return dataset, time.perf_counter() - start
+
+
+def _record_failure(summary: List[Tuple[str, str, ReportTiming, str]], database: str, name: str, exc: Exception) -> None:
+    summary.append((database, name, ReportTiming("", 0, 0.0, 0.0), f"{type(exc).__name__}: {exc}"))
+    print(f"{database} {name}: falló ({type(exc).__name__}: {exc})", file=sys.stderr)
+
+
+def _write_summary(path: Path, summary: List[Tuple[str, str, ReportTiming, str]]) -> None:
+    """Una fila por lectura anual y por reporte: consulta/preparación, dibujo, total en segundos y error."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["base", "reporte", "archivo", "paginas", "consulta_s", "dibujo_s", "total_s", "error"])
+        for database, name, timing, error in summary:
+            writer.writerow([
+                database,
+                name,
+                timing.path,
+                timing.pages,
+                f"{timing.prefetch_seconds:.3f}",
+                f"{timing.render_seconds:.3f}",
+                f"{timing.total_seconds:.3f}",
+                error,
+            ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Datos de un reporte, consultados en un solo lote antes de dibujar las páginas."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple
+
+from ..async_repositories import AsyncFinancialReportRepository
+from ..db.periodos import mysql_dayofweek, mysql_week_mode1
+from ..repositories import FinancialReportRepository
+
+Rows = List[Dict[str, Any]]
+
+
+@dataclass
+class MonthlyReportData:
+    """Todo lo que necesita el PDF mensual; es serializable para enviarlo a otros procesos."""
+
+    year: int
+    month: int
+    total_expenses: float = 0.0
+    total_incomes: float = 0.0
+    expenses_by_category: Rows = field(default_factory=list)
+    incomes_by_category: Rows = field(default_factory=list)
+    budgets: Rows = field(default_factory=list)
+    daily_expenses: Rows = field(default_factory=list)
+    daily_incomes: Rows = field(default_factory=list)
+    weekly_heatmap: Rows = field(default_factory=list)
+
+    @property
+    def savings(self) -> float:
+        return self.total_incomes - self.total_expenses
+
+
+@dataclass
+class AnnualReportData:
+    """Todo lo que necesita el PDF anual."""
+
+    year: int
+    total_expenses: float = 0.0
+    total_incomes: float = 0.0
+    expenses_by_category: Rows = field(default_factory=list)
+    incomes_by_category: Rows = field(default_factory=list)
+    budgets: Rows = field(default_factory=list)
+    monthly_expense_totals: Rows = field(default_factory=list)
+    expenses_by_category_by_month: Rows = field(default_factory=list)
+    monthly_savings: Rows = field(default_factory=list)
+
+    @property
+    def savings(self) -> float:
+        return self.total_incomes - self.total_expenses
+
+
+def prefetch_monthly(repo: FinancialReportRepository, year: int, month: int) -> MonthlyReportData:
+    """Ejecuta en paralelo, cada una con su conexión, todas las consultas del reporte mensual."""
+    results = asyncio.run(AsyncFinancialReportRepository(repo=repo).gather_report(year, month))
+    return MonthlyReportData(year=year, month=month, **results)
+
+
+def prefetch_annual(repo: FinancialReportRepository, year: int) -> AnnualReportData:
+    """Ejecuta de una vez todas las consultas del reporte anual."""
+    return prefetch_year(repo, year).annual()
+
+
+@dataclass
+class YearDataset:
+    """Datos de un año completo leídos con tres consultas.
+
+    Todos los reportes mensuales y el anual de ese año se derivan de aquí en
+    memoria, con la misma forma y orden que las consultas individuales de
+    `FinancialReportRepository`, en lugar de repetir ~15 consultas por reporte.
+    """
+
+    year: int
+    category_totals: Rows = field(default_factory=list)
+    daily_totals: Rows = field(default_factory=list)
+    budgets: Rows = field(default_factory=list)
+
+    def monthly(self, month: int) -> MonthlyReportData:
+        rows = [row for row in self.category_totals if int(row["mes"]) == month]
+        days = [row for row in self.daily_totals if row["fecha"].month == month]
+        return MonthlyReportData(
+            year=self.year,
+            month=month,
+            total_expenses=_total(rows, "gasto"),
+            total_incomes=_total(rows, "ingreso"),
+            expenses_by_category=_by_category(rows, "gasto"),
+            incomes_by_category=_by_category(rows, "ingreso"),
+            budgets=[
+                {"categoria_id": row["categoria_id"], "nombre": row["nombre"], "monto": row["monto"]}
+                for row in self.budgets
+                if int(row["mes"]) == month
+            ],
+            daily_expenses=_daily(days, "gasto"),
+            daily_incomes=_daily(days, "ingreso"),
+            weekly_heatmap=_heatmap(days),
+        )
+
+    def annual(self) -> AnnualReportData:
+        rows = self.category_totals
+        expenses_by_month: Dict[int, Any] = defaultdict(int)
+        savings_by_month: Dict[int, Any] = defaultdict(int)
+        for row in rows:
+            month, total = int(row["mes"]), row["total"] or 0
+            if row["tipo"] == "gasto":
+                expenses_by_month[month] += total
+                savings_by_month[month] -= total
+            else:
+                savings_by_month[month] += total
+        return AnnualReportData(
+            year=self.year,
+            total_expenses=_total(rows, "gasto"),
+            total_incomes=_total(rows, "ingreso"),
+            expenses_by_category=_by_category(rows, "gasto"),
+            incomes_by_category=_by_category(rows, "ingreso", with_id=True),
+            budgets=list(self.budgets),
+            monthly_expense_totals=[
+                {"mes": month, "total": total} for month, total in sorted(expenses_by_month.items())
+            ],
+            expenses_by_category_by_month=[
+                {"mes": month, **row}
+                for month in sorted(expenses_by_month)
+                for row in _by_category([r for r in rows if int(r["mes"]) == month], "gasto")
+            ],
+            monthly_savings=[
+                {"periodo": f"{self.year:04d}-{month:02d}", "ahorro": ahorro}
+                for month, ahorro in sorted(savings_by_month.items())
+            ],
+        )
+
+
+def prefetch_year(repo: FinancialReportRepository, year: int) -> YearDataset:
+    """Consulta una sola vez (y en paralelo) los datos compartidos por todos los reportes del año."""
+    results = asyncio.run(AsyncFinancialReportRepository(repo=repo).gather_calls({
+        "category_totals": lambda: repo.category_totals_by_month(year),
+        "daily_totals": lambda: repo.daily_totals_for_year(year),
+        "budgets": lambda: repo.get_budget_by_category(year),
+    }))
+    return YearDataset(year=year, **results)
+
+
+def _sum(values: Iterable[Any]) -> Any:
+    total: Any = 0
+    for value in values:
+        total += value or 0
+    return total
+
+
+def _total(rows: Rows, tipo: str) -> float:
+    return float(_sum(row["total"] for row in rows if row["tipo"] == tipo))
+
+
+def _by_category(rows: Rows, tipo: str, with_id: bool = False) -> Rows:
+    """Agrupa por categoría ordenando por total descendente, como `expenses_by_category`.
+
+    Con `with_id` las filas llevan además `categoria_id` y `nombre`, como `incomes_by_category`.
+    """
+    totals: Dict[Tuple[Any, str], Any] = defaultdict(int)
+    for row in rows:
+        if row["tipo"] == tipo:
+            totals[(row["categoria_id"], row["categoria"])] += row["total"] or 0
+    ordered = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    if with_id:
+        return [
+            {"categoria_id": key[0], "nombre": key[1], "categoria": key[1], "total": total}
+            for key, total in ordered
+        ]
+    return [{"categoria": key[1], "total": total} for key, total in ordered]
+
+
+def _daily(days: Rows, tipo: str) -> Rows:
+    return [{"fecha": row["fecha"], "total": row["total"]} for row in days if row["tipo"] == tipo]
+
+
+def _heatmap(days: Rows) -> Rows:
+    cells: Dict[Tuple[int, int], Any] = defaultdict(int)
+    for row in days:
+        if row["tipo"] == "gasto":
+            cells[(mysql_week_mode1(row["fecha"]), mysql_dayofweek(row["fecha"]))] += row["total"] or 0
+    return [
+        {"semana": semana, "dia_semana": dia, "total": total}
+        for (semana, dia), total in sorted(cells.items())
+    ]
@@ -0,0 +1,243 @@
+"""Páginas de los reportes PDF construidas a partir de datos ya consultados.
+
+Cada página es una tarea `(función, argumentos)` de nivel de módulo para que
+pueda ejecutarse en otro proceso y devolver la figura serializada.
+"""
+
+from __future__ import annotations
+
+from calendar import month_name
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+from matplotlib.figure import Figure
+
+from ..logic.graficos import (
+    annual_cumulative_savings_from_rows,
+    annual_expense_boxplot_from_rows,
+    annual_expense_by_category_stacked_from_rows,
+    annual_expense_line_from_rows,
+    monthly_daily_expense_line_from_rows,
+    monthly_expense_heatmap_from_rows,
+    monthly_income_vs_expense_stacked_from_rows,
+    monthly_spending_bar_from_rows,
+    monthly_spending_pie_from_rows,
+)
+from .datos import AnnualReportData, MonthlyReportData
+
+PageTask = Tuple[Callable[..., Figure], Tuple[Any, ...]]
+
+
+def format_money(value: float | None) -> str:
+    if value is None:
+        return "Sin datos"
+    return f"${value:,.2f}"
+
+
+def today_str() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M")
+
+
+def render_page(task: PageTask) -> Figure:
+    """Punto de entrada de los procesos de trabajo: dibuja una página."""
+    function, args = task
+    return function(*args)
+
+
+def summary_with_table_figure(
+    title: str,
+    summary_lines: List[str],
+    table_title: str,
+    headers: List[str],
+    rows: List[Tuple[str, ...]],
+    max_rows: int = 18,
+) -> Figure:
+
+    fig = Figure(figsize=(8.5, 11))
+    fig.subplots_adjust(left=0.08, right=0.92, top=0.92, bottom=0.08)
+
+    fig.suptitle(title, fontsize=16, fontweight="bold", y=0.97)
+
+    grid = fig.add_gridspec(2, 1, height_ratios=(0.35, 1), hspace=0.25)
+
+    # ----- Resumen -----
+    summary_ax = fig.add_subplot(grid[0])
+    summary_ax.axis("off")
+
+    y = 0.9
+    for line in summary_lines:
+        summary_ax.text(0, y, f"• {line}", ha="left", fontsize=10)
+        y -= 0.18
+
+    # ----- Tabla -----
+    table_ax = fig.add_subplot(grid[1])
+    table_ax.axis("off")
+    table_ax.set_title(table_title, pad=10, fontsize=12)
+
+    display_rows = rows[:max_rows]
+    if not display_rows:
+        table_ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
+        return fig
+
+    table = table_ax.table(
+        cellText=display_rows,
+        colLabels=headers,
+        colLoc="center",
+        cellLoc="center",
+        loc="center",
+    )
+
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+    table.scale(1, 1.25)
+
+    if len(rows) > max_rows:
+        table_ax.text(0.5, -0.05, f"... y {len(rows) - max_rows} registros más",
+                      ha="center", fontsize=8)
+
+    return fig
+
+
+def table_figure(title: str, headers: List[str], rows: List[Tuple[str, ...]], max_rows: int = 24) -> Figure:
+    fig = Figure(figsize=(8.5, 11))
+    fig.subplots_adjust(left=0.08, right=0.92, top=0.9, bottom=0.08)
+
+    ax = fig.subplots()
+    ax.axis("off")
+    ax.set_title(title, pad=10, fontsize=12)
+
+    display_rows = rows[:max_rows]
+    if not display_rows:
+        ax.text(0.5, 0.5, "Sin datos", ha="center", va="center", fontsize=11, color="#666")
+        return fig
+
+    table = ax.table(
+        cellText=display_rows,
+        colLabels=headers,
+        colLoc="center",
+        cellLoc="center",
+        loc="center",
+    )
+
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+    table.scale(1, 1.35)
+
+    if len(rows) > max_rows:
+        ax.text(0.5, 0.03, f"... y {len(rows) - max_rows} registros más",
+                ha="center", fontsize=8)
+
+    return fig
+
+
+def table_rows_from_dicts(
+    rows: List[Dict[str, Any]],
+    key_fields: Tuple[str, ...],
+    formatters: Tuple[Callable[[float | None], str], ...],
+) -> List[Tuple[str, ...]]:
+    result: List[Tuple[str, ...]] = []
+    for row in rows:
+        values: List[str] = []
+        for key in key_fields:
+            values.append(str(row.get(key) or "-"))
+        for formatter in formatters:
+            total_value = row.get("total") if "total" in row else row.get("monto")
+            values.append(formatter(total_value))
+        result.append(tuple(values))
+    return result
+
+
+def format_budget_row(row: Dict[str, Any]) -> Tuple[str, str, str]:
+    mes = row.get("mes")
+    mes_label = month_name[int(mes)] if mes else "-"
+    categoria = row.get("nombre") or "-"
+    monto = format_money(row.get("monto"))
+    return (mes_label, categoria, monto)
+
+
+def monthly_pages(data: MonthlyReportData) -> List[PageTask]:
+    """Páginas del reporte mensual en el orden en que se escriben en el PDF."""
+    year, month = data.year, data.month
+    return [
+        # Portada combinada
+        (
+            summary_with_table_figure,
+            (
+                f"Reporte mensual {month_name[month]} {year}",
+                [
+                    f"Generado: {today_str()}",
+                    f"Gastos del mes: {format_money(data.total_expenses)}",
+                    f"Ingresos del mes: {format_money(data.total_incomes)}",
+                    f"Ahorro mensual: {format_money(data.savings)}",
+                ],
+                "Gastos por categoría",
+                ["Categoría", "Total"],
+                table_rows_from_dicts(data.expenses_by_category, ("categoria",), (format_money,)),
+            ),
+        ),
+        # Tablas adicionales
+        (
+            table_figure,
+            (
+                "Ingresos por categoría",
+                ["Categoría", "Total"],
+                table_rows_from_dicts(data.incomes_by_category, ("categoria",), (format_money,)),
+            ),
+        ),
+        (
+            table_figure,
+            (
+                "Presupuestos específicos",
+                ["Categoría", "Monto"],
+                table_rows_from_dicts(data.budgets, ("nombre",), (format_money,)),
+            ),
+        ),
+        # Gráficos
+        (monthly_spending_bar_from_rows, (data.expenses_by_category, year, month)),
+        (monthly_spending_pie_from_rows, (data.expenses_by_category, year, month)),
+        (monthly_daily_expense_line_from_rows, (data.daily_expenses, year, month)),
+        (monthly_income_vs_expense_stacked_from_rows, (data.daily_expenses, data.daily_incomes, year, month)),
+        (monthly_expense_heatmap_from_rows, (data.weekly_heatmap, year, month)),
+    ]
+
+
+def annual_pages(data: AnnualReportData) -> List[PageTask]:
+    """Páginas del reporte anual en el orden en que se escriben en el PDF."""
+    year = data.year
+    return [
+        (
+            summary_with_table_figure,
+            (
+                f"Reporte anual {year}",
+                [
+                    f"Generado: {today_str()}",
+                    f"Gasto total anual: {format_money(data.total_expenses)}",
+                    f"Ingreso total anual: {format_money(data.total_incomes)}",
+                    f"Ahorro anual: {format_money(data.savings)}",
+                ],
+                "Gastos por categoría",
+                ["Categoría", "Total"],
+                table_rows_from_dicts(data.expenses_by_category, ("categoria",), (format_money,)),
+            ),
+        ),
+        (
+            table_figure,
+            (
+                "Ingresos por categoría",
+                ["Categoría", "Total"],
+                table_rows_from_dicts(data.incomes_by_category, ("categoria",), (format_money,)),
+            ),
+        ),
+        (
+            table_figure,
+            (
+                "Presupuestos anuales",
+                ["Mes", "Categoría", "Monto"],
+                [format_budget_row(row) for row in data.budgets],
+            ),
+        ),
+        (annual_expense_line_from_rows, (data.monthly_expense_totals, year)),
+        (annual_expense_by_category_stacked_from_rows, (data.expenses_by_category_by_month, year)),
+        (annual_expense_boxplot_from_rows, (data.monthly_expense_totals, year)),
+        (annual_cumulative_savings_from_rows, (data.monthly_savings, year)),
+    ]
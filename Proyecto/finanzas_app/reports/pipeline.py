@@ -0,0 +1,167 @@
+"""Generación de reportes PDF en tres etapas: consulta, dibujo en paralelo y ensamblado.
+
+1. Todas las consultas del reporte se ejecutan de una vez (`prefetch_*`).
+2. Cada página se dibuja en un proceso del pool con el backend Agg; la figura
+   vuelve serializada al proceso principal.
+3. El proceso principal escribe las páginas en orden en `PdfPages`, informando
+   el progreso y atendiendo la cancelación entre página y página.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+from matplotlib import pyplot as plt
+
+from ..db.connection import DatabaseConnection
+from ..repositories import FinancialReportRepository
+from .datos import prefetch_annual, prefetch_monthly
+from .paginas import PageTask, annual_pages, monthly_pages, render_page
+
+# progress(páginas_listas, total_páginas, mensaje)
+ProgressCallback = Callable[[int, int, str], None]
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+class ReportCancelled(Exception):
+    """Se canceló la generación; el archivo parcial ya fue eliminado."""
+
+
+@dataclass
+class ReportTiming:
+    path: str
+    pages: int
+    prefetch_seconds: float
+    render_seconds: float
+
+    @property
+    def total_seconds(self) -> float:
+        return self.prefetch_seconds + self.render_seconds
+
+
+def default_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Pool de procesos compartido, creado la primera vez que se genera un reporte.
+
+    Los procesos se lanzan con `spawn` y no con `fork`: la GUI ya tiene hilos (gráficos,
+    consultas) y un hijo bifurcado podría heredar candados tomados por ellos y bloquearse.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=max_workers or min(4, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(cancel_futures=True)
+            _executor = None
+
+
+def build_pdf(
+    path: str | Path,
+    pages: List[PageTask],
+    executor: Optional[Executor] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> int:
+    """Dibuja `pages` en `executor` y las escribe en orden en `path`.
+
+    Si el pool se rompe (un proceso murió), la página se registra en el log y se
+    vuelve a dibujar en el proceso actual; cualquier otro error de una página se
+    propaga. Retorna el número de páginas.
+    """
+    executor = executor or default_executor()
+    total = len(pages)
+    futures: List[Future] = [executor.submit(render_page, task) for task in pages]
+    try:
+        with PdfPages(path) as pdf:
+            for index, (task, future) in enumerate(zip(pages, futures), start=1):
+                figure = _wait_for_page(task, future, executor, cancel)
+                pdf.savefig(figure)
+                plt.close(figure)
+                if progress is not None:
+                    progress(index, total, f"Página {index} de {total}")
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        Path(path).unlink(missing_ok=True)
+        raise
+    return total
+
+
+def _wait_for_page(
+    task: PageTask,
+    future: Future,
+    executor: Executor,
+    cancel: Optional[threading.Event],
+) -> Figure:
+    while True:
+        if cancel is not None and cancel.is_set():
+            raise ReportCancelled("Generación de reporte cancelada")
+        try:
+            return future.result(timeout=0.1)
+        except FutureTimeout:
+            continue
+        except BrokenExecutor:
+            logger.exception("El pool de dibujo se rompió; la página %s se dibuja en este proceso", task[0].__name__)
+            if executor is _executor:
+                # El próximo reporte crea un pool nuevo en lugar de reutilizar el roto.
+                shutdown_executor()
+            return render_page(task)
+
+
+def write_monthly_report(
+    path: str | Path,
+    year: int,
+    month: int,
+    repo: Optional[FinancialReportRepository] = None,
+    executor: Optional[Executor] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> ReportTiming:
+    repo = repo or FinancialReportRepository(DatabaseConnection())
+    start = time.perf_counter()
+    if progress is not None:
+        progress(0, 0, "Consultando datos…")
+    data = prefetch_monthly(repo, year, month)
+    prefetched = time.perf_counter()
+    pages = build_pdf(path, monthly_pages(data), executor, progress, cancel)
+    return ReportTiming(str(path), pages, prefetched - start, time.perf_counter() - prefetched)
+
+
+def write_annual_report(
+    path: str | Path,
+    year: int,
+    repo: Optional[FinancialReportRepository] = None,
+    executor: Optional[Executor] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> ReportTiming:
+    repo = repo or FinancialReportRepository(DatabaseConnection())
+    start = time.perf_counter()
+    if progress is not None:
+        progress(0, 0, "Consultando datos…")
+    data = prefetch_annual(repo, year)
+    prefetched = time.perf_counter()
+    pages = build_pdf(path, annual_pages(data), executor, progress, cancel)
+    return ReportTiming(str(path), pages, prefetched - start, time.perf_counter() - prefetched)
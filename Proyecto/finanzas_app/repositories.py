@@ -1,8 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence
+import os
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from .cache import cached_report
 from .db.connection import DatabaseConnection
+from .db.periodos import period_filter, rollup_period_filter
+from .db.profiler import query_profiler
+from .events import ALL_PERIODS, DataChanged, Period, data_events
 from .models import (
     Categoria,
     ImpuestoAnual,
@@ -10,30 +19,205 @@ from .models import (
     Transaccion,
 )
 
+if TYPE_CHECKING:
+    from .db.snapshot import SnapshotReports
+
+
+class _ProfiledCursor:
+    """Cursor de `_transaction` que registra cada `execute`/`executemany` en `query_profiler`."""
+
+    def __init__(self, connection: DatabaseConnection, cursor: Any) -> None:
+        self._connection = connection
+        self._cursor = cursor
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def execute(self, query: str, params: Sequence[Any] = ()) -> None:
+        with query_profiler.measure(self._connection, query, params) as measure:
+            self._cursor.execute(query, params)
+            measure.rows = max(self._cursor.rowcount, 0)
+
+    def executemany(self, query: str, seq_params: Sequence[Sequence[Any]]) -> None:
+        with query_profiler.measure(self._connection, query, seq_params) as measure:
+            self._cursor.executemany(query, seq_params)
+            measure.rows = max(self._cursor.rowcount, 0)
+
 
 class BaseRepository:
     """Helper base para ejecutar queries con conexiones del pool."""
 
+    # Tabla que modifican las escrituras del repositorio, tal como llega en `DataChanged.entity`.
+    ENTITY = ""
+
     def __init__(self, connection: DatabaseConnection):
         self._connection = connection
 
+    @property
+    def connection(self) -> DatabaseConnection:
+        return self._connection
+
     def _execute_write(self, query: str, params: Sequence[Any]) -> int:
         with self._connection.get_connection() as conn:
-            with conn.cursor() as cursor:
+            with conn.cursor() as cursor, query_profiler.measure(self._connection, query, params) as measure:
                 cursor.execute(query, params)
                 conn.commit()
+                measure.rows = cursor.rowcount
                 return cursor.lastrowid
 
     def _execute_read(self, query: str, params: Sequence[Any] | None = None) -> List[dict]:
         with self._connection.get_connection() as conn:
-            with conn.cursor(dictionary=True) as cursor:
+            with conn.cursor(dictionary=True) as cursor, query_profiler.measure(self._connection, query, params) as measure:
                 cursor.execute(query, params or ())
-                return cursor.fetchall()
+                rows = cursor.fetchall()
+                measure.rows = len(rows)
+                return rows
+
+    def _execute_stream(
+        self,
+        query: str,
+        params: Sequence[Any] | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[dict]:
+        """Recorre el resultado por lotes de `fetchmany` con un cursor sin búfer.
+
+        El servidor envía las filas a medida que se consumen, así que la memoria
+        queda acotada por `batch_size`. La conexión permanece tomada del pool hasta
+        que el generador se agota o se cierra.
+        """
+        with self._connection.get_connection() as conn:
+            with conn.cursor(dictionary=True, buffered=False) as cursor, query_profiler.measure(
+                self._connection, query, params
+            ) as measure:
+                # El tiempo medido incluye el consumo del generador, que marca el ritmo de lectura.
+                cursor.execute(query, params or ())
+                exhausted = False
+                try:
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            exhausted = True
+                            return
+                        measure.rows += len(rows)
+                        yield from rows
+                finally:
+                    if not exhausted:
+                        # Un cursor sin búfer debe leer todo antes de cerrarse o devolver la conexión.
+                        while cursor.fetchmany(batch_size):
+                            pass
+
+    @contextmanager
+    def _transaction(self) -> Iterator[Any]:
+        """Ejecuta varias sentencias con un mismo cursor y las confirma juntas.
+
+        Cada sentencia del cursor se mide con `query_profiler`, igual que las de `_execute_*`.
+        """
+        with self._connection.get_connection() as conn:
+            with conn.cursor(dictionary=True) as cursor:
+                try:
+                    yield _ProfiledCursor(self._connection, cursor)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+
+    def _publish(self, action: str, ids: Iterable[Optional[int]], periods: Iterable[Period]) -> None:
+        """Publica una escritura confirmada en `data_events`.
+
+        La caché de reportes y las vistas se suscriben ahí y descartan sólo los periodos tocados.
+        """
+        data_events.publish(
+            DataChanged(self.ENTITY, action, tuple(i for i in ids if i is not None), frozenset(periods))
+        )
+
+
+def _period_of(fecha: Optional[date]) -> Tuple[Optional[int], Optional[int]]:
+    """Periodo (año, mes) de una fecha; sin fecha se invalida todo el caché."""
+    if fecha is None:
+        return None, None
+    return fecha.year, fecha.month
+
+
+RollupDelta = Tuple[int, int, int, Decimal, int]
+
+
+def _rollup_delta(fecha: Optional[date], categoria_id: Optional[int], monto: Any, sign: int) -> List[RollupDelta]:
+    """Variación de `resumen_mensual` que produce una transacción (sign=+1 alta, -1 baja)."""
+    if fecha is None or categoria_id is None:
+        # Las transacciones sin fecha no pertenecen a ningún mes del resumen.
+        return []
+    # Como Decimal, igual que `resumen_mensual.total`: un float arrastraría error de redondeo.
+    return [(fecha.year, fecha.month, categoria_id, sign * Decimal(str(monto or 0)), sign)]
+
+
+def _apply_rollup_deltas(cursor: Any, deltas: Sequence[RollupDelta]) -> None:
+    """Suma las variaciones al resumen mensual dentro de la transacción del cursor."""
+    if not deltas:
+        return
+    cursor.executemany(
+        """
+        INSERT INTO resumen_mensual (anio, mes, Categoria_Id_Categoria, total, conteo)
+        VALUES (%s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            total = total + VALUES(total),
+            conteo = conteo + VALUES(conteo)
+        """,
+        list(deltas),
+    )
+    # Las celdas que quedan sin transacciones se eliminan para no listar categorías vacías.
+    emptied = [(anio, mes, categoria_id) for anio, mes, categoria_id, _, conteo in deltas if conteo < 0]
+    if emptied:
+        cursor.executemany(
+            """
+            DELETE FROM resumen_mensual
+            WHERE anio = %s AND mes = %s AND Categoria_Id_Categoria = %s AND conteo <= 0
+            """,
+            emptied,
+        )
+
+
+def _bump_data_version(cursor: Any, table: str) -> None:
+    """Incrementa el contador de escrituras de `table` dentro de la transacción del cursor."""
+    cursor.execute("UPDATE version_datos SET version = version + 1 WHERE tabla = %s", (table,))
+
+
+def _encode_page_token(fecha: Optional[date], transaccion_id: int) -> str:
+    """Token opaco 'fecha:id' con la última fila de una página (fecha vacía si es nula)."""
+    return f"{fecha.isoformat() if fecha else ''}:{transaccion_id}"
+
+
+def _decode_page_token(token: Optional[str]) -> Tuple[Optional[date], Optional[int]]:
+    if not token:
+        return None, None
+    fecha_text, _, id_text = token.partition(":")
+    try:
+        # `fecha` puede llegar como DATE o DATETIME; se conserva la hora para no saltar filas.
+        if not fecha_text:
+            fecha = None
+        elif len(fecha_text) > 10:
+            fecha = datetime.fromisoformat(fecha_text)
+        else:
+            fecha = date.fromisoformat(fecha_text)
+        return fecha, int(id_text)
+    except ValueError as exc:
+        raise ValueError(f"Token de página inválido: {token!r}") from exc
+
+
+def _with_periodo(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reemplaza las columnas (anio, mes) del resumen por la etiqueta 'YYYY-MM'."""
+    result = []
+    for row in rows:
+        anio = row.pop("anio")
+        mes = row.pop("mes")
+        result.append({"periodo": f"{int(anio):04d}-{int(mes):02d}", **row})
+    return result
 
 
 class CategoriaRepository(BaseRepository):
     """Operaciones CRUD sobre la tabla `categoria`."""
 
+    ENTITY = "categoria"
+
     def create(self, categoria: Categoria) -> int:
         """Inserta una nueva categoría."""
         query = """
@@ -47,6 +231,7 @@ class CategoriaRepository(BaseRepository):
             categoria.descripcion,
         )
         categoria.id_categoria = self._execute_write(query, params)
+        self._publish("create", [categoria.id_categoria], ALL_PERIODS)
         return categoria.id_categoria or 0
 
     def list_all(self) -> List[Categoria]:
@@ -83,6 +268,33 @@ class CategoriaRepository(BaseRepository):
 class TransaccionRepository(BaseRepository):
     """Inserciones y consultas sobre la tabla `transaccion`."""
 
+    ENTITY = "transaccion"
+
+    _WITH_CATEGORY_COLUMNS = """
+        SELECT
+            t.Id_Transaccion AS id_transaccion,
+            t.monto,
+            t.cantidad,
+            t.fecha,
+            t.description,
+            c.Id_Categoria AS categoria_id,
+            c.nombre AS categoria,
+            c.tipo AS tipo,
+            c.periodicidad AS periodicidad
+        FROM transaccion t
+        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+        """
+    _WITH_CATEGORY_QUERY = _WITH_CATEGORY_COLUMNS + "ORDER BY t.fecha DESC"
+
+    def _publish(self, action: str, ids: Iterable[Optional[int]], periods: Iterable[Period]) -> None:
+        periods = set(periods)
+        if os.getenv("FINANZAS_SNAPSHOT_DIR"):
+            # Un año cerrado que se modifica deja de servirse desde su instantánea.
+            from .db.snapshot import discard_years
+
+            discard_years(self._connection, (year for year, _ in periods))
+        super()._publish(action, ids, periods)
+
     def create(self, transaccion: Transaccion) -> int:
         """Registra una transacción asociada a una categoría."""
         query = """
@@ -96,9 +308,87 @@ class TransaccionRepository(BaseRepository):
             transaccion.categoria_id,
             transaccion.description,
         )
-        transaccion.id_transaccion = self._execute_write(query, params)
+        # La fila y su aporte a `resumen_mensual` se confirman en la misma transacción.
+        with self._transaction() as cursor:
+            cursor.execute(query, params)
+            transaccion.id_transaccion = cursor.lastrowid
+            _apply_rollup_deltas(
+                cursor, _rollup_delta(transaccion.fecha, transaccion.categoria_id, transaccion.monto, +1)
+            )
+            _bump_data_version(cursor, self.ENTITY)
+        self._publish("create", [transaccion.id_transaccion], [_period_of(transaccion.fecha)])
         return transaccion.id_transaccion or 0
 
+    def create_many(self, transacciones: Iterable[Transaccion], chunk_size: int = 500) -> int:
+        """Inserta transacciones en bloques y retorna cuántas filas se guardaron.
+
+        Cada bloque es un único `INSERT` de varias filas que se confirma junto con su
+        aporte a `resumen_mensual`; si un bloque falla, los anteriores ya quedan guardados.
+        Acepta cualquier iterable, por lo que un generador no se carga completo en memoria.
+        No se informan ids: con `innodb_autoinc_lock_mode=2` (el valor por defecto de
+        MySQL 8) los de un INSERT de varias filas no son necesariamente consecutivos.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size debe ser mayor que cero")
+        inserted = 0
+        iterator = iter(transacciones)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            inserted += self._insert_chunk(chunk)
+        return inserted
+
+    def _insert_chunk(self, chunk: List[Transaccion]) -> int:
+        placeholders = ", ".join(["(%s, %s, %s, %s, %s)"] * len(chunk))
+        query = f"""
+        INSERT INTO transaccion (monto, cantidad, fecha, Categoria_Id_Categoria, description)
+        VALUES {placeholders}
+        """
+        params: List[Any] = []
+        totals: Dict[Tuple[int, int, int], List[Any]] = {}
+        for transaccion in chunk:
+            params.extend(
+                (
+                    transaccion.monto,
+                    transaccion.cantidad,
+                    transaccion.fecha,
+                    transaccion.categoria_id,
+                    transaccion.description,
+                )
+            )
+            # Se agrupan las variaciones del bloque para tocar cada celda del resumen una sola vez.
+            for anio, mes, categoria_id, monto, conteo in _rollup_delta(
+                transaccion.fecha, transaccion.categoria_id, transaccion.monto, +1
+            ):
+                acumulado = totals.setdefault((anio, mes, categoria_id), [Decimal(0), 0])
+                acumulado[0] += monto
+                acumulado[1] += conteo
+        with self._transaction() as cursor:
+            cursor.execute(query, tuple(params))
+            _apply_rollup_deltas(
+                cursor,
+                [(anio, mes, categoria_id, total, conteo) for (anio, mes, categoria_id), (total, conteo) in totals.items()],
+            )
+            _bump_data_version(cursor, self.ENTITY)
+        # El evento lleva sólo los periodos: los suscriptores recargan esos meses completos.
+        self._publish("create", [], (_period_of(transaccion.fecha) for transaccion in chunk))
+        return len(chunk)
+
+    @staticmethod
+    def _lock_current(cursor: Any, transaccion_id: int) -> Optional[Dict[str, Any]]:
+        """Lee (y bloquea) el estado previo de una transacción para descontarlo del resumen."""
+        cursor.execute(
+            """
+            SELECT fecha, monto, Categoria_Id_Categoria AS categoria_id
+            FROM transaccion
+            WHERE Id_Transaccion = %s
+            FOR UPDATE
+            """,
+            (transaccion_id,),
+        )
+        return cursor.fetchone()
+
     def list_by_categoria(self, categoria_id: int, year: Optional[int] = None) -> List[Transaccion]:
         """Lista las transacciones relacionadas con una categoría, opcionalmente filtradas por año."""
         params: list[Any] = [categoria_id]
@@ -117,36 +407,97 @@ class TransaccionRepository(BaseRepository):
         JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
         WHERE t.Categoria_Id_Categoria = %s
         """
-        if year is not None:
-            query += " AND YEAR(t.fecha) = %s"
-            params.append(year)
+        period_clauses, period_params = period_filter(year)
+        for clause in period_clauses:
+            query += f" AND {clause}"
+        params.extend(period_params)
         query += " ORDER BY t.fecha DESC"
         rows = self._execute_read(query, tuple(params))
         return [Transaccion(**row) for row in rows]
 
     def list_all_with_category(self) -> List[Dict[str, Any]]:
         """Lista todas las transacciones con el nombre de categoría asociado."""
-        query = """
-        SELECT
-            t.Id_Transaccion AS id_transaccion,
-            t.monto,
-            t.cantidad,
-            t.fecha,
-            t.description,
-            c.Id_Categoria AS categoria_id,
-            c.nombre AS categoria,
-            c.tipo AS tipo,
-            c.periodicidad AS periodicidad
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
-        ORDER BY t.fecha DESC
+        return self._execute_read(self._WITH_CATEGORY_QUERY)
+
+    def iter_all_with_category(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Versión en streaming de `list_all_with_category` para recorrer tablas grandes."""
+        return self._execute_stream(self._WITH_CATEGORY_QUERY, batch_size=batch_size)
+
+    def get_with_category(self, transaccion_id: int) -> Optional[Dict[str, Any]]:
+        """Una transacción con los datos de su categoría, o None si ya no existe."""
+        rows = self._execute_read(
+            self._WITH_CATEGORY_COLUMNS + "WHERE t.Id_Transaccion = %s",
+            (transaccion_id,),
+        )
+        return rows[0] if rows else None
+
+    def data_fingerprint(self) -> Dict[str, Any]:
+        """Resumen barato de la tabla para detectar altas, ediciones y bajas.
+
+        `version` es el contador de `version_datos`, que cada escritura del repositorio
+        incrementa en su misma transacción: cambia también con ediciones que no mueven
+        los agregados (sólo `cantidad`, `fecha` o `categoria`). El mayor id, el número
+        de filas, la suma de montos y la fecha más reciente cubren las cargas que no
+        pasan por el repositorio (`LOAD DATA`, SQL directo).
         """
-        return self._execute_read(query)
+        rows = self._execute_read(
+            """
+            SELECT
+                (SELECT version FROM version_datos WHERE tabla = 'transaccion') AS version,
+                MAX(Id_Transaccion) AS max_id,
+                COUNT(*) AS filas,
+                SUM(monto) AS suma_monto,
+                MAX(fecha) AS ultima_fecha
+            FROM transaccion
+            """
+        )
+        return rows[0] if rows else {}
+
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 200
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Página de transacciones ordenadas por (fecha, Id_Transaccion) descendente.
+
+        `after` es el token devuelto por la página anterior (None para la primera);
+        el segundo valor retornado es el token de la siguiente página o None al final.
+        La consulta continúa desde la última fila vista en lugar de usar OFFSET, por
+        lo que cada página cuesta lo mismo sin importar cuán profunda sea. Las
+        transacciones sin fecha se listan al final, igual que en `ORDER BY fecha DESC`.
+        """
+        last_fecha, last_id = _decode_page_token(after)
+        rows: List[Dict[str, Any]] = []
+        if last_id is None or last_fecha is not None:
+            filters = ["t.fecha IS NOT NULL"]
+            params: List[Any] = []
+            if last_fecha is not None:
+                filters.append("(t.fecha < %s OR (t.fecha = %s AND t.Id_Transaccion < %s))")
+                params.extend([last_fecha, last_fecha, last_id])
+            rows = self._execute_read(
+                self._WITH_CATEGORY_COLUMNS
+                + f"WHERE {' AND '.join(filters)} ORDER BY t.fecha DESC, t.Id_Transaccion DESC LIMIT %s",
+                (*params, limit + 1),
+            )
+        if len(rows) <= limit:
+            # Se completa la página con la cola de transacciones sin fecha.
+            undated_filters = ["t.fecha IS NULL"]
+            undated_params: List[Any] = []
+            if last_fecha is None and last_id is not None:
+                undated_filters.append("t.Id_Transaccion < %s")
+                undated_params.append(last_id)
+            rows += self._execute_read(
+                self._WITH_CATEGORY_COLUMNS
+                + f"WHERE {' AND '.join(undated_filters)} ORDER BY t.Id_Transaccion DESC LIMIT %s",
+                (*undated_params, limit + 1 - len(rows)),
+            )
+        if len(rows) <= limit:
+            return rows, None
+        page = rows[:limit]
+        return page, _encode_page_token(page[-1]["fecha"], page[-1]["id_transaccion"])
 
     def list_variable_transactions(self, year: int) -> List[Transaccion]:
         """Transacciones variables realizadas durante el año requerido."""
-        params: list[Any] = [year]
-        query = """
+        period_clauses, params = period_filter(year)
+        query = f"""
         SELECT
             Id_Transaccion AS id_transaccion,
             monto,
@@ -158,7 +509,7 @@ class TransaccionRepository(BaseRepository):
         JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
         WHERE c.tipo = 'gasto'
           AND c.periodicidad = 'variable'
-          AND YEAR(t.fecha) = %s
+          AND {' AND '.join(period_clauses)}
         ORDER BY fecha DESC
         """
         rows = self._execute_read(query, tuple(params))
@@ -181,7 +532,24 @@ class TransaccionRepository(BaseRepository):
             transaccion.description,
             transaccion.id_transaccion,
         )
-        return self._execute_write(query, params)
+        with self._transaction() as cursor:
+            previous = self._lock_current(cursor, transaccion.id_transaccion)
+            cursor.execute(query, params)
+            result = cursor.lastrowid
+            if previous is None:
+                return result
+            # La categoría no es editable: se descuenta el valor anterior y se suma el nuevo.
+            _apply_rollup_deltas(
+                cursor,
+                _rollup_delta(previous["fecha"], previous["categoria_id"], previous["monto"], -1)
+                + _rollup_delta(transaccion.fecha, previous["categoria_id"], transaccion.monto, +1),
+            )
+            _bump_data_version(cursor, self.ENTITY)
+        # La fecha anterior también se invalida por si la edición movió la transacción de mes.
+        self._publish(
+            "update", [transaccion.id_transaccion], [_period_of(previous["fecha"]), _period_of(transaccion.fecha)]
+        )
+        return result
 
     def delete(self, transaccion_id: int) -> int:
         """Elimina una transacción por su identificador."""
@@ -189,12 +557,25 @@ class TransaccionRepository(BaseRepository):
         DELETE FROM transaccion
         WHERE Id_Transaccion = %s
         """
-        return self._execute_write(query, (transaccion_id,))
+        with self._transaction() as cursor:
+            previous = self._lock_current(cursor, transaccion_id)
+            cursor.execute(query, (transaccion_id,))
+            result = cursor.lastrowid
+            if previous is None:
+                return result
+            _apply_rollup_deltas(
+                cursor, _rollup_delta(previous["fecha"], previous["categoria_id"], previous["monto"], -1)
+            )
+            _bump_data_version(cursor, self.ENTITY)
+        self._publish("delete", [transaccion_id], [_period_of(previous["fecha"])])
+        return result
 
 
 class PresupuestoEspecificoRepository(BaseRepository):
     """Gestión de presupuestos específicos por categoría."""
 
+    ENTITY = "presupuesto"
+
     def create(self, presupuesto: PresupuestoEspecifico) -> int:
         """Inserta un presupuesto mensual para una categoría."""
         query = """
@@ -209,6 +590,7 @@ class PresupuestoEspecificoRepository(BaseRepository):
             presupuesto.comentario,
         )
         presupuesto.id_presupuesto = self._execute_write(query, params)
+        self._publish("create", [presupuesto.id_presupuesto], [(presupuesto.anio, presupuesto.mes)])
         return presupuesto.id_presupuesto or 0
 
     def list_all(self) -> List[PresupuestoEspecifico]:
@@ -248,37 +630,23 @@ class PresupuestoEspecificoRepository(BaseRepository):
         DELETE FROM presupuesto_especifico
         WHERE Id_Presupuesto = %s
         """
-        return self._execute_write(query, (presupuesto_id,))
-
-    def list_by_month(self, year: int, month: int) -> List[Dict[str, Any]]:
-        query = """
-        SELECT
-            p.Id_Presupuesto AS id_presupuesto,
-            p.anio,
-            p.mes,
-            p.monto,
-            c.Id_Categoria AS categoria_id,
-            c.nombre,
-            p.Comentario AS comentario
-        FROM presupuesto_especifico p
-        JOIN categoria c ON p.Categoria_Id_Categoria = c.Id_Categoria
-        WHERE p.anio = %s AND p.mes = %s
-        ORDER BY c.nombre
-        """
-        return self._execute_read(query, (year, month))
-
-    def delete(self, presupuesto_id: int) -> int:
-        query = """
-        DELETE FROM presupuesto_especifico
-        WHERE Id_Presupuesto = %s
-        """
-        return self._execute_write(query, (presupuesto_id,))
-
+        with self._transaction() as cursor:
+            cursor.execute(
+                "SELECT anio, mes FROM presupuesto_especifico WHERE Id_Presupuesto = %s FOR UPDATE",
+                (presupuesto_id,),
+            )
+            previous = cursor.fetchone()
+            cursor.execute(query, (presupuesto_id,))
+            result = cursor.lastrowid
+        self._publish("delete", [presupuesto_id], [(previous["anio"], previous["mes"])] if previous else ALL_PERIODS)
+        return result
 
 
 class ImpuestoAnualRepository(BaseRepository):
     """Operaciones mínimas sobre el impuesto anual histórico."""
 
+    ENTITY = "impuesto"
+
     def save_paid_tax(self, anio: int, impuesto_pagado: float) -> int:
         """Inserta o actualiza el registro del impuesto pagado por año."""
         query = """
@@ -286,7 +654,10 @@ class ImpuestoAnualRepository(BaseRepository):
         VALUES (%s, %s)
         ON DUPLICATE KEY UPDATE impuesto_pagado = VALUES(impuesto_pagado)
         """
-        return self._execute_write(query, (anio, impuesto_pagado))
+        result = self._execute_write(query, (anio, impuesto_pagado))
+        # La clave de `impuesto_anual` es el año, así que hace de id.
+        self._publish("update", [anio], [(anio, None)])
+        return result
 
     def list_tax_payments(self) -> List[Dict[str, Any]]:
         """Recupera los pagos de impuesto almacenados ordenados por año."""
@@ -298,45 +669,96 @@ class ImpuestoAnualRepository(BaseRepository):
         return self._execute_read(query)
 
 
+class ResumenMensualRepository(BaseRepository):
+    """Mantenimiento de `resumen_mensual`, el acumulado por (año, mes, categoría)."""
+
+    ENTITY = "resumen_mensual"
+
+    def rebuild(self, year: Optional[int] = None) -> int:
+        """Recalcula el resumen desde `transaccion` (todo o un año) y retorna las filas generadas."""
+        period_clauses, params = period_filter(year)
+        delete_clauses, delete_params = rollup_period_filter(year, alias="resumen_mensual")
+        delete_where = f"WHERE {' AND '.join(delete_clauses)}" if delete_clauses else ""
+        filters = ["t.fecha IS NOT NULL", *period_clauses]
+        with self._transaction() as cursor:
+            cursor.execute(f"DELETE FROM resumen_mensual {delete_where}", tuple(delete_params))
+            cursor.execute(
+                f"""
+                INSERT INTO resumen_mensual (anio, mes, Categoria_Id_Categoria, total, conteo)
+                SELECT
+                    YEAR(t.fecha),
+                    MONTH(t.fecha),
+                    t.Categoria_Id_Categoria,
+                    SUM(t.monto),
+                    COUNT(*)
+                FROM transaccion t
+                WHERE {' AND '.join(filters)}
+                GROUP BY YEAR(t.fecha), MONTH(t.fecha), t.Categoria_Id_Categoria
+                """,
+                tuple(params),
+            )
+            rows = cursor.rowcount
+        self._publish("rebuild", [], [(year, None)])
+        return rows
+
+
 class FinancialReportRepository(BaseRepository):
-    """Consultas compuestas para ahorros, presupuestos, gastos, ingresos e impuestos."""
-    def _apply_year_filter(self, base: str, year: Optional[int], suffix: str = "") -> str:
-        if year is None:
-            return base
-        return f"{base} WHERE YEAR(t.fecha) = %s{suffix}" if suffix else f"{base} WHERE YEAR(t.fecha) = %s"
+    """Consultas compuestas para ahorros, presupuestos, gastos, ingresos e impuestos.
+
+    Los totales por mes y categoría se leen de `resumen_mensual`, que
+    `TransaccionRepository` mantiene al día en la misma transacción que cada
+    escritura. Las consultas que necesitan el detalle diario siguen yendo a
+    `transaccion` con `period_filter`, que genera rangos semiabiertos sobre
+    `t.fecha`. Las consultas agregadas se sirven desde `report_cache` mientras
+    no haya escrituras en su periodo. Si hay instantáneas Parquet configuradas
+    (`FINANZAS_SNAPSHOT_DIR`), los años cerrados se responden desde ellas.
+    """
+
+    def _snapshot_for(self, year: Optional[int]) -> Optional["SnapshotReports"]:
+        """Instantánea del año si está cerrado y exportado; el año en curso siempre se lee en vivo."""
+        if year is None or year >= date.today().year or not os.getenv("FINANZAS_SNAPSHOT_DIR"):
+            return None
+        from .db.snapshot import snapshot_for_connection
+
+        snapshot = snapshot_for_connection(self._connection)
+        return snapshot if snapshot is not None and snapshot.has_year(year) else None
 
+    @cached_report
     def monthly_savings(self, year: Optional[int] = None) -> List[Dict[str, Any]]:
         """Calcula ahorro neto mensual (ingresos - gastos)."""
-        where = ""
-        params: Sequence[Any] = ()
-        if year is not None:
-            where = "WHERE YEAR(t.fecha) = %s"
-            params = (year,)
+        snapshot = self._snapshot_for(year)
+        if snapshot is not None:
+            return snapshot.monthly_savings(year)
+        period_clauses, params = rollup_period_filter(year)
+        where = f"WHERE {' AND '.join(period_clauses)}" if period_clauses else ""
         query = f"""
         SELECT
-            DATE_FORMAT(t.fecha, '%Y-%m') AS periodo,
-            SUM(t.monto * CASE WHEN c.tipo = 'ingreso' THEN 1 ELSE -1 END) AS ahorro
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+            r.anio,
+            r.mes,
+            SUM(r.total * CASE WHEN c.tipo = 'ingreso' THEN 1 ELSE -1 END) AS ahorro
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         {where}
-        GROUP BY periodo
-        ORDER BY periodo
+        GROUP BY r.anio, r.mes
+        ORDER BY r.anio, r.mes
         """
-        return self._execute_read(query, params)
+        return _with_periodo(self._execute_read(query, tuple(params)))
 
+    @cached_report
     def annual_savings(self) -> List[Dict[str, Any]]:
         """Agrupa el ahorro anual por año."""
         query = """
         SELECT
-            YEAR(t.fecha) AS anio,
-            SUM(t.monto * CASE WHEN c.tipo = 'ingreso' THEN 1 ELSE -1 END) AS ahorro
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
-        GROUP BY anio
-        ORDER BY anio
+            r.anio,
+            SUM(r.total * CASE WHEN c.tipo = 'ingreso' THEN 1 ELSE -1 END) AS ahorro
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
+        GROUP BY r.anio
+        ORDER BY r.anio
         """
         return self._execute_read(query)
 
+    @cached_report
     def get_budget_by_category(self, year: Optional[int] = None) -> List[Dict[str, Any]]:
         """Presupuestos específicos con nombre de categoría."""
         params: Sequence[Any] = ()
@@ -358,6 +780,7 @@ class FinancialReportRepository(BaseRepository):
         """
         return self._execute_read(query, params)
 
+    @cached_report
     def budget_by_category_for_month(self, year: int, month: int) -> List[Dict[str, Any]]:
         """Detalle de presupuestos específicos para el mes y año dados."""
         query = """
@@ -374,6 +797,7 @@ class FinancialReportRepository(BaseRepository):
         params: Sequence[Any] = (year, month)
         return self._execute_read(query, params)
 
+    @cached_report
     def _expense_query(
         self,
         periodicidad: str,
@@ -382,36 +806,35 @@ class FinancialReportRepository(BaseRepository):
     ) -> List[Dict[str, Any]]:
         filters = ["c.tipo = 'gasto'", "c.periodicidad = %s"]
         params: list[Any] = [periodicidad]
-        if year is not None:
-            filters.append("YEAR(t.fecha) = %s")
-            params.append(year)
-        if month is not None:
-            filters.append("MONTH(t.fecha) = %s")
-            params.append(month)
+        period_clauses, period_params = rollup_period_filter(year, month)
+        filters.extend(period_clauses)
+        params.extend(period_params)
         query = f"""
         SELECT
             c.Id_Categoria AS categoria_id,
             c.nombre,
-            SUM(t.monto) AS total
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         WHERE {' AND '.join(filters)}
         GROUP BY c.Id_Categoria, c.nombre
         ORDER BY total DESC
         """
         return self._execute_read(query, tuple(params))
 
+    @cached_report
     def _sum_amount_by_type(self, year: int, tipo: str, month: Optional[int] = None) -> float:
         """Suma total para un tipo de transacción en el período indicado."""
-        filters = ["c.tipo = %s", "YEAR(t.fecha) = %s"]
-        params: list[Any] = [tipo, year]
-        if month is not None:
-            filters.append("MONTH(t.fecha) = %s")
-            params.append(month)
+        snapshot = self._snapshot_for(year)
+        if snapshot is not None:
+            return snapshot.total_by_type(year, tipo, month)
+        period_clauses, period_params = rollup_period_filter(year, month)
+        filters = ["c.tipo = %s", *period_clauses]
+        params: list[Any] = [tipo, *period_params]
         query = f"""
-        SELECT SUM(t.monto) AS total
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+        SELECT SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         WHERE {' AND '.join(filters)}
         """
         rows = self._execute_read(query, tuple(params))
@@ -427,157 +850,230 @@ class FinancialReportRepository(BaseRepository):
         """Totaliza los ingresos del período."""
         return self._sum_amount_by_type(year, "ingreso", month)
 
+    @cached_report
     def expenses_by_category(self, year: int, month: Optional[int] = None) -> List[Dict[str, Any]]:
         """Lista de gastos agrupados por categoría para el año (y mes opcional)."""
-        filters = ["c.tipo = 'gasto'", "YEAR(t.fecha) = %s"]
-        params: list[Any] = [year]
-        if month is not None:
-            filters.append("MONTH(t.fecha) = %s")
-            params.append(month)
+        snapshot = self._snapshot_for(year)
+        if snapshot is not None:
+            return snapshot.by_category(year, "gasto", month)
+        period_clauses, period_params = rollup_period_filter(year, month)
+        filters = ["c.tipo = 'gasto'", *period_clauses]
+        params: list[Any] = list(period_params)
         query = f"""
         SELECT
             c.nombre AS categoria,
-            SUM(t.monto) AS total
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         WHERE {' AND '.join(filters)}
         GROUP BY c.Id_Categoria, c.nombre
         ORDER BY total DESC
         """
         return self._execute_read(query, tuple(params))
 
+    @cached_report
     def incomes_by_category_for_month(self, year: int, month: int) -> List[Dict[str, Any]]:
         """Ingresa los totales por categoría dentro del mes indicado."""
-        query = """
+        snapshot = self._snapshot_for(year)
+        if snapshot is not None:
+            return snapshot.by_category(year, "ingreso", month)
+        period_clauses, params = rollup_period_filter(year, month)
+        query = f"""
         SELECT
             c.nombre AS categoria,
-            SUM(t.monto) AS total
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         WHERE c.tipo = 'ingreso'
-          AND YEAR(t.fecha) = %s
-          AND MONTH(t.fecha) = %s
+          AND {' AND '.join(period_clauses)}
         GROUP BY c.Id_Categoria, c.nombre
         ORDER BY total DESC
         """
-        return self._execute_read(query, (year, month))
+        return self._execute_read(query, tuple(params))
 
+    @cached_report
     def expenses_by_category_by_month(self, year: int) -> List[Dict[str, Any]]:
         """Agrupa los gastos por mes y categoría para montar gráficos apilados."""
-        query = """
+        snapshot = self._snapshot_for(year)
+        if snapshot is not None:
+            return snapshot.by_category_by_month(year, "gasto")
+        period_clauses, params = rollup_period_filter(year)
+        query = f"""
         SELECT
-            MONTH(t.fecha) AS mes,
+            r.mes,
             c.nombre AS categoria,
-            SUM(t.monto) AS total
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         WHERE c.tipo = 'gasto'
-          AND YEAR(t.fecha) = %s
-        GROUP BY mes, c.Id_Categoria, c.nombre
+          AND {' AND '.join(period_clauses)}
+        GROUP BY r.mes, c.Id_Categoria, c.nombre
         ORDER BY mes, total DESC
         """
-        return self._execute_read(query, (year,))
+        return self._execute_read(query, tuple(params))
 
+    @cached_report
     def daily_totals_by_type(self, year: int, month: int, tipo: str) -> List[Dict[str, Any]]:
         """Totales diarios para un tipo de transacción dentro de un mes."""
-        query = """
+        snapshot = self._snapshot_for(year)
+        if snapshot is not None:
+            return snapshot.daily_totals(year, month, tipo)
+        period_clauses, params = period_filter(year, month)
+        query = f"""
         SELECT
             DATE(t.fecha) AS fecha,
             SUM(t.monto) AS total
         FROM transaccion t
         JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
-        WHERE YEAR(t.fecha) = %s
-          AND MONTH(t.fecha) = %s
+        WHERE {' AND '.join(period_clauses)}
           AND c.tipo = %s
         GROUP BY DATE(t.fecha)
         ORDER BY DATE(t.fecha)
         """
-        return self._execute_read(query, (year, month, tipo))
+        return self._execute_read(query, (*params, tipo))
 
+    @cached_report
     def weekly_expense_heatmap(self, year: int, month: int) -> List[Dict[str, Any]]:
         """Datos para representar el gasto por semana y día de la semana."""
-        query = """
+        snapshot = self._snapshot_for(year)
+        if snapshot is not None:
+            return snapshot.weekly_heatmap(year, month)
+        period_clauses, params = period_filter(year, month)
+        query = f"""
         SELECT
             WEEK(t.fecha, 1) AS semana,
             DAYOFWEEK(t.fecha) AS dia_semana,
             SUM(t.monto) AS total
         FROM transaccion t
         JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
-        WHERE YEAR(t.fecha) = %s
-          AND MONTH(t.fecha) = %s
+        WHERE {' AND '.join(period_clauses)}
           AND c.tipo = 'gasto'
         GROUP BY semana, dia_semana
         ORDER BY semana, dia_semana
         """
-        return self._execute_read(query, (year, month))
+        return self._execute_read(query, tuple(params))
 
+    @cached_report
     def monthly_expense_totals(self, year: int) -> List[Dict[str, Any]]:
         """Totales de gastos por cada mes del año para el gráfico anual."""
-        query = """
+        snapshot = self._snapshot_for(year)
+        if snapshot is not None:
+            return snapshot.monthly_totals(year, "gasto")
+        period_clauses, params = rollup_period_filter(year)
+        query = f"""
         SELECT
-            MONTH(t.fecha) AS mes,
+            r.mes,
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
+        WHERE c.tipo = 'gasto'
+          AND {' AND '.join(period_clauses)}
+        GROUP BY r.mes
+        ORDER BY r.mes
+        """
+        return self._execute_read(query, tuple(params))
+
+    @cached_report
+    def category_totals_by_month(self, year: int) -> List[Dict[str, Any]]:
+        """Totales por mes y categoría (gastos e ingresos) del año, en una sola lectura."""
+        snapshot = self._snapshot_for(year)
+        if snapshot is not None:
+            return snapshot.category_totals_by_month(year)
+        period_clauses, params = rollup_period_filter(year)
+        query = f"""
+        SELECT
+            r.mes,
+            c.Id_Categoria AS categoria_id,
+            c.nombre AS categoria,
+            c.tipo,
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
+        WHERE {' AND '.join(period_clauses)}
+        GROUP BY r.mes, c.Id_Categoria, c.nombre, c.tipo
+        ORDER BY r.mes, c.nombre
+        """
+        return self._execute_read(query, tuple(params))
+
+    @cached_report
+    def daily_totals_for_year(self, year: int) -> List[Dict[str, Any]]:
+        """Totales diarios por tipo de transacción para todo el año."""
+        snapshot = self._snapshot_for(year)
+        if snapshot is not None:
+            return snapshot.daily_totals(year)
+        period_clauses, params = period_filter(year)
+        query = f"""
+        SELECT
+            DATE(t.fecha) AS fecha,
+            c.tipo,
             SUM(t.monto) AS total
         FROM transaccion t
         JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
-        WHERE c.tipo = 'gasto'
-          AND YEAR(t.fecha) = %s
-        GROUP BY mes
-        ORDER BY mes
+        WHERE {' AND '.join(period_clauses)}
+        GROUP BY DATE(t.fecha), c.tipo
+        ORDER BY DATE(t.fecha)
         """
-        return self._execute_read(query, (year,))
+        return self._execute_read(query, tuple(params))
 
     def fixed_expenses_by_year(self, year: int) -> List[Dict[str, Any]]:
         """Totales por categoría para los gastos fijos dentro del año."""
         return self._expense_query("mensual", year)
 
+    @cached_report
     def fixed_monthly_expenses_by_category(self, year: int) -> List[Dict[str, Any]]:
         """Totales mensuales por categoría de los gastos fijos del año."""
-        query = """
+        period_clauses, params = rollup_period_filter(year)
+        query = f"""
         SELECT
-            MONTH(t.fecha) AS mes,
+            r.mes,
             c.nombre,
-            SUM(t.monto) AS total
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         WHERE c.tipo = 'gasto'
           AND c.periodicidad = 'mensual'
-          AND YEAR(t.fecha) = %s
-        GROUP BY mes, c.nombre
-        ORDER BY mes, c.nombre
+          AND {' AND '.join(period_clauses)}
+        GROUP BY r.mes, c.nombre
+        ORDER BY r.mes, c.nombre
         """
-        return self._execute_read(query, (year,))
+        return self._execute_read(query, tuple(params))
+
+    @cached_report
     def variable_monthly_totals(self, year: int) -> List[Dict[str, Any]]:
         """Suma mensual de gastos variables para el año indicado."""
-        query = """
+        period_clauses, params = rollup_period_filter(year)
+        query = f"""
         SELECT
-            MONTH(t.fecha) AS mes,
-            SUM(t.monto) AS total
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+            r.mes,
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         WHERE c.tipo = 'gasto'
           AND c.periodicidad = 'variable'
-          AND YEAR(t.fecha) = %s
-        GROUP BY MONTH(t.fecha)
-        ORDER BY mes
+          AND {' AND '.join(period_clauses)}
+        GROUP BY r.mes
+        ORDER BY r.mes
         """
-        return self._execute_read(query, (year,))
-        
+        return self._execute_read(query, tuple(params))
+
+    @cached_report
     def variable_monthly_totals_by_category(self, year: int, category_id: int) -> List[Dict[str, Any]]:
         """Suma mensual de gastos variables para una categoría específica."""
-        query = """
+        period_clauses, params = rollup_period_filter(year)
+        query = f"""
         SELECT
-            MONTH(t.fecha) AS mes,
-            SUM(t.monto) AS total
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+            r.mes,
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         WHERE c.tipo = 'gasto'
           AND c.periodicidad = 'variable'
-          AND c.Id_Categoria = %s
-          AND YEAR(t.fecha) = %s
-        GROUP BY MONTH(t.fecha)
-        ORDER BY mes
+          AND r.Categoria_Id_Categoria = %s
+          AND {' AND '.join(period_clauses)}
+        GROUP BY r.mes
+        ORDER BY r.mes
         """
-        return self._execute_read(query, (category_id, year))
+        return self._execute_read(query, (category_id, *params))
 
     def monthly_fixed_expenses(self, year: Optional[int] = None, month: Optional[int] = None) -> List[Dict[str, Any]]:
         """Gastos categorizados como fijos mensuales."""
@@ -591,84 +1087,79 @@ class FinancialReportRepository(BaseRepository):
         """Gastos con periodicidad anual."""
         return self._expense_query("anual", year)
 
+    @cached_report
     def incomes_by_category(self, year: Optional[int] = None) -> List[Dict[str, Any]]:
         """Ingresos totales por categoría."""
-        params: Sequence[Any] = ()
-        clause = ""
-        if year is not None:
-            clause = "AND YEAR(t.fecha) = %s"
-            params = (year,)
+        period_clauses, params = rollup_period_filter(year)
+        clause = "".join(f"AND {condition} " for condition in period_clauses)
         query = f"""
         SELECT
             c.Id_Categoria AS categoria_id,
             c.nombre,
             c.nombre AS categoria,
-            SUM(t.monto) AS total
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         WHERE c.tipo = 'ingreso'
         {clause}
         GROUP BY c.Id_Categoria, c.nombre
         ORDER BY total DESC
         """
-        if year is not None:
-            params = (year,)
-        return self._execute_read(query, params)
+        return self._execute_read(query, tuple(params))
 
+    @cached_report
     def monthly_incomes(self, year: Optional[int] = None) -> List[Dict[str, Any]]:
         """Agrupa ingresos mensuales."""
-        params: Sequence[Any] = ()
-        clause = ""
-        if year is not None:
-            clause = "AND YEAR(t.fecha) = %s"
-            params = (year,)
+        period_clauses, params = rollup_period_filter(year)
+        clause = "".join(f"AND {condition} " for condition in period_clauses)
         query = f"""
         SELECT
-            DATE_FORMAT(t.fecha, '%Y-%m') AS periodo,
-            SUM(t.monto) AS total
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+            r.anio,
+            r.mes,
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         WHERE c.tipo = 'ingreso'
         {clause}
-        GROUP BY periodo
-        ORDER BY periodo
+        GROUP BY r.anio, r.mes
+        ORDER BY r.anio, r.mes
         """
-        return self._execute_read(query, params)
+        return _with_periodo(self._execute_read(query, tuple(params)))
 
+    @cached_report
     def annual_incomes(self) -> List[Dict[str, Any]]:
         """Agrupa ingresos por año."""
         query = """
         SELECT
-            YEAR(t.fecha) AS anio,
-            SUM(t.monto) AS total
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+            r.anio,
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         WHERE c.tipo = 'ingreso'
-        GROUP BY anio
-        ORDER BY anio
+        GROUP BY r.anio
+        ORDER BY r.anio
         """
         return self._execute_read(query)
 
+    @cached_report
     def monthly_incomes_by_category(self, year: Optional[int] = None) -> List[Dict[str, Any]]:
         """Totaliza ingresos mensuales por categoría."""
-        params: Sequence[Any] = ()
-        clause = ""
-        if year is not None:
-            clause = "AND YEAR(t.fecha) = %s"
-            params = (year,)
+        period_clauses, params = rollup_period_filter(year)
+        clause = "".join(f"AND {condition} " for condition in period_clauses)
         query = f"""
         SELECT
-            DATE_FORMAT(t.fecha, '%Y-%m') AS periodo,
+            r.anio,
+            r.mes,
             c.nombre,
-            SUM(t.monto) AS total
-        FROM transaccion t
-        JOIN categoria c ON t.Categoria_Id_Categoria = c.Id_Categoria
+            SUM(r.total) AS total
+        FROM resumen_mensual r
+        JOIN categoria c ON r.Categoria_Id_Categoria = c.Id_Categoria
         WHERE c.tipo = 'ingreso'
         {clause}
-        GROUP BY periodo, c.nombre
-        ORDER BY periodo, c.nombre
+        GROUP BY r.anio, r.mes, c.nombre
+        ORDER BY r.anio, r.mes, c.nombre
         """
-        return self._execute_read(query, params)
+        return _with_periodo(self._execute_read(query, tuple(params)))
 
     def annual_report(self, anio: int) -> Dict[str, Any]:
         """Compone un reporte anual integrando todas las métricas."""
@@ -689,9 +1180,10 @@ class FinancialReportRepository(BaseRepository):
             },
         }
 
-    def _transaction_detail_query(self, filters: list[str], params: list[Any]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _transaction_detail_sql(filters: list[str]) -> str:
         """Base para consultas detalladas de transacciones con categoría."""
-        query = f"""
+        return f"""
         SELECT
             t.Id_Transaccion AS id_transaccion,
             t.monto,
@@ -706,24 +1198,34 @@ class FinancialReportRepository(BaseRepository):
         WHERE {' AND '.join(filters)}
         ORDER BY t.fecha DESC
         """
-        return self._execute_read(query, tuple(params))
 
     def transactions_for_year(self, year: int) -> List[Dict[str, Any]]:
         """Trae todas las transacciones realizadas durante el año seleccionado."""
-        filters = ["YEAR(t.fecha) = %s"]
-        params: list[Any] = [year]
-        return self._transaction_detail_query(filters, params)
+        filters, params = period_filter(year)
+        return self._execute_read(self._transaction_detail_sql(filters), tuple(params))
 
     def transactions_for_month(self, year: int, month: int) -> List[Dict[str, Any]]:
         """Trae las transacciones del mes y año seleccionados."""
-        filters = ["YEAR(t.fecha) = %s", "MONTH(t.fecha) = %s"]
-        params = [year, month]
-        return self._transaction_detail_query(filters, params)
+        filters, params = period_filter(year, month)
+        return self._execute_read(self._transaction_detail_sql(filters), tuple(params))
+
+    def iter_transactions_for_year(self, year: int, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Recorre las transacciones del año por lotes, sin cargarlas todas en memoria."""
+        filters, params = period_filter(year)
+        return self._execute_stream(self._transaction_detail_sql(filters), tuple(params), batch_size)
+
+    def iter_transactions_for_month(
+        self, year: int, month: int, batch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """Recorre las transacciones del mes por lotes, sin cargarlas todas en memoria."""
+        filters, params = period_filter(year, month)
+        return self._execute_stream(self._transaction_detail_sql(filters), tuple(params), batch_size)
 
+    @cached_report
     def get_available_years(self) -> list[int]:
         query = """
-        SELECT DISTINCT YEAR(fecha) AS anio
-        FROM transaccion
+        SELECT DISTINCT anio
+        FROM resumen_mensual
         ORDER BY anio
         """
         rows = self._execute_read(query)
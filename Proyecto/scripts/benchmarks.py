@@ -0,0 +1,322 @@
+"""Mide reportes, tablero, gráficos, predicción y exportación PDF sobre una base sembrada.
+
+La base es un archivo SQLite poblado con `finanzas_app.generador` (semilla fija,
+así que dos corridas con los mismos parámetros miden los mismos datos); se
+reutiliza entre corridas. Con `--configurada` se mide la base de `DB_*` sin sembrar.
+
+Cada caso se ejecuta una vez sin medir (contando sus consultas SQL) y luego
+`--repeticiones` veces con `report_cache` y `figure_cache` vacías, de modo que se
+mide el camino sin caché. El resultado se guarda en JSON; con `--baseline` se
+compara la mediana de cada caso contra una corrida anterior y el script termina
+con código 1 si alguno empeoró más de `--umbral` por ciento:
+
+    python scripts/benchmarks.py --transacciones 1000000 --salida base.json
+    python scripts/benchmarks.py --transacciones 1000000 --baseline base.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from finanzas_app.cache import report_cache
+from finanzas_app.db.connection import DatabaseConnection
+from finanzas_app.db.profiler import query_profiler
+from finanzas_app.generador import populate
+from finanzas_app.repositories import CategoriaRepository, FinancialReportRepository
+
+# Diferencias menores a esto se consideran ruido aunque superen el umbral relativo.
+NOISE_FLOOR_MS = 1.0
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable[[], Any]
+    setup: Optional[Callable[[], None]] = None
+    slow: bool = False
+
+
+def _seed_database(args: argparse.Namespace) -> Path:
+    """Ruta de la base SQLite sembrada con los parámetros pedidos; la crea si falta."""
+    directory = Path(args.directorio)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"base_{args.transacciones}_{args.desde}_{args.hasta}_s{args.semilla}.db"
+    ready = path.with_suffix(".listo")
+    os.environ["DB_BACKEND"] = "sqlite"
+    os.environ["DB_DATABASE"] = str(path)
+    os.environ.pop("DB_CONFIG_FILE", None)
+    if ready.exists():
+        return path
+    # Una siembra interrumpida deja la base a medias: se empieza de cero.
+    for stale in directory.glob(f"{path.name}*"):
+        stale.unlink()
+    started = time.perf_counter()
+    populate(DatabaseConnection(), args.transacciones, args.desde, args.hasta, semilla=args.semilla)
+    ready.write_text(f"{time.perf_counter() - started:.1f}s\n", encoding="utf-8")
+    return path
+
+
+def _arguments(function: Callable[..., Any], values: Dict[str, Any]) -> Dict[str, Any]:
+    """Argumentos de prueba para `function` según el nombre de cada parámetro."""
+    kwargs: Dict[str, Any] = {}
+    for name, parameter in inspect.signature(function).parameters.items():
+        if name == "self":
+            continue
+        if name in values:
+            kwargs[name] = values[name]
+        elif parameter.default is inspect.Parameter.empty:
+            raise ValueError(f"{function.__qualname__}: no hay valor de prueba para {name!r}")
+    return kwargs
+
+
+def _consume(result: Any) -> Any:
+    # Los métodos `iter_*` no consultan nada hasta que se recorren.
+    if inspect.isgenerator(result):
+        return sum(1 for _ in result)
+    return result
+
+
+def _clear_caches() -> None:
+    report_cache.clear()
+    graficos = sys.modules.get("finanzas_app.logic.graficos")
+    if graficos is not None:
+        graficos.figure_cache.clear()
+
+
+def _report_cases(repo: FinancialReportRepository, values: Dict[str, Any]) -> List[Case]:
+    cases = []
+    for name, method in inspect.getmembers(repo, inspect.ismethod):
+        if name.startswith("_"):
+            continue
+        kwargs = _arguments(method, values)
+        cases.append(Case(f"reportes.{name}", lambda method=method, kwargs=kwargs: _consume(method(**kwargs))))
+    return cases
+
+
+def _dashboard_cases(values: Dict[str, Any]) -> List[Case]:
+    from finanzas_app.logic.calculos import compute_dashboard_stats, obtener_dashboard_stats
+
+    return [
+        Case("tablero.obtener_dashboard_stats", obtener_dashboard_stats),
+        Case("tablero.compute_dashboard_stats", lambda: compute_dashboard_stats(values["year"], values["month"])),
+    ]
+
+
+def _chart_cases(values: Dict[str, Any]) -> List[Case]:
+    from finanzas_app.logic import graficos
+
+    cases = []
+    for name, function in inspect.getmembers(graficos, inspect.isfunction):
+        if name.startswith("_") or not name.endswith("_figure") or function.__module__ != graficos.__name__:
+            continue
+        kwargs = _arguments(function, values)
+        cases.append(Case(f"graficos.{name}", lambda function=function, kwargs=kwargs: function(**kwargs)))
+    return cases
+
+
+def _prediction_cases() -> List[Case]:
+    from finanzas_app.logic.almacen_modelo import ModelStore
+    from finanzas_app.logic.modelo import predict_future_expenses
+
+    def forget_model() -> None:
+        ModelStore(DatabaseConnection()).clear()
+
+    return [
+        Case("prediccion.entrenamiento", predict_future_expenses, setup=forget_model, slow=True),
+        # Tras el caso anterior el artefacto guardado coincide con la huella de los datos.
+        Case("prediccion.modelo_guardado", predict_future_expenses),
+    ]
+
+
+def _pdf_cases(repo: FinancialReportRepository, values: Dict[str, Any], directory: Path) -> List[Case]:
+    from finanzas_app.reports.pipeline import write_annual_report, write_monthly_report
+
+    year, month = values["year"], values["month"]
+    return [
+        Case(
+            "pdf.mensual",
+            lambda: write_monthly_report(directory / "mensual.pdf", year, month, repo=repo),
+            slow=True,
+        ),
+        Case("pdf.anual", lambda: write_annual_report(directory / "anual.pdf", year, repo=repo), slow=True),
+    ]
+
+
+def _measure(case: Case, repetitions: int) -> Dict[str, Any]:
+    _clear_caches()
+    if case.setup is not None:
+        case.setup()
+    # La primera ejecución no se mide: importa módulos, abre conexiones y cuenta las consultas.
+    query_profiler.reset()
+    query_profiler.enable(slow_threshold_ms=float("inf"))
+    try:
+        case.run()
+    finally:
+        query_profiler.disable()
+    queries = sum(stats.calls for stats in query_profiler.statements())
+    timings: List[float] = []
+    for _ in range(repetitions):
+        _clear_caches()
+        if case.setup is not None:
+            case.setup()
+        started = time.perf_counter()
+        case.run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "runs": len(timings),
+        "queries": queries,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "stdev_ms": round(statistics.stdev(timings), 3) if len(timings) > 1 else 0.0,
+        "max_ms": round(max(timings), 3),
+    }
+
+
+def _compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Anota en cada caso la variación frente a la baseline y retorna los que empeoraron."""
+    regressions = []
+    previous_cases = baseline.get("cases", {})
+    for name, result in results.items():
+        previous = previous_cases.get(name)
+        if previous is None:
+            continue
+        before, after = previous["median_ms"], result["median_ms"]
+        change = (after - before) / before * 100 if before else 0.0
+        result["baseline_median_ms"] = before
+        result["change_pct"] = round(change, 1)
+        if change > threshold and after - before > NOISE_FLOOR_MS:
+            regressions.append(name)
+    return regressions
+
+
+def _print_table(results: Dict[str, Dict[str, Any]], regressions: List[str]) -> None:
+    width = max(len(name) for name in results)
+    print(f"{'caso':<{width}}  {'mediana ms':>11}  {'mín ms':>10}  {'consultas':>9}  {'vs baseline':>11}")
+    for name, result in results.items():
+        change = f"{result['change_pct']:+.1f}%" if "change_pct" in result else "-"
+        flag = "  << regresión" if name in regressions else ""
+        print(
+            f"{name:<{width}}  {result['median_ms']:>11.1f}  {result['min_ms']:>10.1f}  "
+            f"{result['queries']:>9}  {change:>11}{flag}"
+        )
+
+
+def main() -> None:
+    today = date.today()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transacciones", type=int, default=100_000, help="Tamaño de la base sembrada.")
+    parser.add_argument("--desde", type=int, default=today.year - 4, help="Primer año de datos.")
+    parser.add_argument("--hasta", type=int, default=today.year, help="Último año de datos.")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument(
+        "--directorio",
+        default=str(Path.home() / ".finanzas_app" / "benchmarks"),
+        help="Dónde se guardan las bases sembradas.",
+    )
+    parser.add_argument("--configurada", action="store_true", help="Mide la base de DB_* en lugar de sembrar una.")
+    parser.add_argument("--anio", type=int, default=None, help="Año consultado (por defecto, --hasta).")
+    parser.add_argument("--mes", type=int, default=6, help="Mes consultado.")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--repeticiones-lentas", type=int, default=2, help="Repeticiones de entrenamiento y PDF.")
+    parser.add_argument("--filtro", default=None, help="Expresión regular sobre el nombre de los casos.")
+    parser.add_argument("--salida", default=None, help="JSON de resultados (por defecto, en --directorio).")
+    parser.add_argument("--baseline", default=None, help="JSON de una corrida anterior para comparar.")
+    parser.add_argument("--umbral", type=float, default=20.0, help="Empeoramiento tolerado de la mediana, en %%.")
+    args = parser.parse_args()
+
+    database = None if args.configurada else _seed_database(args)
+    connection = DatabaseConnection()
+    work_dir = Path(tempfile.mkdtemp(prefix="finanzas_bench_"))
+    # El modelo de predicción se guarda aparte para no pisar el de la aplicación.
+    os.environ.setdefault("FINANZAS_MODEL_DIR", str(work_dir / "modelos"))
+
+    repo = FinancialReportRepository(connection)
+    categorias = CategoriaRepository(connection).list_by_tipo("gasto")
+    variable = next((categoria for categoria in categorias if categoria.periodicidad != "mensual"), None)
+    values = {
+        "year": args.anio or args.hasta,
+        "anio": args.anio or args.hasta,
+        "month": args.mes,
+        "tipo": "gasto",
+        "category_id": variable.id_categoria if variable else None,
+        "category_label": variable.nombre if variable else None,
+    }
+    cases = [
+        *_report_cases(repo, values),
+        *_dashboard_cases(values),
+        *_chart_cases(values),
+        *_prediction_cases(),
+        *_pdf_cases(repo, values, work_dir),
+    ]
+    if args.filtro:
+        pattern = re.compile(args.filtro)
+        cases = [case for case in cases if pattern.search(case.name)]
+
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        for case in cases:
+            print(f"· {case.name}", flush=True)
+            repetitions = args.repeticiones_lentas if case.slow else args.repeticiones
+            results[case.name] = _measure(case, max(1, repetitions))
+    finally:
+        from finanzas_app.reports.pipeline import shutdown_executor
+
+        shutdown_executor()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    regressions: List[str] = []
+    baseline_info = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        if baseline.get("meta", {}).get("transactions") != (None if args.configurada else args.transacciones):
+            print("Aviso: la baseline se midió sobre una base de otro tamaño.")
+        regressions = _compare(results, baseline, args.umbral)
+        baseline_info = {"path": str(args.baseline), "threshold_pct": args.umbral, "regressions": regressions}
+
+    finished_at = datetime.now()
+    payload = {
+        "meta": {
+            "created_at": finished_at.isoformat(timespec="seconds"),
+            "backend": connection.backend,
+            "database": str(database) if database else connection.label,
+            "transactions": None if args.configurada else args.transacciones,
+            "years": [args.desde, args.hasta],
+            "seed": args.semilla,
+            "query_year": values["year"],
+            "query_month": values["month"],
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "snapshot_dir": os.getenv("FINANZAS_SNAPSHOT_DIR"),
+        },
+        "baseline": baseline_info,
+        "cases": results,
+    }
+    output = Path(args.salida) if args.salida else Path(args.directorio) / f"bench_{finished_at:%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    _print_table(results, regressions)
+    print(f"Resultados en {output}")
+    if regressions:
+        print(f"{len(regressions)} casos empeoraron más de {args.umbral:.0f}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
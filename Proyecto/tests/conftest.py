@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Dict, Iterator
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from finanzas_app.cache import report_cache
+from finanzas_app.config import DBConfig
+from finanzas_app.db.connection import DatabaseConnection
+from finanzas_app.generador import ensure_categories
+from finanzas_app.models import Categoria
+
+
+@pytest.fixture
+def connection(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[DatabaseConnection]:
+    """Base SQLite nueva para cada prueba, con las categorías por defecto."""
+    # Sin instantáneas: los reportes se leen siempre de la base.
+    monkeypatch.delenv("FINANZAS_SNAPSHOT_DIR", raising=False)
+    report_cache.clear()
+    connection = DatabaseConnection(DBConfig.sqlite(tmp_path / "finanzas.db", pool_size=1, pool_max_size=3))
+    ensure_categories(connection)
+    yield connection
+    report_cache.clear()
+    DatabaseConnection._pools.pop(connection.cache_key).close_idle()
+
+
+@pytest.fixture
+def categorias(connection: DatabaseConnection) -> Dict[str, Categoria]:
+    """Categorías de la base de prueba por nombre."""
+    return {categoria.nombre: categoria for categoria in ensure_categories(connection)}
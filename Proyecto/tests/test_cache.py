@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import date
+
+from finanzas_app.cache import ReportCache, report_cache
+from finanzas_app.events import data_events
+from finanzas_app.models import PresupuestoEspecifico, Transaccion
+from finanzas_app.repositories import (
+    FinancialReportRepository,
+    PresupuestoEspecificoRepository,
+    TransaccionRepository,
+)
+
+
+def test_invalidate_period_drops_only_overlapping_entries() -> None:
+    cache = ReportCache()
+    cache.set("marzo", 1, (2024, 3))
+    cache.set("abril", 2, (2024, 4))
+    cache.set("anual", 3, (2024, None))
+    cache.set("historico", 4, (None, None))
+    cache.set("otro_anio", 5, (2023, 3))
+
+    assert cache.invalidate_period(2024, 3) == 3
+    assert cache.get("abril") == (True, 2)
+    assert cache.get("otro_anio") == (True, 5)
+    for key in ("marzo", "anual", "historico"):
+        assert cache.get(key) == (False, None)
+
+
+def test_invalidate_period_without_year_clears_everything() -> None:
+    cache = ReportCache()
+    cache.set("marzo", 1, (2024, 3))
+    cache.set("otro_anio", 2, (2023, None))
+
+    assert cache.invalidate_period(None) == 2
+    assert cache.stats()["size"] == 0
+
+
+def test_expired_entries_are_misses() -> None:
+    cache = ReportCache(ttl=-1)
+    cache.set("marzo", 1, (2024, 3))
+
+    assert cache.get("marzo") == (False, None)
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    cache = ReportCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_write_invalidates_only_its_month(connection, categorias) -> None:
+    supermercado = categorias["Supermercado"].id_categoria
+    transacciones = TransaccionRepository(connection)
+    reportes = FinancialReportRepository(connection)
+    transacciones.create(Transaccion(monto=100, fecha=date(2024, 3, 10), categoria_id=supermercado))
+    transacciones.create(Transaccion(monto=40, fecha=date(2024, 4, 2), categoria_id=supermercado))
+
+    assert reportes.total_expenses(2024, 3) == 100
+    assert reportes.total_expenses(2024, 4) == 40
+    misses = report_cache.stats()["misses"]
+
+    # Un alta en abril deja el total de marzo en caché y recalcula el de abril.
+    transacciones.create(Transaccion(monto=15, fecha=date(2024, 4, 20), categoria_id=supermercado))
+    assert reportes.total_expenses(2024, 3) == 100
+    assert report_cache.stats()["misses"] == misses
+    assert reportes.total_expenses(2024, 4) == 55
+    assert report_cache.stats()["misses"] == misses + 1
+
+
+def test_update_invalidates_previous_and_new_month(connection, categorias) -> None:
+    supermercado = categorias["Supermercado"].id_categoria
+    transacciones = TransaccionRepository(connection)
+    reportes = FinancialReportRepository(connection)
+    transaccion = Transaccion(monto=100, fecha=date(2024, 3, 10), categoria_id=supermercado)
+    transacciones.create(transaccion)
+    assert reportes.total_expenses(2024, 3) == 100
+    assert reportes.total_expenses(2024, 5) == 0
+
+    transaccion.fecha = date(2024, 5, 1)
+    transacciones.update(transaccion)
+
+    assert reportes.total_expenses(2024, 3) == 0
+    assert reportes.total_expenses(2024, 5) == 100
+
+
+def test_budget_delete_publishes_its_month(connection, categorias) -> None:
+    presupuestos = PresupuestoEspecificoRepository(connection)
+    presupuesto = PresupuestoEspecifico(anio=2024, mes=6, monto=300, categoria_id=categorias["Ocio"].id_categoria)
+    presupuestos.create(presupuesto)
+    events = []
+    data_events.subscribe(events.append, ["presupuesto"])
+    try:
+        presupuestos.delete(presupuesto.id_presupuesto)
+    finally:
+        data_events.unsubscribe(events.append)
+
+    assert presupuestos.list_by_month(2024, 6) == []
+    assert [(event.action, event.periods) for event in events] == [("delete", frozenset({(2024, 6)}))]
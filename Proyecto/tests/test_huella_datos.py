@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import date
+
+from finanzas_app.models import Transaccion
+from finanzas_app.repositories import TransaccionRepository
+
+
+def test_fingerprint_changes_on_edits_that_keep_aggregates(connection, categorias) -> None:
+    repo = TransaccionRepository(connection)
+    supermercado = categorias["Supermercado"].id_categoria
+    antigua = Transaccion(monto=10, cantidad=1, fecha=date(2024, 1, 5), categoria_id=supermercado)
+    repo.create(antigua)
+    repo.create(Transaccion(monto=20, cantidad=1, fecha=date(2024, 6, 1), categoria_id=supermercado))
+    huellas = [repo.data_fingerprint()]
+
+    # Ni el número de filas, ni la suma de montos, ni la última fecha cambian.
+    antigua.cantidad = 3
+    repo.update(antigua)
+    huellas.append(repo.data_fingerprint())
+    antigua.fecha = date(2024, 2, 5)
+    repo.update(antigua)
+    huellas.append(repo.data_fingerprint())
+
+    assert len({tuple(sorted(huella.items())) for huella in huellas}) == len(huellas)
+
+
+def test_fingerprint_is_stable_without_writes(connection, categorias) -> None:
+    repo = TransaccionRepository(connection)
+    repo.create_many(
+        [Transaccion(monto=5, fecha=date(2024, 3, dia), categoria_id=categorias["Ocio"].id_categoria) for dia in range(1, 4)]
+    )
+    assert repo.data_fingerprint() == repo.data_fingerprint()
+    assert repo.data_fingerprint()["version"] == 1
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import List, Optional
+
+import pytest
+
+from finanzas_app.models import Transaccion
+from finanzas_app.repositories import TransaccionRepository, _decode_page_token, _encode_page_token
+
+
+def _all_pages(repo: TransaccionRepository, limit: int) -> List[int]:
+    ids: List[int] = []
+    token: Optional[str] = None
+    while True:
+        page, token = repo.list_page(token, limit)
+        assert len(page) <= limit
+        ids.extend(row["id_transaccion"] for row in page)
+        if token is None:
+            return ids
+
+
+@pytest.fixture
+def repo(connection, categorias) -> TransaccionRepository:
+    """Transacciones con fechas repetidas y algunas sin fecha."""
+    repo = TransaccionRepository(connection)
+    supermercado = categorias["Supermercado"].id_categoria
+    for numero in range(23):
+        fecha = None if numero % 7 == 3 else date(2024, 1 + numero % 4, 1 + numero % 2)
+        repo.create(Transaccion(monto=numero, fecha=fecha, categoria_id=supermercado))
+    return repo
+
+
+def _expected_order(repo: TransaccionRepository) -> List[int]:
+    rows = repo.list_all_with_category()
+    dated = sorted((row for row in rows if row["fecha"] is not None), key=lambda row: (row["fecha"], row["id_transaccion"]))
+    undated = sorted(row["id_transaccion"] for row in rows if row["fecha"] is None)
+    return [row["id_transaccion"] for row in reversed(dated)] + undated[::-1]
+
+
+@pytest.mark.parametrize("limit", [1, 4, 7, 22, 23, 50])
+def test_pages_cover_every_row_once_in_order(repo: TransaccionRepository, limit: int) -> None:
+    assert _all_pages(repo, limit) == _expected_order(repo)
+
+
+def test_token_survives_inserts_before_it(repo: TransaccionRepository, categorias) -> None:
+    expected = _expected_order(repo)
+    _, token = repo.list_page(None, 5)
+    # Con OFFSET, una fila más reciente que la página ya leída desplazaría las siguientes.
+    repo.create(Transaccion(monto=1, fecha=date(2030, 1, 1), categoria_id=categorias["Ocio"].id_categoria))
+    rest: List[int] = []
+    while token is not None:
+        page, token = repo.list_page(token, 5)
+        rest.extend(row["id_transaccion"] for row in page)
+
+    assert rest == expected[5:]
+
+
+def test_token_round_trip() -> None:
+    assert _decode_page_token(_encode_page_token(date(2024, 3, 1), 42)) == (date(2024, 3, 1), 42)
+    assert _decode_page_token(_encode_page_token(None, 7)) == (None, 7)
+    assert _decode_page_token(None) == (None, None)
+
+
+def test_invalid_token_raises_value_error() -> None:
+    with pytest.raises(ValueError, match="Token de página inválido"):
+        _decode_page_token("no-es-un-token")
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import List
+
+import pytest
+
+from finanzas_app.config import DBConfig
+from finanzas_app.db.connection import DatabaseConnection
+from finanzas_app.db.pool import InstrumentedPool, PoolTimeoutError
+
+
+class FakeConnection:
+    """Conexión mínima que registra si se cerró o se deshizo."""
+
+    def __init__(self) -> None:
+        self.connected = True
+        self.closed = False
+        self.in_transaction = False
+        self.rollbacks = 0
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def opened() -> List[FakeConnection]:
+    return []
+
+
+def _pool(opened: List[FakeConnection], **options) -> InstrumentedPool:
+    def connect() -> FakeConnection:
+        conn = FakeConnection()
+        opened.append(conn)
+        return conn
+
+    return InstrumentedPool(connect, **{"min_size": 1, "max_size": 1, **options})
+
+
+def test_exhausted_pool_times_out(opened) -> None:
+    pool = _pool(opened, timeout=0.05)
+    held = pool.get_connection()
+
+    started = time.monotonic()
+    with pytest.raises(PoolTimeoutError, match="agotado"):
+        pool.get_connection()
+    assert time.monotonic() - started >= 0.05
+    assert pool.stats()["timeouts"] == 1
+    held.close()
+
+
+def test_waiter_gets_connection_released_in_time(opened) -> None:
+    pool = _pool(opened, timeout=5)
+    held = pool.get_connection()
+    timer = threading.Timer(0.05, held.close)
+    timer.start()
+
+    with pool.get_connection() as conn:
+        assert conn.is_connected()
+    timer.join()
+    stats = pool.stats()
+    assert stats["waits"] == 1
+    assert stats["opened"] == 1
+    assert stats["peak_in_use"] == 1
+
+
+def test_grows_up_to_max_size_and_shrinks_idle_surplus(opened) -> None:
+    pool = _pool(opened, max_size=3, max_idle=0)
+    conns = [pool.get_connection() for _ in range(3)]
+    assert pool.stats()["size"] == 3
+    for conn in conns:
+        conn.close()
+
+    # Las inactivas por encima de `min_size` se cierran al devolverse.
+    stats = pool.stats()
+    assert stats["size"] == 1
+    assert stats["peak_in_use"] == 3
+    assert sum(conn.closed for conn in opened) == 2
+
+
+def test_connections_are_recycled_after_max_lifetime(opened) -> None:
+    pool = _pool(opened, max_lifetime=0.01)
+    pool.get_connection().close()
+    time.sleep(0.02)
+
+    with pool.get_connection():
+        pass
+    assert len(opened) == 2
+    assert opened[0].closed
+    stats = pool.stats()
+    assert stats["recycled"] == 1
+    assert stats["size"] == 1
+
+
+def test_failed_health_check_replaces_connection(opened) -> None:
+    pool = _pool(opened, check_after=0)
+    pool.get_connection().close()
+    opened[0].connected = False
+
+    with pool.get_connection() as conn:
+        assert conn.is_connected()
+    assert opened[0].closed
+    stats = pool.stats()
+    assert stats["failed_checks"] == 1
+    assert stats["recycled"] == 1
+
+
+def test_release_rolls_back_open_transaction(opened) -> None:
+    pool = _pool(opened)
+    conn = pool.get_connection()
+    opened[0].in_transaction = True
+    conn.close()
+
+    assert opened[0].rollbacks == 1
+    with pytest.raises(RuntimeError, match="ya se devolvió"):
+        conn.is_connected()
+
+
+def test_failed_connect_frees_reserved_slot() -> None:
+    def connect() -> FakeConnection:
+        raise ConnectionError("sin servidor")
+
+    pool = InstrumentedPool(connect, min_size=1, max_size=1, timeout=0.01)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            pool.get_connection()
+    assert pool.stats()["size"] == 0
+    assert pool.stats()["in_use"] == 0
+
+
+def test_sqlite_pool_uses_configured_timeout(tmp_path) -> None:
+    config = DBConfig.sqlite(tmp_path / "pool.db", pool_size=1, pool_max_size=1, pool_timeout=0.05)
+    connection = DatabaseConnection(config)
+    try:
+        with connection.get_connection():
+            with pytest.raises(PoolTimeoutError):
+                connection.get_connection()
+        assert connection.test_connection().startswith("SQLite")
+        assert connection.pool_stats()["timeouts"] == 1
+    finally:
+        DatabaseConnection._pools.pop(connection.cache_key).close_idle()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from finanzas_app.db.profiler import query_profiler
+from finanzas_app.models import Transaccion
+from finanzas_app.repositories import ResumenMensualRepository, TransaccionRepository
+
+
+@pytest.fixture
+def profiler():
+    query_profiler.reset()
+    query_profiler.enable(slow_threshold_ms=10_000)
+    yield query_profiler
+    query_profiler.disable()
+    query_profiler.reset()
+
+
+def test_transaction_statements_are_measured(connection, categorias, profiler) -> None:
+    repo = TransaccionRepository(connection)
+    transaccion = Transaccion(monto=10, fecha=date(2024, 3, 1), categoria_id=categorias["Ocio"].id_categoria)
+    repo.create(transaccion)
+    transaccion.monto = 12
+    repo.update(transaccion)
+    repo.delete(transaccion.id_transaccion)
+    ResumenMensualRepository(connection).rebuild()
+
+    statements = [stats.statement for stats in profiler.statements()]
+    for prefix in (
+        "INSERT INTO transaccion",
+        "UPDATE transaccion",
+        "DELETE FROM transaccion",
+        "INSERT INTO resumen_mensual",
+        "DELETE FROM resumen_mensual",
+        "UPDATE version_datos",
+    ):
+        assert any(statement.startswith(prefix) for statement in statements), prefix
+
+
+def test_call_site_points_at_the_repository_method(connection, categorias, profiler) -> None:
+    TransaccionRepository(connection).create(
+        Transaccion(monto=10, fecha=date(2024, 3, 1), categoria_id=categorias["Ocio"].id_categoria)
+    )
+    insert = next(stats for stats in profiler.statements() if stats.statement.startswith("INSERT INTO transaccion"))
+    assert insert.calls == 1
+    assert insert.rows == 1
+    # El punto de llamada salta la plomería (`_transaction`, el cursor medido) hasta `create`.
+    assert [site.split()[-1] for site in insert.call_sites] == ["(create)"]
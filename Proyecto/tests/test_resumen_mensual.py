@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Tuple
+
+from finanzas_app.models import Transaccion
+from finanzas_app.repositories import ResumenMensualRepository, TransaccionRepository
+
+
+def _rollup(connection) -> Dict[Tuple[int, int, int], Tuple[Decimal, int]]:
+    rows = TransaccionRepository(connection)._execute_read(
+        "SELECT anio, mes, Categoria_Id_Categoria AS categoria_id, total, conteo FROM resumen_mensual"
+    )
+    return {(row["anio"], row["mes"], row["categoria_id"]): (row["total"], row["conteo"]) for row in rows}
+
+
+def _expected(connection) -> Dict[Tuple[int, int, int], Tuple[float, int]]:
+    """El resumen calculado desde cero sobre `transaccion`."""
+    rows = TransaccionRepository(connection)._execute_read(
+        """
+        SELECT YEAR(fecha) AS anio, MONTH(fecha) AS mes, Categoria_Id_Categoria AS categoria_id,
+               SUM(monto) AS total, COUNT(*) AS conteo
+        FROM transaccion
+        WHERE fecha IS NOT NULL
+        GROUP BY YEAR(fecha), MONTH(fecha), Categoria_Id_Categoria
+        """
+    )
+    return {(row["anio"], row["mes"], row["categoria_id"]): (row["total"], row["conteo"]) for row in rows}
+
+
+def _assert_rollup_matches(connection) -> None:
+    rollup = _rollup(connection)
+    expected = _expected(connection)
+    assert rollup.keys() == expected.keys()
+    for key, (total, conteo) in expected.items():
+        # `total` es DECIMAL: coincide al centavo con la suma de los montos, sin error acumulado.
+        assert rollup[key][0] == Decimal(str(round(total, 2)))
+        assert rollup[key][1] == conteo
+
+
+def test_create_update_delete_keep_rollup_in_sync(connection, categorias) -> None:
+    supermercado = categorias["Supermercado"].id_categoria
+    ocio = categorias["Ocio"].id_categoria
+    repo = TransaccionRepository(connection)
+
+    primera = Transaccion(monto=10.10, fecha=date(2024, 3, 1), categoria_id=supermercado)
+    segunda = Transaccion(monto=0.20, fecha=date(2024, 3, 15), categoria_id=supermercado)
+    tercera = Transaccion(monto=30, fecha=date(2024, 4, 1), categoria_id=ocio)
+    for transaccion in (primera, segunda, tercera):
+        repo.create(transaccion)
+    _assert_rollup_matches(connection)
+    assert _rollup(connection)[(2024, 3, supermercado)][1] == 2
+
+    # Cambiar monto y mes mueve el aporte de una celda a otra.
+    segunda.monto = 5
+    segunda.fecha = date(2024, 4, 2)
+    repo.update(segunda)
+    _assert_rollup_matches(connection)
+
+    # La celda que queda sin transacciones desaparece del resumen.
+    repo.delete(primera.id_transaccion)
+    _assert_rollup_matches(connection)
+    assert (2024, 3, supermercado) not in _rollup(connection)
+
+
+def test_undated_transactions_stay_out_of_rollup(connection, categorias) -> None:
+    repo = TransaccionRepository(connection)
+    transaccion = Transaccion(monto=12, fecha=None, categoria_id=categorias["Ocio"].id_categoria)
+    repo.create(transaccion)
+    assert _rollup(connection) == {}
+
+    transaccion.fecha = date(2024, 6, 1)
+    repo.update(transaccion)
+    _assert_rollup_matches(connection)
+
+
+def test_create_many_adds_chunk_totals(connection, categorias) -> None:
+    supermercado = categorias["Supermercado"].id_categoria
+    ocio = categorias["Ocio"].id_categoria
+    transacciones = [
+        Transaccion(monto=1.5 * dia, fecha=date(2024, 1 + dia % 3, dia), categoria_id=(supermercado, ocio)[dia % 2])
+        for dia in range(1, 29)
+    ]
+
+    assert TransaccionRepository(connection).create_many(transacciones, chunk_size=5) == len(transacciones)
+    _assert_rollup_matches(connection)
+
+
+def test_rebuild_matches_incremental_rollup(connection, categorias) -> None:
+    repo = TransaccionRepository(connection)
+    supermercado = categorias["Supermercado"].id_categoria
+    for dia in range(1, 11):
+        repo.create(Transaccion(monto=dia, fecha=date(2023 + dia % 2, 5, dia), categoria_id=supermercado))
+    incremental = _rollup(connection)
+
+    ResumenMensualRepository(connection).rebuild(2024)
+    assert _rollup(connection) == incremental
+    ResumenMensualRepository(connection).rebuild()
+    assert _rollup(connection) == incremental
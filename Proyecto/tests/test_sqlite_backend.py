@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from finanzas_app.db import sqlite_backend
+from finanzas_app.db.sqlite_backend import translate
+
+
+def test_translate_placeholders() -> None:
+    assert translate("SELECT * FROM t WHERE a = %s AND b = %s") == ("SELECT * FROM t WHERE a = ? AND b = ?", False)
+    assert translate("SELECT * FROM t WHERE a = %(anio)s") == ("SELECT * FROM t WHERE a = :anio", False)
+
+
+def test_translate_upsert() -> None:
+    query, _ = translate(
+        "INSERT INTO r (k, total) VALUES (%s, %s) ON DUPLICATE KEY UPDATE total = total + VALUES(total)"
+    )
+    assert query == "INSERT INTO r (k, total) VALUES (?, ?) ON CONFLICT DO UPDATE SET total = total + excluded.total"
+
+
+def test_translate_for_update_is_removed_and_reported() -> None:
+    query, locking = translate("SELECT monto FROM transaccion WHERE Id_Transaccion = %s FOR UPDATE")
+    assert locking
+    assert "FOR UPDATE" not in query.upper()
+
+
+def test_translate_date_alias_requests_date_objects() -> None:
+    query, _ = translate("SELECT DATE(t.fecha) AS dia FROM transaccion t")
+    assert query == 'SELECT DATE(t.fecha) AS "dia [date]" FROM transaccion t'
+
+
+@pytest.fixture
+def conn(tmp_path):
+    path = str(tmp_path / "backend.db")
+    sqlite_backend.create_schema(path)
+    conn = sqlite_backend.connect(path)
+    yield conn
+    conn.close()
+
+
+def _scalar(conn, query: str, params=()):
+    with conn.cursor() as cursor:
+        cursor.execute(query, params)
+        return cursor.fetchone()[0]
+
+
+def test_upsert_accumulates_on_conflict(conn) -> None:
+    query = """
+        INSERT INTO resumen_mensual (anio, mes, Categoria_Id_Categoria, total, conteo)
+        VALUES (%s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE total = total + VALUES(total), conteo = conteo + VALUES(conteo)
+    """
+    with conn.cursor() as cursor:
+        cursor.executemany(query, [(2024, 3, 1, 10.5, 1), (2024, 3, 1, 4.5, 1)])
+    conn.commit()
+    assert _scalar(conn, "SELECT total FROM resumen_mensual") == Decimal("15")
+    assert _scalar(conn, "SELECT conteo FROM resumen_mensual") == 2
+
+
+def test_rollup_total_is_read_as_decimal(conn) -> None:
+    query = """
+        INSERT INTO resumen_mensual (anio, mes, Categoria_Id_Categoria, total, conteo)
+        VALUES (%s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE total = total + VALUES(total), conteo = conteo + VALUES(conteo)
+    """
+    with conn.cursor() as cursor:
+        cursor.executemany(query, [(2024, 3, 1, Decimal("0.10"), 1), (2024, 3, 1, Decimal("0.20"), 1)])
+    conn.commit()
+    assert _scalar(conn, "SELECT total FROM resumen_mensual") == Decimal("0.3")
+
+
+def test_schema_marks_mysql_migrations_as_applied(conn) -> None:
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT nombre FROM schema_migracion")
+        applied = {row[0] for row in cursor.fetchall()}
+    migrations = Path(sqlite_backend.__file__).parent / "migraciones"
+    assert applied == {path.name for path in migrations.glob("*.sql")}
+
+
+def test_for_update_opens_write_transaction(conn) -> None:
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM transaccion FOR UPDATE")
+    assert conn.in_transaction
+    conn.rollback()
+
+
+def test_multi_row_insert_reports_first_id(conn) -> None:
+    with conn.cursor() as cursor:
+        cursor.execute("INSERT INTO categoria (nombre, periodicidad, tipo) VALUES (%s, 'mensual', 'gasto')", ("A",))
+        cursor.execute(
+            "INSERT INTO categoria (nombre, periodicidad, tipo) VALUES (%s, 'mensual', 'gasto'), (%s, 'mensual', 'gasto')",
+            ("B", "C"),
+        )
+        assert cursor.lastrowid == 2
+    conn.commit()
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("SELECT YEAR('2024-03-05')", 2024),
+        ("SELECT MONTH('2024-03-05 10:00:00')", 3),
+        # 2024-06-02 es domingo.
+        ("SELECT DAYOFWEEK('2024-06-02')", 1),
+        ("SELECT DAYOFWEEK('2024-06-08')", 7),
+        # 2024 empieza en lunes: el 1 de enero está en la semana 1 y el 7 también.
+        ("SELECT WEEK('2024-01-07', 1)", 1),
+        ("SELECT WEEK('2024-01-08', 1)", 2),
+        # 2027 empieza en viernes: sus primeros días quedan en la semana 0.
+        ("SELECT WEEK('2027-01-01', 1)", 0),
+        ("SELECT YEAR(NULL)", None),
+    ],
+)
+def test_mysql_functions(conn, query: str, expected) -> None:
+    assert _scalar(conn, query) == expected
+
+
+@pytest.mark.parametrize(("fmt", "expected"), [("%Y-%m", "2024-03"), ("%e/%c", "5/3"), ("%d/%m/%y", "05/03/24")])
+def test_date_format(conn, fmt: str, expected: str) -> None:
+    assert _scalar(conn, "SELECT DATE_FORMAT('2024-03-05', %s)", (fmt,)) == expected
+
+
+def test_week_rejects_unsupported_mode(conn) -> None:
+    # SQLite envuelve el ValueError de la función en un OperationalError.
+    with pytest.raises(sqlite3.OperationalError):
+        _scalar(conn, "SELECT WEEK('2024-01-08', 0)")
+
+
+def test_date_columns_come_back_as_dates(conn) -> None:
+    with conn.cursor(dictionary=True) as cursor:
+        cursor.execute("SELECT DATE('2024-03-05 10:00:00') AS dia")
+        assert cursor.fetchone() == {"dia": date(2024, 3, 5)}